@@ -18,6 +18,61 @@ class Settings(BaseSettings):
     pl_ner_model_name: str = Field(default="radlab/pii-pl-v1.0", description="PL NER model name")
     pl_ner_chunk_tokens: int = Field(default=384, description="Max tokens per NER inference window (smaller = cheaper attention per chunk)")
     pl_ner_chunk_stride: int = Field(default=64, description="Token overlap between NER inference windows, to avoid splitting entities at chunk boundaries")
+    pl_ner_engine: str = Field(default="torch", description="NER inference runtime: torch (transformers/PyTorch) or onnx (onnxruntime, requires the 'onnx' extra)")
+    pl_ner_onnx_cache_dir: str = Field(default="models/onnx", description="Directory where the one-off ONNX export of the NER model is cached")
+    pl_ner_quantization: str = Field(default="none", description="NER weight precision: none (fp32) or int8 (dynamic quantization, torch engine on CPU only)")
+    pl_ner_int8_cascade: bool = Field(default=False, description="With int8 quantization, re-detect spans the int8 model scores below pl_ner_int8_cascade_threshold using the fp32 model, on just the windows around them (keeps an fp32 copy in memory)")
+    pl_ner_int8_cascade_threshold: float = Field(default=0.9, description="int8 entity score below which the surrounding window is rescored by the fp32 model")
+    pl_ner_int8_cascade_context_chars: int = Field(default=100, description="Characters of context on each side of an uncertain span included in its fp32 rescoring window")
+    pl_ner_server_socket: Optional[str] = Field(default=None, description="Unix socket of a standalone NER inference server (python -m infrastructure.ner_server.server). When set, workers send NER requests there instead of loading the model themselves")
+    pl_ner_server_timeout_seconds: float = Field(default=30.0, description="Socket timeout for a single request to the NER inference server")
+    pl_ner_batching_enabled: bool = Field(default=False, description="Coalesce concurrent NER calls from all requests into batched forward passes, trading up to pl_ner_batch_wait_ms of added latency for higher throughput per core")
+    pl_ner_max_batch_size: int = Field(default=16, description="Max texts per batched NER forward pass")
+    pl_ner_batch_wait_ms: float = Field(default=5.0, description="Max time the first text in a batch waits for others to join before the batch is dispatched")
+    pl_ner_max_queue_depth: int = Field(default=256, description="Max texts waiting for a NER batch; further callers block until the queue drains")
+    pl_ner_segment_long_texts: bool = Field(default=False, description="Cut texts longer than pl_ner_segment_min_chars into overlapping sentence-aligned segments of about pl_ner_chunk_tokens and run them as one batch (or across pl_ner_segment_workers threads) instead of one window after another")
+    pl_ner_segment_min_chars: int = Field(default=4000, description="Texts longer than this are segmented when pl_ner_segment_long_texts is on")
+    pl_ner_segment_workers: int = Field(default=1, description="Threads running a long text's segment batches concurrently; 1 runs all segments as one batch")
+    pl_ner_gating_enabled: bool = Field(default=False, description="Classify each text's lines before NER and run the model only on those that may hold a name, skipping segments of the classes in pl_ner_gate_skip_classes")
+    pl_ner_gate_skip_classes: List[str] = Field(default_factory=lambda: ["code", "structured", "blob", "lowercase"], description="Segment classes NER gating skips: code (fenced blocks), structured (JSON/markup/table rows or mostly digits and symbols, with no capitalized word), blob (URLs, base64/hashes), lowercase (no capitalized word), sentence_case (capitalized only at sentence starts, which may be a name)")
+    gazetteer_path: str = Field(default="models/gazetteer.bin", description="Compiled, memory-mapped gazetteer of Polish first names, surnames and places; compiled from the bundled lists on first use if missing (custom lists: python -m infrastructure.detectors.gazetteer.build)")
+    gazetteer_first_tier: bool = Field(default=False, description="Use the gazetteer detector as the first tier of name detection: it runs on every text, and NER skips lines capitalized only at sentence starts (the sentence_case gating class), whose names only the gazetteer then finds")
+    gazetteer_in_stream_guard: bool = Field(default=False, description="Include the gazetteer detector in the streaming hallucination guard, so hallucinated listed names are scrubbed word by word")
+    deny_list_path: Optional[str] = Field(default=None, description="Compiled deny-list automaton (python -m infrastructure.detectors.deny_list.build) whose terms are always anonymized; unset disables it")
+    deny_list_reload_seconds: float = Field(default=5.0, description="How often each worker checks the deny-list file for a rebuilt version to swap in")
+    combined_fast_detector: bool = Field(default=True, description="Run the regex/checksum detectors (email, bank account, PESEL, phone, date, NIP, REGON) as one combined scanner instead of one full pass each; same results")
+    fast_detector_batch_threshold: int = Field(default=32, description="Candidates of one identifier pattern in a text (PESEL, NIP, REGON, NRB) from which the combined scanner validates their checksums together, vectorised with NumPy")
+    phone_memo_max_entries: int = Field(default=4096, description="Phone candidates whose validity is remembered (by normalized number) so repeated numbers skip phonenumbers parsing; 0 disables")
+    detector_fan_out: str = Field(default="off", description="Run the detectors of one text concurrently: 'off' (one after another), 'thread' (regex/checksum detectors on threads alongside NER) or 'process' (regex/checksum detectors in worker processes)")
+    detector_fan_out_workers: int = Field(default=4, description="Worker processes running the regex/checksum detectors for DETECTOR_FAN_OUT=process (the threads are the fast pool's)")
+    detection_cache_enabled: bool = Field(default=True, description="Cache detection results (span offsets and types only) for text seen before, e.g. earlier conversation turns")
+    detection_cache_backend: str = Field(default="memory", description="Detection cache storage: 'memory' (per worker), 'sqlite' (per host) or 'redis' (shared by a fleet)")
+    detection_cache_max_entries: int = Field(default=10000, description="Max cached texts (memory/sqlite); least recently used / closest to expiry are evicted first")
+    detection_cache_ttl_seconds: float = Field(default=3600.0, description="Max age of a cached detection result")
+    detection_cache_key_secret: Optional[str] = Field(default=None, description="HMAC secret for detection cache keys; required for the sqlite and redis backends")
+    detection_cache_sqlite_path: str = Field(default="cache/detections.sqlite3", description="SQLite file for the sqlite detection cache backend")
+    detection_cache_redis_url: str = Field(default="redis://localhost:6379/0", description="Redis-protocol server for the redis detection cache backend")
+    detection_cache_redis_timeout_ms: float = Field(default=100.0, description="Redis lookup timeout; a slower lookup counts as a miss")
+    placeholder_numbering: str = Field(default="sequential", description="Placeholder numbering: 'sequential' (<PERSON1>, <PERSON2>, ...) or 'stable' (number derived from a keyed hash of the value, so earlier messages anonymize identically every turn and provider prompt caches hit)")
+    placeholder_numbering_secret: Optional[str] = Field(default=None, description="HMAC key for stable numbering; set the same value on every worker so their prompts match")
+    placeholder_numbering_digits: int = Field(default=4, description="Max digits of a stable placeholder number")
+    placeholder_numbering_scope: str = Field(default="conversation", description="Where stable numbers match: 'conversation' (per client and conversation_id; per client for a request without one), 'client' (across a client's conversations) or 'global' (across all clients, so the LLM provider can link values between them)")
+    placeholder_format: str = Field(default="angle", description="Placeholder syntax: angle (<PERSON1>), angle_short (<PER1>), square ([PERSON1]), square_short ([PER1]) or brace_short ({PER1}); compare their token cost with tests/eval/placeholder_token_cost.py")
+    placeholder_format_by_model: Dict[str, str] = Field(default_factory=dict, description="Per-model override of placeholder_format, keyed by the exact resolved model string")
+    omit_system_prompt_without_placeholders: bool = Field(default=False, description="Send no gateway system prompt when a request's messages contain no placeholders")
+    conversation_session_ttl_seconds: float = Field(default=3600.0, description="Idle time after which a conversation_id session is dropped and the conversation starts over")
+    conversation_session_max_sessions: int = Field(default=10000, description="Max live conversation sessions per worker; least recently used are evicted first")
+    ner_pool_workers: int = Field(default=2, description="Threads running detection with NER (anonymization, response redaction) for chat and text requests")
+    ner_pool_max_queue: int = Field(default=32, description="Max detection tasks waiting for a NER pool thread; further requests are rejected with 503")
+    ner_pool_max_wait_seconds: float = Field(default=10.0, description="Expected NER pool queue wait above which requests are rejected with 503 and Retry-After instead of queueing")
+    fast_pool_workers: int = Field(default=4, description="Threads running the streaming hallucination guard, and the regex/checksum detectors beside NER with DETECTOR_FAN_OUT on")
+    fast_pool_max_queue: int = Field(default=256, description="Max tasks waiting for a fast pool thread")
+    fast_pool_max_wait_seconds: float = Field(default=2.0, description="Expected fast pool queue wait above which a streaming request is rejected with 503 before its first chunk")
+    document_pool_workers: int = Field(default=1, description="Threads processing uploaded documents, kept apart from the NER pool so uploads can't starve chats")
+    document_pool_max_queue: int = Field(default=4, description="Max documents waiting for a document pool thread")
+    document_pool_max_wait_seconds: float = Field(default=60.0, description="Expected document pool queue wait above which uploads are rejected with 503")
+    client_weights: Dict[str, float] = Field(default_factory=dict, description="Fair-queuing weight per client name (see api_keys) within a priority class of the workload pools: a client of weight 2 gets twice the share of one of weight 1 while both have work queued; default 1")
+    pl_ner_torch_threads: Optional[int] = Field(default=None, description="torch intra-op threads per NER forward pass; default: the cores divided by ner_pool_workers, so concurrent passes don't oversubscribe them")
     debug: bool = Field(default=False, description="Debug mode")
     log_file: str = Field(default="logs/app.log", description="Path to log file")
     max_upload_size: int = Field(default=10 * 1024 * 1024, description="Max upload size in bytes (default 10MB)")
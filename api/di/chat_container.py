@@ -7,33 +7,152 @@ from api.di.detector_container import (
     get_date_detector,
     get_nip_detector,
     get_regon_detector,
+    get_fast_detector,
+    get_gazetteer_detector,
+    get_deny_list_detector,
 )
-from infrastructure.detectors.phone_detector import PhoneDetector
+from infrastructure.detectors.phone_detector import PhoneDetector, PhoneNumberValidator
 from infrastructure.detectors.email_detector import EmailDetector
 from infrastructure.detectors.pesel_detector import PeselDetector
 from infrastructure.detectors.bank_account_detector import BankAccountDetector
 from infrastructure.detectors.date_detector import DateDetector
 from infrastructure.detectors.nip_detector import NipDetector
 from infrastructure.detectors.regon_detector import RegonDetector
+from infrastructure.detectors.fast_detector import FastDetector
+from infrastructure.detectors.gazetteer import GazetteerDetector
 from infrastructure.detectors.pii_pl import PiiPlDetector
-from functools import lru_cache
-from typing import List
+from infrastructure.detectors.remote_ner_detector import RemoteNerDetector
+from infrastructure.detectors.process_pool_detector import ProcessPoolDetector
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, List, Optional, Tuple, Union
 from fastapi import Depends
 from infrastructure.factories.llm_factory import create_llm_provider
+from infrastructure.factories.cache_factory import create_detection_cache
+from api.config.config import settings
+from application.services.conversation_session_store import ConversationSessionStore
+from domain.entities.placeholder_format import get_placeholder_format
+from domain.enums.pii_type import PIIType
 from domain.services.anonymizer_service import AnonymizerService
+from domain.services.detection_cache import DetectionCache
+from domain.services.detector_timings import DetectorTimings
+from domain.services.placeholder_numbering import SequentialNumbering, StableNumbering
+from domain.services.workload_pool import WorkloadPool
 from domain.interfaces.pii_detector import PIIDetector
 from application.use_cases.chat_use_case import ChatUseCase
 from application.use_cases.anonymize_use_case import AnonymizeUseCase
 from application.use_cases.stream_chat_use_case import StreamChatUseCase
 from domain.interfaces.llm_provider import LLMProvider
 
+logger = logging.getLogger(__name__)
+
 
 @lru_cache
 def get_llm_provider() -> LLMProvider:
     return create_llm_provider()
 
+@lru_cache
+def get_detection_cache() -> Optional[DetectionCache]:
+    return create_detection_cache()
+
+@lru_cache
+def get_placeholder_numbering() -> Union[SequentialNumbering, StableNumbering]:
+    mode = settings.placeholder_numbering.lower()
+    if mode == "sequential":
+        return SequentialNumbering()
+    if mode == "stable":
+        if settings.placeholder_numbering_secret:
+            key = settings.placeholder_numbering_secret.encode("utf-8")
+        else:
+            logger.warning(
+                "PLACEHOLDER_NUMBERING_SECRET is not set: stable placeholder numbers will differ between workers"
+            )
+            key = os.urandom(32)
+        return StableNumbering(key, settings.placeholder_numbering_digits)
+    raise ValueError(f"Unknown placeholder numbering: {mode}")
+
+@lru_cache
+def get_detector_timings() -> DetectorTimings:
+    return DetectorTimings()
+
+@lru_cache
+def get_ner_pool() -> WorkloadPool:
+    return WorkloadPool(
+        "ner",
+        settings.ner_pool_workers,
+        settings.ner_pool_max_queue,
+        settings.ner_pool_max_wait_seconds,
+        settings.client_weights,
+    )
+
+@lru_cache
+def get_fast_pool() -> WorkloadPool:
+    return WorkloadPool(
+        "fast",
+        settings.fast_pool_workers,
+        settings.fast_pool_max_queue,
+        settings.fast_pool_max_wait_seconds,
+        settings.client_weights,
+    )
+
+@lru_cache
+def get_detector_executor() -> Optional[WorkloadPool]:
+    mode = settings.detector_fan_out.lower()
+    if mode == "off":
+        return None
+    if mode in ("thread", "process"):
+        # The regex/checksum detectors (or, for 'process', the waits on
+        # their worker processes) run on the fast pool, under its scheduler.
+        return get_fast_pool()
+    raise ValueError(f"Unknown detector fan-out: {mode}")
+
+@lru_cache
+def get_detector_process_pool() -> Optional[ProcessPoolExecutor]:
+    if settings.detector_fan_out.lower() != "process":
+        return None
+    # Spawned, not forked: the parent has executor threads (and torch's).
+    return ProcessPoolExecutor(settings.detector_fan_out_workers, mp_context=multiprocessing.get_context("spawn"))
+
+def _build_fast_detector(types: Tuple[PIIType, ...], batch_threshold: int, phone_memo_max_entries: int) -> FastDetector:
+    return FastDetector(types, batch_threshold, PhoneNumberValidator(phone_memo_max_entries))
+
+def _build_phone_detector(phone_memo_max_entries: int) -> PhoneDetector:
+    return PhoneDetector(PhoneNumberValidator(phone_memo_max_entries))
+
+def _process_factory(detector: PIIDetector) -> Callable[[], PIIDetector]:
+    """
+    Rebuilds ``detector`` with the same configuration in a worker process,
+    phone memo size included (each worker has its own validator).
+    """
+    if isinstance(detector, FastDetector):
+        return partial(
+            _build_fast_detector, detector.types, detector.batch_threshold, detector.phone_validator.max_entries
+        )
+    if isinstance(detector, PhoneDetector):
+        return partial(_build_phone_detector, detector.validator.max_entries)
+    return type(detector)
+
+@lru_cache
+def get_process_pool_detector(detector: PIIDetector) -> ProcessPoolDetector:
+    """
+    ``detector`` (one of the cached detector singletons) run in the
+    detector process pool, wrapped once: the wrapper keeps ``detector`` as
+    its local instance instead of building another.
+    """
+    return ProcessPoolDetector(_process_factory(detector), get_detector_process_pool(), detector)
+
+@lru_cache
+def get_conversation_session_store() -> ConversationSessionStore:
+    return ConversationSessionStore(
+        settings.conversation_session_ttl_seconds,
+        settings.conversation_session_max_sessions,
+    )
+
 def get_anonymizer_service(
-    pii_pl_detector: PiiPlDetector = Depends(get_pii_pl_detector),
+    pii_pl_detector: PIIDetector = Depends(get_pii_pl_detector),
     email_detector: EmailDetector = Depends(get_email_detector),
     bank_account_detector: BankAccountDetector = Depends(get_bank_account_detector),
     pesel_detector: PeselDetector = Depends(get_pesel_detector),
@@ -41,23 +160,51 @@ def get_anonymizer_service(
     date_detector: DateDetector = Depends(get_date_detector),
     nip_detector: NipDetector = Depends(get_nip_detector),
     regon_detector: RegonDetector = Depends(get_regon_detector),
+    fast_detector: FastDetector = Depends(get_fast_detector),
+    cache: Optional[DetectionCache] = Depends(get_detection_cache),
+    numbering: Union[SequentialNumbering, StableNumbering] = Depends(get_placeholder_numbering),
+    executor: Optional[WorkloadPool] = Depends(get_detector_executor),
+    process_pool: Optional[ProcessPoolExecutor] = Depends(get_detector_process_pool),
+    timings: DetectorTimings = Depends(get_detector_timings),
+    ner_pool: WorkloadPool = Depends(get_ner_pool),
 ) -> AnonymizerService:
-    detectors: List[PIIDetector] = [
-        pii_pl_detector,
-        email_detector,
-        bank_account_detector,
-        pesel_detector,
-        phone_detector,
-        date_detector,
-        nip_detector,
-        regon_detector,
-    ]
-    return AnonymizerService(detectors)
-
-_SLOW_DETECTOR_TYPES = (PiiPlDetector, DateDetector)
+    detectors: List[PIIDetector]
+    if settings.combined_fast_detector:
+        detectors = [pii_pl_detector, fast_detector]
+    else:
+        detectors = [
+            pii_pl_detector,
+            email_detector,
+            bank_account_detector,
+            pesel_detector,
+            phone_detector,
+            date_detector,
+            nip_detector,
+            regon_detector,
+        ]
+    if settings.gazetteer_first_tier:
+        # The NER detector leaves sentence-case lines to it (see PiiPlDetector).
+        detectors.append(get_gazetteer_detector())
+    if settings.deny_list_path:
+        detectors.append(get_deny_list_detector())
+    if process_pool is not None:
+        # NER stays in this process; the pure-Python detectors move out.
+        detectors = detectors[:1] + [get_process_pool_detector(d) for d in detectors[1:]]
+    return AnonymizerService(
+        detectors,
+        cache,
+        numbering,
+        get_placeholder_format(settings.placeholder_format),
+        executor,
+        timings,
+        ner_pool,
+    )
+
+_SLOW_DETECTOR_TYPES = (PiiPlDetector, RemoteNerDetector, DateDetector)
 
 def get_hallucination_guard(
     anonymizer: AnonymizerService = Depends(get_anonymizer_service),
+    fast_pool: WorkloadPool = Depends(get_fast_pool),
 ) -> AnonymizerService:
     """
     Scoped to fast, checksum-validated detectors only (no NER), to scrub
@@ -66,25 +213,41 @@ def get_hallucination_guard(
 
     Derived from the full detector set rather than re-wired independently,
     so the "fast" subset can never drift from the detectors actually used
-    for anonymization.
+    for anonymization. Dates are left out of the combined detector too.
+    The gazetteer detector is the one name detector fast enough to run per
+    word: included when GAZETTEER_IN_STREAM_GUARD is set. Its scans run
+    on the fast pool.
     """
-    fast_detectors: List[PIIDetector] = [
-        d for d in anonymizer.detectors if not isinstance(d, _SLOW_DETECTOR_TYPES)
-    ]
-    return AnonymizerService(fast_detectors)
+    fast_detectors: List[PIIDetector] = []
+    for d in anonymizer.detectors:
+        if isinstance(d, ProcessPoolDetector):
+            d = d.detector
+        if isinstance(d, FastDetector):
+            fast_detectors.append(d.without(PIIType.DATE))
+        elif not isinstance(d, _SLOW_DETECTOR_TYPES + (GazetteerDetector,)):
+            fast_detectors.append(d)
+    if settings.gazetteer_in_stream_guard:
+        fast_detectors.append(get_gazetteer_detector())
+    return AnonymizerService(
+        fast_detectors,
+        placeholder_format=anonymizer.placeholder_format,
+        pool=fast_pool,
+    )
 
 def get_chat_use_case(
     anonymizer: AnonymizerService = Depends(get_anonymizer_service),
     llm: LLMProvider = Depends(get_llm_provider),
+    sessions: ConversationSessionStore = Depends(get_conversation_session_store),
 ) -> ChatUseCase:
-    return ChatUseCase(anonymizer, llm)
+    return ChatUseCase(anonymizer, llm, sessions)
 
 def get_stream_chat_use_case(
     anonymizer: AnonymizerService = Depends(get_anonymizer_service),
     llm: LLMProvider = Depends(get_llm_provider),
     hallucination_guard: AnonymizerService = Depends(get_hallucination_guard),
+    sessions: ConversationSessionStore = Depends(get_conversation_session_store),
 ) -> StreamChatUseCase:
-    return StreamChatUseCase(anonymizer, llm, hallucination_guard)
+    return StreamChatUseCase(anonymizer, llm, hallucination_guard, sessions)
 
 def get_anonymize_use_case(
     anonymizer: AnonymizerService = Depends(get_anonymizer_service),
@@ -1,24 +1,36 @@
 from functools import lru_cache
+from api.config.config import settings
+from domain.interfaces.pii_detector import PIIDetector
 from infrastructure.detectors.pii_pl import PiiPlDetector
+from infrastructure.detectors.remote_ner_detector import RemoteNerDetector
 from infrastructure.detectors.email_detector import EmailDetector
-from infrastructure.detectors.phone_detector import PhoneDetector
+from infrastructure.detectors.phone_detector import PhoneDetector, PhoneNumberValidator
 from infrastructure.detectors.pesel_detector import PeselDetector
 from infrastructure.detectors.bank_account_detector import BankAccountDetector
 from infrastructure.detectors.date_detector import DateDetector
 from infrastructure.detectors.nip_detector import NipDetector
 from infrastructure.detectors.regon_detector import RegonDetector
+from infrastructure.detectors.fast_detector import FastDetector
+from infrastructure.detectors.gazetteer import GazetteerDetector
+from infrastructure.detectors.deny_list import DenyListDetector
 
 @lru_cache
-def get_pii_pl_detector() -> PiiPlDetector:
+def get_pii_pl_detector() -> PIIDetector:
+    if settings.pl_ner_server_socket:
+        return RemoteNerDetector(settings.pl_ner_server_socket, settings.pl_ner_server_timeout_seconds)
     return PiiPlDetector()
 
 @lru_cache
 def get_email_detector() -> EmailDetector:
     return EmailDetector()
 
+@lru_cache
+def get_phone_number_validator() -> PhoneNumberValidator:
+    return PhoneNumberValidator(settings.phone_memo_max_entries)
+
 @lru_cache
 def get_phone_detector() -> PhoneDetector:
-    return PhoneDetector()
+    return PhoneDetector(get_phone_number_validator())
 
 @lru_cache
 def get_pesel_detector() -> PeselDetector:
@@ -39,3 +51,18 @@ def get_nip_detector() -> NipDetector:
 @lru_cache
 def get_regon_detector() -> RegonDetector:
     return RegonDetector()
+
+@lru_cache
+def get_fast_detector() -> FastDetector:
+    return FastDetector(
+        batch_threshold=settings.fast_detector_batch_threshold,
+        phone_validator=get_phone_number_validator(),
+    )
+
+@lru_cache
+def get_gazetteer_detector() -> GazetteerDetector:
+    return GazetteerDetector()
+
+@lru_cache
+def get_deny_list_detector() -> DenyListDetector:
+    return DenyListDetector()
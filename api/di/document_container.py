@@ -1,5 +1,8 @@
+from functools import lru_cache
 from fastapi import Depends
+from api.config.config import settings
 from domain.services.anonymizer_service import AnonymizerService
+from domain.services.workload_pool import WorkloadPool
 from domain.interfaces.document_processor_factory import DocumentProcessorFactory
 from infrastructure.factories.processor_factory import DocumentProcessorFactory as ConcreteDocumentProcessorFactory
 from application.use_cases.anonymize_document_use_case import AnonymizeDocumentUseCase
@@ -8,8 +11,19 @@ from api.di.chat_container import get_anonymizer_service
 def get_document_processor_factory() -> DocumentProcessorFactory:
     return ConcreteDocumentProcessorFactory()
 
+@lru_cache
+def get_document_pool() -> WorkloadPool:
+    return WorkloadPool(
+        "document",
+        settings.document_pool_workers,
+        settings.document_pool_max_queue,
+        settings.document_pool_max_wait_seconds,
+        settings.client_weights,
+    )
+
 def get_anonymize_document_use_case(
     anonymizer: AnonymizerService = Depends(get_anonymizer_service),
-    factory: DocumentProcessorFactory = Depends(get_document_processor_factory)
+    factory: DocumentProcessorFactory = Depends(get_document_processor_factory),
+    pool: WorkloadPool = Depends(get_document_pool),
 ) -> AnonymizeDocumentUseCase:
-    return AnonymizeDocumentUseCase(anonymizer, factory)
+    return AnonymizeDocumentUseCase(anonymizer, factory, pool)
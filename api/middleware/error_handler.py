@@ -8,6 +8,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.exceptions import RequestValidationError
 from api.config.config import settings
 from domain.exceptions.llm_provider_error import LLMProviderError
+from domain.exceptions.workload_overloaded_error import WorkloadOverloadedError
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class GlobalErrorHandlerMiddleware(BaseHTTPMiddleware):
 
     async def _handle_exception(self, request: Request, e: Exception) -> JSONResponse:
         error_details = None
+        headers = None
         status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         message = "Internal Server Error"
         known = True
@@ -34,6 +36,10 @@ class GlobalErrorHandlerMiddleware(BaseHTTPMiddleware):
         elif isinstance(e, LLMProviderError):
             status_code = e.status_code
             message = e.message
+        elif isinstance(e, WorkloadOverloadedError):
+            status_code = e.status_code
+            message = e.message
+            headers = {"Retry-After": str(e.retry_after_seconds)}
         else:
             known = False
             logger.error(
@@ -52,6 +58,7 @@ class GlobalErrorHandlerMiddleware(BaseHTTPMiddleware):
         return JSONResponse(
             status_code=status_code,
             content=self._build_error_response(status_code, message, error_details),
+            headers=headers,
         )
 
     def _build_error_response(
@@ -0,0 +1,155 @@
+"""
+Fork-after-load serving: the master process loads and warms up the NER
+model once, freezes its heap, and only then forks the uvicorn workers, so
+the model weights are shared copy-on-write instead of loaded N times.
+
+    uv run python main.py --preload --workers 4
+
+This is the in-process alternative to the standalone NER server
+(``PL_NER_SERVER_SOCKET``): no extra hop per request, but every worker
+still runs its own forward passes.
+"""
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Set
+
+import uvicorn
+from fastapi import FastAPI
+
+from api.config.config import settings
+from api.di import detector_container
+
+logger = logging.getLogger(__name__)
+
+_WARMUP_TEXT = "Jan Kowalski mieszka w Warszawie, tel. 600 123 456, PESEL 44051401359."
+
+_RESPAWN_BACKOFF_SECONDS = 1.0
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload_detectors() -> None:
+    """
+    Builds every cached detector in this process and runs one warm-up
+    detection through each, then moves everything allocated so far into
+    the permanent GC generation so the collector never touches (and so
+    never copies) those pages in the forked workers.
+
+    The warm-up runs with a single torch thread: an OpenMP pool started
+    before ``fork`` is not usable in the children, so the pool is only
+    created by each worker's first real request.
+
+    Raises:
+        ValueError: If NER runs in the standalone server, where there is
+            no model in this process to share.
+    """
+    if settings.pl_ner_server_socket:
+        raise ValueError("Preloading has no effect with PL_NER_SERVER_SOCKET set; the model lives in the NER server")
+
+    getters = [
+        getattr(detector_container, name)
+        for name in dir(detector_container)
+        if name.startswith("get_") and name.endswith("_detector")
+    ]
+
+    started = time.perf_counter()
+    detectors = [getter() for getter in getters]
+
+    torch = sys.modules.get("torch")
+    torch_threads = torch.get_num_threads() if torch is not None else None
+    if torch is not None:
+        torch.set_num_threads(1)
+    try:
+        for detector in detectors:
+            detector.detect(_WARMUP_TEXT)
+    finally:
+        if torch is not None:
+            torch.set_num_threads(torch_threads)
+
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        f"Preloaded {len(getters)} detector(s) in {time.perf_counter() - started:.1f}s; "
+        f"{gc.get_freeze_count()} objects frozen"
+    )
+
+
+def _run_worker(app: FastAPI, sock: socket.socket, host: str, port: int) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    config = uvicorn.Config(app, host=host, port=port, log_config=None)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _spawn(app: FastAPI, sock: socket.socket, host: str, port: int) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _run_worker(app, sock, host, port)
+        except BaseException:
+            logger.exception("Preloaded worker crashed")
+            code = 1
+        finally:
+            os._exit(code)
+    logger.info(f"Started preloaded worker [{pid}]")
+    return pid
+
+
+def serve_preloaded(app: FastAPI, host: str, port: int, workers: int) -> None:
+    """
+    Binds the listening socket, preloads the detectors, forks ``workers``
+    uvicorn workers sharing that socket, and supervises them: a worker that
+    dies is replaced, and SIGTERM/SIGINT is forwarded to all of them.
+    """
+    sock = _bind_socket(host, port)
+    preload_detectors()
+
+    children: Set[int] = set()
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(max(1, workers)):
+        children.add(_spawn(app, sock, host, port))
+    logger.info(f"Serving on http://{host}:{port} with {len(children)} preloaded worker(s)")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.discard(pid)
+        if stopping:
+            continue
+        logger.warning(f"Preloaded worker [{pid}] exited with status {os.waitstatus_to_exitcode(status)}; respawning")
+        time.sleep(_RESPAWN_BACKOFF_SECONDS)
+        children.add(_spawn(app, sock, host, port))
+
+    sock.close()
@@ -1,4 +1,5 @@
 import logging
+from typing import AsyncIterator, Optional
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
 from fastapi.responses import StreamingResponse
 from api.config.auth import verify_api_key
@@ -10,21 +11,40 @@ from application.use_cases.chat_use_case import ChatUseCase
 from application.use_cases.anonymize_use_case import AnonymizeUseCase
 from application.use_cases.anonymize_document_use_case import AnonymizeDocumentUseCase
 from application.use_cases.stream_chat_use_case import StreamChatUseCase
-from api.di.chat_container import get_chat_use_case, get_anonymize_use_case, get_stream_chat_use_case
-from api.di.document_container import get_anonymize_document_use_case
+from api.di.chat_container import (
+    get_chat_use_case,
+    get_anonymize_use_case,
+    get_stream_chat_use_case,
+    get_detection_cache,
+    get_conversation_session_store,
+    get_detector_timings,
+    get_ner_pool,
+    get_fast_pool,
+)
+from application.services.conversation_session_store import ConversationSessionStore
+from api.di.document_container import get_anonymize_document_use_case, get_document_pool
+from api.di.detector_container import get_deny_list_detector, get_pii_pl_detector, get_phone_number_validator
+from domain.interfaces.pii_detector import PIIDetector
+from infrastructure.detectors.deny_list import DenyListDetector
+from infrastructure.detectors.phone_detector import PhoneNumberValidator
+from domain.services.detection_cache import DetectionCache
+from domain.services.detector_timings import DetectorTimings
+from domain.services.workload_pool import WorkloadPool, set_workload
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-async def _stream_generator(request: ChatRequest, use_case: StreamChatUseCase):
+async def _stream_generator(chunks: AsyncIterator, first) -> AsyncIterator[str]:
     """
     Serialises StreamChatChunk objects as OpenAI-compatible Server-Sent
     Events, so both generic SSE clients and OpenAI SDK-style streaming
     clients can consume the same endpoint.
     """
-    async for chunk in use_case.execute(request):
-        yield f"data: {chunk.model_dump_json(exclude_none=True)}\n\n"
+    if first is not None:
+        yield f"data: {first.model_dump_json(exclude_none=True)}\n\n"
+        async for chunk in chunks:
+            yield f"data: {chunk.model_dump_json(exclude_none=True)}\n\n"
     yield "data: [DONE]\n\n"
 
 
@@ -33,18 +53,25 @@ async def _stream_generator(request: ChatRequest, use_case: StreamChatUseCase):
     summary="Process a chat request",
     description=(
         "Anonymizes input, sends to LLM, and de-anonymizes the response. "
-        "Set ``stream=true`` in the request body to receive a Server-Sent Events stream."
+        "Set ``stream=true`` in the request body to receive a Server-Sent Events stream. "
+        "Set ``conversation_id`` to keep placeholder numbering across turns and skip re-detecting earlier messages."
     ),
-    dependencies=[Depends(verify_api_key)],
 )
 async def chat_endpoint(
     request: ChatRequest,
+    client_name: str = Depends(verify_api_key),
     chat_use_case: ChatUseCase = Depends(get_chat_use_case),
     stream_use_case: StreamChatUseCase = Depends(get_stream_chat_use_case),
 ):
+    set_workload("stream" if request.stream else "chat", client_name)
     if request.stream:
+        # The first chunk is awaited before the response starts, so a
+        # failure up to then (e.g. a workload pool turning the request
+        # away) is still answered with its own status code.
+        chunks = stream_use_case.execute(request, client_name)
+        first = await anext(chunks, None)
         return StreamingResponse(
-            _stream_generator(request, stream_use_case),
+            _stream_generator(chunks, first),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -52,7 +79,7 @@ async def chat_endpoint(
             },
         )
 
-    return await chat_use_case.execute(request)
+    return await chat_use_case.execute(request, client_name)
 
 @router.post(
     "/anonymize/text",
@@ -60,13 +87,14 @@ async def chat_endpoint(
     status_code=200,
     summary="Anonymize text without LLM processing",
     description="Anonymizes input text and returns the result.",
-    dependencies=[Depends(verify_api_key)]
 )
 async def anonymize_text_endpoint(
     request: AnonymizeRequest,
+    client_name: str = Depends(verify_api_key),
     use_case: AnonymizeUseCase = Depends(get_anonymize_use_case)
 ):
-    return await use_case.execute(request)
+    set_workload("text", client_name)
+    return await use_case.execute(request, client_name)
 
 @router.post(
     "/anonymize",
@@ -74,10 +102,10 @@ async def anonymize_text_endpoint(
     status_code=200,
     summary="Anonymize a document (PDF or DOCX)",
     description="Accepts a file, anonymizes it, and returns the extracted content as anonymized markdown text.",
-    dependencies=[Depends(verify_api_key)]
 )
 async def anonymize_document_endpoint(
     file: UploadFile = File(...),
+    client_name: str = Depends(verify_api_key),
     use_case: AnonymizeDocumentUseCase = Depends(get_anonymize_document_use_case)
 ):
     if file.size and file.size > settings.max_upload_size:
@@ -86,11 +114,39 @@ async def anonymize_document_endpoint(
             detail=f"File too large. Max size is {settings.max_upload_size / (1024 * 1024):.1f}MB."
         )
 
+    set_workload("document", client_name)
     content = await file.read()
-    anonymized_text = await use_case.execute(content, file.content_type)
+    anonymized_text = await use_case.execute(content, file.content_type, client_name)
 
     return AnonymizeResponse(anonymized_text=anonymized_text)
 
+@router.get(
+    "/metrics",
+    summary="Runtime performance metrics",
+    description="Reports per-worker runtime statistics, e.g. the NER batch-size distribution, detection cache hit rate, phone candidate yield and workload pool queue depth and queue times per priority class and client.",
+    dependencies=[Depends(verify_api_key)]
+)
+def get_metrics(
+    pii_pl_detector: PIIDetector = Depends(get_pii_pl_detector),
+    detection_cache: Optional[DetectionCache] = Depends(get_detection_cache),
+    sessions: ConversationSessionStore = Depends(get_conversation_session_store),
+    phone_validator: PhoneNumberValidator = Depends(get_phone_number_validator),
+    detector_timings: DetectorTimings = Depends(get_detector_timings),
+    deny_list_detector: DenyListDetector = Depends(get_deny_list_detector),
+    ner_pool: WorkloadPool = Depends(get_ner_pool),
+    fast_pool: WorkloadPool = Depends(get_fast_pool),
+    document_pool: WorkloadPool = Depends(get_document_pool),
+):
+    return {
+        "ner": pii_pl_detector.stats(),
+        "detection_cache": detection_cache.stats() if detection_cache is not None else None,
+        "conversation_sessions": sessions.stats(),
+        "phone": phone_validator.stats(),
+        "detectors": detector_timings.stats(),
+        "deny_list": deny_list_detector.stats() if settings.deny_list_path else None,
+        "workload_pools": {pool.name: pool.stats() for pool in (ner_pool, fast_pool, document_pool)},
+    }
+
 @router.get("/tags")
 def get_models():
     return {
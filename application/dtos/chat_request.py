@@ -42,3 +42,9 @@ class ChatRequest(BaseModel):
     tools: Optional[List[Dict[str, Any]]] = None
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None
     response_format: Optional[Dict[str, Any]] = None
+    conversation_id: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=128,
+        description="Gateway-side conversation handle: turns sharing it keep placeholder numbering and skip re-detecting earlier messages",
+    )
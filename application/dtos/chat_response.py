@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Any, Dict, List, Literal, Optional
+from domain.entities.usage import Usage
 
 class ChatChoiceMessage(BaseModel):
     role: Literal["assistant"]
@@ -11,10 +12,26 @@ class ChatChoice(BaseModel):
     message: ChatChoiceMessage
     finish_reason: str = "stop"
 
+class PromptTokensDetails(BaseModel):
+    cached_tokens: int = 0
+
 class ChatUsage(BaseModel):
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    prompt_tokens_details: Optional[PromptTokensDetails] = None
+
+    @classmethod
+    def from_usage(cls, usage: Optional[Usage]) -> "ChatUsage":
+        """OpenAI-shaped usage; ``prompt_tokens_details`` only when the provider reported cache hits."""
+        if usage is None:
+            return cls()
+        return cls(
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            total_tokens=usage.total_tokens,
+            prompt_tokens_details=PromptTokensDetails(cached_tokens=usage.cached_tokens) if usage.cached_tokens else None,
+        )
 
 class ChatResponse(BaseModel):
     """Response model for the chat endpoint."""
@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from domain.entities.conversation_session import ConversationSession
+
+SessionKey = Tuple[Optional[str], str]
+
+
+class ConversationSessionStore:
+    """
+    In-process store of :class:`ConversationSession` objects, keyed by
+    (client name, ``conversation_id``) so one API client can never resume
+    another's conversation.
+
+    A session idle for longer than ``ttl_seconds`` is dropped and the
+    conversation simply starts over with a fresh one; beyond
+    ``max_sessions`` the least recently used session is evicted. Sessions
+    live in the worker that created them — a turn served by another
+    worker falls back to full anonymization, as without a session.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_sessions: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max(1, max_sessions)
+        self._clock = clock
+        self._sessions: "OrderedDict[SessionKey, Tuple[float, ConversationSession]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"created": 0, "resumed": 0, "expired": 0, "evicted": 0}
+        self._retired_text_counts: Counter = Counter()
+
+    def get_or_create(self, client_name: Optional[str], conversation_id: str) -> ConversationSession:
+        key = (client_name, conversation_id)
+        now = self._clock()
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is not None and now - entry[0] > self.ttl_seconds:
+                del self._sessions[key]
+                self._retire(entry[1], "expired")
+                entry = None
+
+            if entry is None:
+                session = ConversationSession()
+                self._counters["created"] += 1
+            else:
+                session = entry[1]
+                self._counters["resumed"] += 1
+
+            self._sessions[key] = (now, session)
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.max_sessions:
+                _, (_, evicted) = self._sessions.popitem(last=False)
+                self._retire(evicted, "evicted")
+            return session
+
+    def _retire(self, session: ConversationSession, reason: str) -> None:
+        self._counters[reason] += 1
+        self._retired_text_counts.update(session.text_counts)
+
+    def stats(self) -> Dict:
+        """Session lifecycle counters, and how incoming message texts were handled."""
+        with self._lock:
+            texts = Counter(self._retired_text_counts)
+            for _, session in self._sessions.values():
+                texts.update(session.text_counts)
+            return {
+                "sessions": len(self._sessions),
+                **self._counters,
+                "texts": {kind: texts[kind] for kind in ("reused", "produced", "detected")},
+            }
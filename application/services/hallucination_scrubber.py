@@ -1,5 +1,5 @@
 import re
-from typing import AsyncIterator
+from typing import AsyncIterator, List
 from domain.services.anonymizer_service import AnonymizerService
 
 _WORD_RE = re.compile(r"\S+\s+")
@@ -17,20 +17,35 @@ class HallucinationScrubber:
     against `<TYPE#>`-shaped tokens that don't look like PII data and so
     are never touched here.
 
+    The words of each chunk are scanned as one batch on the guard's
+    workload pool. The first scan is subject to the pool's admission
+    control, so an overloaded pool rejects the stream before its first
+    chunk; later scans only queue, since a started stream can't be
+    turned away.
+
     Deliberately scoped to fast, non-NER detectors: running the PL NER
-    model per streamed word would add prohibitive latency. Multi-word
-    hallucinated PII (e.g. names) is not caught in streaming mode — only
-    the non-streaming path, which scans the complete response at once via
-    :meth:`AnonymizerService.redact`, catches those.
+    model per streamed word would add prohibitive latency. Names are only
+    caught here when the guard includes the gazetteer detector (listed
+    Polish names and places, one word at a time); otherwise — and for
+    multi-word place names either way — only the non-streaming path,
+    which scans the complete response at once via
+    :meth:`AnonymizerService.redact`, catches them.
     """
 
     def __init__(self, guard: AnonymizerService) -> None:
         """
         Args:
-            guard (AnonymizerService): scoped to fast, non-NER detectors only.
+            guard (AnonymizerService): scoped to fast, non-NER detectors only
+                (optionally the gazetteer detector).
         """
         self._guard = guard
         self._buffer = ""
+        self._admitted = False
+
+    async def _redact(self, texts: List[str]) -> List[str]:
+        results = await self._guard.redact_batch_async(texts, admit=not self._admitted)
+        self._admitted = True
+        return [scrubbed for scrubbed, _ in results]
 
     async def process(self, stream: AsyncIterator[str]) -> AsyncIterator[str]:
         """
@@ -48,19 +63,17 @@ class HallucinationScrubber:
                 continue
 
             self._buffer += chunk
-            output = []
+            words = []
             last_end = 0
             for match in _WORD_RE.finditer(self._buffer):
-                word = match.group()
-                scrubbed, _ = self._guard.redact(word)
-                output.append(scrubbed)
+                words.append(match.group())
                 last_end = match.end()
 
             self._buffer = self._buffer[last_end:]
-            if output:
-                yield "".join(output)
+            if words:
+                yield "".join(await self._redact(words))
 
         if self._buffer:
-            scrubbed, _ = self._guard.redact(self._buffer)
-            yield scrubbed
+            scrubbed = await self._redact([self._buffer])
             self._buffer = ""
+            yield scrubbed[0]
@@ -1,12 +1,61 @@
 from typing import Dict, List, Optional, Tuple
 
 from application.dtos.chat_request import ChatMessage
+from domain.entities.conversation_session import ConversationSession
 from domain.entities.pii_token import PIIToken
 from domain.services.anonymizer_service import AnonymizerService
 
 
+async def _anonymize_in_session(
+    anonymizer: AnonymizerService, session: ConversationSession, texts: List[str], roles: List[str]
+) -> Tuple[List[str], Dict[str, PIIToken]]:
+    """
+    Anonymizes one turn's texts against the conversation's carried-over
+    state, running detection only on texts the session hasn't seen:
+
+    - a text anonymized in an earlier turn gets its earlier result back;
+    - an assistant message that is exactly a response this gateway
+      restored gets back the LLM output it was restored from;
+    - everything else goes through the detectors, numbered on from the
+      session's counters.
+
+    Returns the anonymized texts and the session's full mapping, so
+    placeholders from earlier turns can still be restored in the response.
+    """
+    async with session.lock:
+        session.use_format(anonymizer.placeholder_format.name)
+        results: List[Optional[str]] = [None] * len(texts)
+        pending: List[int] = []
+
+        for index, (text, role) in enumerate(zip(texts, roles)):
+            known = session.known_anonymized(text)
+            produced = session.produced_anonymized(text) if known is None and role == "assistant" else None
+            if known is not None:
+                results[index] = known
+                session.text_counts["reused"] += 1
+            elif produced is not None:
+                results[index] = produced
+                session.text_counts["produced"] += 1
+            else:
+                pending.append(index)
+
+        if pending:
+            anonymized, mapping = await anonymizer.anonymize_texts_async(
+                [texts[i] for i in pending], session.type_counters, session.value_to_token_str
+            )
+            session.global_mapping.update(mapping)
+            session.text_counts["detected"] += len(pending)
+            for index, anon_text in zip(pending, anonymized):
+                results[index] = anon_text
+
+        for text, anon_text in zip(texts, results):
+            session.remember_text(text, anon_text)
+
+        return results, dict(session.global_mapping)
+
+
 async def anonymize_messages(
-    anonymizer: AnonymizerService, messages: List[ChatMessage]
+    anonymizer: AnonymizerService, messages: List[ChatMessage], session: Optional[ConversationSession] = None
 ) -> Tuple[List[dict], Dict[str, PIIToken]]:
     """
     Anonymizes the text content of chat messages under one shared numbering
@@ -17,21 +66,30 @@ async def anonymize_messages(
     image parts pass through untouched. Tool calls / tool results
     (``tool_calls``, ``tool_call_id``, ``name``) also pass through
     untouched, since they are not scanned for PII in this version.
+
+    With a ``session``, numbering continues from earlier turns of the same
+    conversation and only new texts are run through detection.
     """
     texts: List[str] = []
+    roles: List[str] = []
     locations: List[Tuple[int, Optional[int]]] = []
 
     for i, msg in enumerate(messages):
         if isinstance(msg.content, str):
             texts.append(msg.content)
+            roles.append(msg.role)
             locations.append((i, None))
         elif isinstance(msg.content, list):
             for j, part in enumerate(msg.content):
                 if part.get("type") == "text":
                     texts.append(part.get("text", ""))
+                    roles.append(msg.role)
                     locations.append((i, j))
 
-    anonymized_texts, global_mapping = await anonymizer.anonymize_texts_async(texts)
+    if session is not None:
+        anonymized_texts, global_mapping = await _anonymize_in_session(anonymizer, session, texts, roles)
+    else:
+        anonymized_texts, global_mapping = await anonymizer.anonymize_texts_async(texts)
 
     contents: List = [
         [dict(part) for part in msg.content] if isinstance(msg.content, list) else msg.content
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 from api.config.config import settings
+from domain.entities.placeholder_format import PlaceholderFormat, get_placeholder_format
 from domain.exceptions.llm_provider_error import LLMProviderError
 
 
@@ -14,3 +15,46 @@ def resolve_model(requested: Optional[str]) -> str:
     if settings.allowed_models and model not in settings.allowed_models:
         raise LLMProviderError(f"Model '{model}' is not permitted", status_code=400)
     return model
+
+
+def resolve_placeholder_format(model: str) -> PlaceholderFormat:
+    """
+    The placeholder syntax to anonymize a request to ``model`` with: its
+    entry in ``placeholder_format_by_model`` if any, else the default.
+    """
+    return get_placeholder_format(settings.placeholder_format_by_model.get(model, settings.placeholder_format))
+
+
+def prompt_placeholder_format(placeholder_format: PlaceholderFormat, has_placeholders: bool) -> Optional[PlaceholderFormat]:
+    """
+    The format to describe in the LLM's system prompt, or ``None`` to send
+    no system prompt — only when the request has no placeholders and
+    ``omit_system_prompt_without_placeholders`` is set.
+    """
+    if has_placeholders or not settings.omit_system_prompt_without_placeholders:
+        return placeholder_format
+    return None
+
+
+def resolve_numbering_scope(client_name: Optional[str], conversation_id: Optional[str]) -> Tuple[str, ...]:
+    """
+    The scope to number a request's placeholders in, per
+    ``placeholder_numbering_scope``: its client and conversation, just its
+    client, or none (one numbering for everyone). Under the conversation
+    scope, a request without a ``conversation_id`` (a stateless client
+    resending the whole history every turn) is numbered in its client's
+    scope, so its prompts still match from turn to turn.
+
+    Raises:
+        ValueError: If ``placeholder_numbering_scope`` is unknown.
+    """
+    mode = settings.placeholder_numbering_scope.lower()
+    if mode == "conversation":
+        if conversation_id is None:
+            return (client_name or "",)
+        return (client_name or "", conversation_id)
+    if mode == "client":
+        return (client_name or "",)
+    if mode == "global":
+        return ()
+    raise ValueError(f"Unknown placeholder numbering scope: {mode}")
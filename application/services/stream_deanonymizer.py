@@ -1,13 +1,11 @@
 import logging
-import re
 from enum import Enum, auto
 from typing import AsyncIterator, Dict
 from domain.entities.pii_token import PIIToken
+from domain.entities.placeholder_format import DEFAULT_PLACEHOLDER_FORMAT, PlaceholderFormat
 
 logger = logging.getLogger(__name__)
 
-_PLACEHOLDER_SHAPE_RE = re.compile(r"^<([A-Z_]+)\d+>$")
-
 class State(Enum):
     NORMAL = auto()
     IN_TAG = auto()
@@ -17,12 +15,17 @@ class StreamDeanonymizer:
     Safely de-anonymizes a streaming LLM response using a state machine.
     """
 
-    def __init__(self, mapping: Dict[str, PIIToken]) -> None:
+    def __init__(self, mapping: Dict[str, PIIToken], placeholder_format: PlaceholderFormat = DEFAULT_PLACEHOLDER_FORMAT) -> None:
         """
         Args:
             mapping (Dict[str, PIIToken]): token_str -> PIIToken from anonymization phase.
+            placeholder_format (PlaceholderFormat): Syntax the placeholders in
+                ``mapping`` were written in; its delimiters drive the state machine.
         """
         self._mapping = mapping
+        self._format = placeholder_format
+        self._open = placeholder_format.open
+        self._close = placeholder_format.close
         self._state = State.NORMAL
         self._buffer: str = ""
 
@@ -43,18 +46,18 @@ class StreamDeanonymizer:
             output = []
             for char in chunk:
                 if self._state == State.NORMAL:
-                    if char == '<':
+                    if char == self._open:
                         self._state = State.IN_TAG
                         self._buffer = char
                     else:
                         output.append(char)
                 elif self._state == State.IN_TAG:
                     self._buffer += char
-                    if char == '>':
+                    if char == self._close:
                         output.append(self._resolve_tag(self._buffer))
                         self._buffer = ""
                         self._state = State.NORMAL
-                    elif char == '<':
+                    elif char == self._open:
                         output.append(self._buffer[:-1])
                         self._buffer = char
             
@@ -68,7 +71,8 @@ class StreamDeanonymizer:
 
     def _resolve_tag(self, tag: str) -> str:
         """
-        Resolves a complete `<...>` tag captured by the state machine.
+        Resolves a complete tag (`<...>` in the default format) captured by
+        the state machine.
 
         A tag matching a known placeholder is restored to its original
         value. A tag that merely *looks* like our placeholder format
@@ -82,9 +86,9 @@ class StreamDeanonymizer:
         if pii:
             return pii.original_value
 
-        shape_match = _PLACEHOLDER_SHAPE_RE.match(tag)
+        shape_match = self._format.shape_re.fullmatch(tag)
         if shape_match:
             logger.warning("Dropped unresolved placeholder tag from streamed response: %s", tag)
-            return f"[REDACTED:{shape_match.group(1)}]"
+            return f"[REDACTED:{self._format.type_name(shape_match.group(1))}]"
 
         return tag
@@ -1,33 +1,48 @@
 import asyncio
+from typing import Optional
 from domain.services.anonymizer_service import AnonymizerService
+from domain.services.workload_pool import WorkloadPool
 from domain.interfaces.document_processor_factory import DocumentProcessorFactory
+from application.services.model_resolver import resolve_numbering_scope
 
 class AnonymizeDocumentUseCase:
     """Use case for anonymizing documents."""
 
-    def __init__(self, anonymizer: AnonymizerService, processor_factory: DocumentProcessorFactory):
+    def __init__(
+        self,
+        anonymizer: AnonymizerService,
+        processor_factory: DocumentProcessorFactory,
+        pool: Optional[WorkloadPool] = None,
+    ):
         self.anonymizer = anonymizer
         self.processor_factory = processor_factory
+        self.pool = pool
 
-    async def execute(self, file_content: bytes, content_type: str) -> str:
+    async def execute(self, file_content: bytes, content_type: str, client_name: Optional[str] = None) -> str:
         """
         Anonymizes the uploaded document.
 
         Args:
             file_content (bytes): The raw file content.
             content_type (str): The MIME type of the file.
+            client_name (Optional[str]): The client, which scopes stable
+                placeholder numbering.
 
         Returns:
             str: The anonymized document content, rendered as markdown.
 
         Raises:
             ValueError: If the content type is unsupported.
+            WorkloadOverloadedError: If the document pool is over capacity.
         """
         processor = self.processor_factory.get_processor(content_type)
+        anonymizer = self.anonymizer.with_numbering_scope(*resolve_numbering_scope(client_name, None))
+        if self.pool is not None:
+            return await self.pool.run(processor.process, file_content, anonymizer)
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             None,
             processor.process,
             file_content,
-            self.anonymizer
+            anonymizer
         )
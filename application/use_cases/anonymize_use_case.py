@@ -1,6 +1,8 @@
+from typing import Optional
 from domain.services.anonymizer_service import AnonymizerService
 from application.dtos.anonymize_request import AnonymizeRequest
 from application.dtos.anonymize_response import AnonymizeResponse
+from application.services.model_resolver import resolve_numbering_scope
 
 class AnonymizeUseCase:
     """Orchestrates the anonymization flow."""
@@ -8,12 +10,13 @@ class AnonymizeUseCase:
     def __init__(self, anonymizer: AnonymizerService):
         self.anonymizer = anonymizer
 
-    async def execute(self, request: AnonymizeRequest) -> AnonymizeResponse:
+    async def execute(self, request: AnonymizeRequest, client_name: Optional[str] = None) -> AnonymizeResponse:
         """
         Processes an anonymization request:
         1. Anonymize user text.
         2. Return result.
         """
-        anon_text, _ = await self.anonymizer.anonymize_async(request.text)
+        anonymizer = self.anonymizer.with_numbering_scope(*resolve_numbering_scope(client_name, None))
+        anon_text, _ = await anonymizer.anonymize_async(request.text)
         
         return AnonymizeResponse(anonymized_text=anon_text)
@@ -1,30 +1,64 @@
 import time
 import uuid
+from typing import Dict, List, Optional
+from domain.entities.conversation_session import ConversationSession
 from domain.interfaces.llm_provider import LLMProvider
 from domain.services.anonymizer_service import AnonymizerService
 from application.dtos.chat_request import ChatRequest
 from application.dtos.chat_response import ChatResponse, ChatChoice, ChatChoiceMessage, ChatUsage
 from application.services.message_anonymizer import anonymize_messages
-from application.services.model_resolver import resolve_model
+from application.services.model_resolver import (
+    prompt_placeholder_format,
+    resolve_model,
+    resolve_numbering_scope,
+    resolve_placeholder_format,
+)
+from application.services.conversation_session_store import ConversationSessionStore
 
 class ChatUseCase:
     """Orchestrates the chat flow with anonymization."""
 
-    def __init__(self, anonymizer: AnonymizerService, llm: LLMProvider):
+    def __init__(self, anonymizer: AnonymizerService, llm: LLMProvider, sessions: Optional[ConversationSessionStore] = None):
         self.anonymizer = anonymizer
         self.llm = llm
+        self.sessions = sessions
 
-    async def execute(self, request: ChatRequest) -> ChatResponse:
+    def _session_for(self, request: ChatRequest, client_name: Optional[str]) -> Optional[ConversationSession]:
+        if request.conversation_id is None or self.sessions is None:
+            return None
+        return self.sessions.get_or_create(client_name, request.conversation_id)
+
+    @staticmethod
+    def _prompt_texts(messages: List[Dict]) -> List[str]:
+        """The anonymized text of each message (and of each text part of a multimodal one)."""
+        texts = []
+        for message in messages:
+            content = message.get("content")
+            if isinstance(content, str):
+                texts.append(content)
+            elif isinstance(content, list):
+                texts.extend(part["text"] for part in content if part.get("type") == "text" and part.get("text"))
+        return texts
+
+    async def execute(self, request: ChatRequest, client_name: Optional[str] = None) -> ChatResponse:
         """
         Processes a chat request:
-        1. Resolve/validate the requested model.
-        2. Anonymize user messages.
+        1. Resolve/validate the requested model, and the placeholder format
+           used with it.
+        2. Anonymize user messages (incrementally, when the request carries
+           a ``conversation_id`` with a live session).
         3. Send to LLM.
-        4. Deanonymize LLM response.
+        4. Redact hallucinated PII from the LLM response and deanonymize
+           it, in one pass (sentences echoed from the prompt aren't scanned).
         5. Return formatted OpenAI compatible response.
         """
         model = resolve_model(request.model)
-        anonymized_messages, global_mapping = await anonymize_messages(self.anonymizer, request.messages)
+        placeholder_format = resolve_placeholder_format(model)
+        anonymizer = self.anonymizer.with_format(placeholder_format).with_numbering_scope(
+            *resolve_numbering_scope(client_name, request.conversation_id)
+        )
+        session = self._session_for(request, client_name)
+        anonymized_messages, global_mapping = await anonymize_messages(anonymizer, request.messages, session)
 
         llm_response = await self.llm.chat(
             messages=anonymized_messages,
@@ -39,12 +73,16 @@ class ChatUseCase:
             tools=request.tools,
             tool_choice=request.tool_choice,
             response_format=request.response_format,
+            placeholder_format=prompt_placeholder_format(placeholder_format, bool(global_mapping)),
         )
 
         final_content = None
         if llm_response.content is not None:
-            safe_response_text, _ = await self.anonymizer.redact_async(llm_response.content)
-            final_content = await self.anonymizer.deanonymize_async(safe_response_text, global_mapping)
+            final_content, anonymized_content, _ = await anonymizer.finalize_response_async(
+                llm_response.content, global_mapping, self._prompt_texts(anonymized_messages)
+            )
+            if session is not None:
+                session.record_response(final_content, anonymized_content)
 
         tool_calls = None
         if llm_response.tool_calls:
@@ -70,9 +108,5 @@ class ChatUseCase:
                     finish_reason=llm_response.finish_reason
                 )
             ],
-            usage=ChatUsage(
-                prompt_tokens=usage.prompt_tokens if usage else 0,
-                completion_tokens=usage.completion_tokens if usage else 0,
-                total_tokens=usage.total_tokens if usage else 0,
-            )
+            usage=ChatUsage.from_usage(usage),
         )
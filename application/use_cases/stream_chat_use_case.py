@@ -4,12 +4,20 @@ from application.dtos.chat_response import ChatUsage
 from application.helpers.stream_helper import build_chunk
 from application.services.hallucination_scrubber import HallucinationScrubber
 from application.services.message_anonymizer import anonymize_messages
-from application.services.model_resolver import resolve_model
+from application.services.model_resolver import (
+    prompt_placeholder_format,
+    resolve_model,
+    resolve_numbering_scope,
+    resolve_placeholder_format,
+)
+from application.services.conversation_session_store import ConversationSessionStore
 from application.services.thinking_parser import ThinkingParser
-from typing import AsyncIterator, Dict, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from application.dtos.chat_request import ChatRequest
 from application.dtos.stream_chat_chunk import StreamChatChunk
 from application.services.stream_deanonymizer import StreamDeanonymizer
+from domain.entities.conversation_session import ConversationSession
+from domain.entities.pii_token import PIIToken
 from domain.entities.stream_delta import StreamDelta
 from domain.entities.usage import Usage
 from domain.interfaces.llm_provider import LLMProvider
@@ -30,7 +38,13 @@ class StreamChatUseCase:
     4. Yield :class:`StreamChatChunk` objects ready to be serialised as SSE.
     """
 
-    def __init__(self, anonymizer: AnonymizerService, llm: LLMProvider, hallucination_guard: AnonymizerService) -> None:
+    def __init__(
+        self,
+        anonymizer: AnonymizerService,
+        llm: LLMProvider,
+        hallucination_guard: AnonymizerService,
+        sessions: Optional[ConversationSessionStore] = None,
+    ) -> None:
         """
         Args:
             anonymizer (AnonymizerService): Service that handles PII anonymization / de-anonymization.
@@ -38,10 +52,19 @@ class StreamChatUseCase:
             hallucination_guard (AnonymizerService): Scoped to fast, non-NER
                 detectors only; used to scrub hallucinated PII from the raw
                 stream without the latency of running NER per word.
+            sessions (Optional[ConversationSessionStore]): Carries
+                anonymization state between turns of requests that set
+                ``conversation_id``.
         """
         self.anonymizer = anonymizer
         self.llm = llm
         self.hallucination_guard = hallucination_guard
+        self.sessions = sessions
+
+    def _session_for(self, request: ChatRequest, client_name: Optional[str]) -> Optional[ConversationSession]:
+        if request.conversation_id is None or self.sessions is None:
+            return None
+        return self.sessions.get_or_create(client_name, request.conversation_id)
 
     @staticmethod
     async def _text_only(
@@ -72,9 +95,41 @@ class StreamChatUseCase:
             if delta.content:
                 yield delta.content
 
-    async def execute(self, request: ChatRequest) -> AsyncIterator[StreamChatChunk]:
+    @staticmethod
+    async def _collected(stream: AsyncIterator[str], collected: List[str]) -> AsyncIterator[str]:
+        """Yields ``stream`` unchanged, appending each chunk to ``collected``."""
+        async for text in stream:
+            collected.append(text)
+            yield text
+
+    @staticmethod
+    def _record_response(
+        session: ConversationSession,
+        anonymizer: AnonymizerService,
+        content: str,
+        scrubbed: str,
+        mapping: Dict[str, PIIToken],
+    ) -> None:
+        """
+        Records the streamed response ``content`` with its anonymized form:
+        the content part of the ``scrubbed`` LLM output it was restored
+        from. Only recorded if that restores to exactly ``content`` (e.g.
+        not if a think tag was split across chunks, or a placeholder was
+        unresolved); otherwise the response goes through detection when
+        the client sends it back.
+        """
+        anonymized = "".join(part for part, _ in ThinkingParser().process(scrubbed))
+        if anonymizer.deanonymize(anonymized, mapping) == content:
+            session.record_response(content, anonymized)
+
+    async def execute(self, request: ChatRequest, client_name: Optional[str] = None) -> AsyncIterator[StreamChatChunk]:
         model = resolve_model(request.model)
-        anonymized_messages, global_mapping = await anonymize_messages(self.anonymizer, request.messages)
+        placeholder_format = resolve_placeholder_format(model)
+        session = self._session_for(request, client_name)
+        anonymizer = self.anonymizer.with_format(placeholder_format).with_numbering_scope(
+            *resolve_numbering_scope(client_name, request.conversation_id)
+        )
+        anonymized_messages, global_mapping = await anonymize_messages(anonymizer, request.messages, session)
 
         chunk_id = f"chatcmpl-{uuid.uuid4().hex}"
         created = int(time.time())
@@ -92,24 +147,29 @@ class StreamChatUseCase:
             tools=request.tools,
             tool_choice=request.tool_choice,
             response_format=request.response_format,
+            placeholder_format=prompt_placeholder_format(placeholder_format, bool(global_mapping)),
         )
 
         tool_call_fragments: Dict[int, dict] = {}
         usage_holder: Dict[str, Optional[Usage]] = {"usage": None}
         finish_reason_holder: Dict[str, Optional[str]] = {"finish_reason": None}
 
-        scrubber = HallucinationScrubber(self.hallucination_guard)
-        deanonymizer = StreamDeanonymizer(mapping=global_mapping)
+        scrubber = HallucinationScrubber(self.hallucination_guard.with_format(placeholder_format))
+        deanonymizer = StreamDeanonymizer(mapping=global_mapping, placeholder_format=placeholder_format)
         parser = ThinkingParser()
 
         text_stream = self._text_only(raw_stream, tool_call_fragments, usage_holder, finish_reason_holder)
-        scrubbed_stream = scrubber.process(text_stream)
+        scrubbed: List[str] = []
+        scrubbed_stream = self._collected(scrubber.process(text_stream), scrubbed)
 
         is_first_chunk = True
+        response_content: List[str] = []
         async for safe_text in deanonymizer.process(scrubbed_stream):
             chunks = parser.process(safe_text)
 
             for content, thinking in chunks:
+                if content:
+                    response_content.append(content)
                 yield build_chunk(
                     chunk_id, created, model,
                     role="assistant" if is_first_chunk else None,
@@ -118,6 +178,9 @@ class StreamChatUseCase:
                 )
                 is_first_chunk = False
 
+        if session is not None and response_content:
+            self._record_response(session, anonymizer, "".join(response_content), "".join(scrubbed), global_mapping)
+
         finish_reason = finish_reason_holder["finish_reason"] or "stop"
 
         if tool_call_fragments:
@@ -136,9 +199,5 @@ class StreamChatUseCase:
                 created=created,
                 model=model,
                 choices=[],
-                usage=ChatUsage(
-                    prompt_tokens=usage.prompt_tokens,
-                    completion_tokens=usage.completion_tokens,
-                    total_tokens=usage.total_tokens,
-                ),
+                usage=ChatUsage.from_usage(usage),
             )
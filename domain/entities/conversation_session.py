@@ -0,0 +1,74 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from domain.entities.pii_token import PIIToken
+
+# Enough for several full-length (50-message) histories with edits.
+MAX_TRACKED_TEXTS = 512
+
+
+def text_digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).digest()
+
+
+@dataclass
+class ConversationSession:
+    """
+    Anonymization state of one conversation, carried between chat turns.
+
+    ``type_counters``/``value_to_token_str``/``global_mapping`` are the
+    numbering state that :meth:`AnonymizerService.anonymize_texts_async`
+    would otherwise rebuild from scratch on every turn. ``known_texts``
+    maps the digest of every text anonymized so far to its anonymized
+    form, and ``produced_responses`` maps the digest of every response
+    this gateway restored and returned to the exact LLM output it was
+    restored from, so either can be sent again byte for byte when the
+    client sends it back as history. ``text_counts`` tallies how the
+    incoming texts were handled across all turns.
+
+    All of it is tied to ``placeholder_format`` (the name of the syntax
+    the placeholders were written in), and is dropped if a turn arrives
+    under another format, e.g. after the conversation switches model.
+    """
+    type_counters: Dict[str, int] = field(default_factory=dict)
+    value_to_token_str: Dict[str, str] = field(default_factory=dict)
+    global_mapping: Dict[str, PIIToken] = field(default_factory=dict)
+    known_texts: "OrderedDict[bytes, str]" = field(default_factory=OrderedDict)
+    produced_responses: "OrderedDict[bytes, str]" = field(default_factory=OrderedDict)
+    text_counts: Dict[str, int] = field(default_factory=lambda: {"reused": 0, "produced": 0, "detected": 0})
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    placeholder_format: Optional[str] = None
+
+    def use_format(self, placeholder_format: str) -> None:
+        if placeholder_format == self.placeholder_format:
+            return
+        if self.placeholder_format is not None:
+            self.type_counters.clear()
+            self.value_to_token_str.clear()
+            self.global_mapping.clear()
+            self.known_texts.clear()
+            self.produced_responses.clear()
+        self.placeholder_format = placeholder_format
+
+    def known_anonymized(self, text: str) -> Optional[str]:
+        return self.known_texts.get(text_digest(text))
+
+    def remember_text(self, text: str, anonymized: str) -> None:
+        _bounded_put(self.known_texts, text_digest(text), anonymized)
+
+    def record_response(self, text: str, anonymized: str) -> None:
+        """Remembers that ``text`` was returned to the client, restored from ``anonymized``."""
+        _bounded_put(self.produced_responses, text_digest(text), anonymized)
+
+    def produced_anonymized(self, text: str) -> Optional[str]:
+        """The anonymized form of ``text``, if it is a response this gateway returned."""
+        return self.produced_responses.get(text_digest(text))
+
+
+def _bounded_put(entries: OrderedDict, key: bytes, value) -> None:
+    entries[key] = value
+    entries.move_to_end(key)
+    while len(entries) > MAX_TRACKED_TEXTS:
+        entries.popitem(last=False)
@@ -0,0 +1,106 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from domain.enums.pii_type import PIIType
+
+# Short type codes: one or two BPE tokens each on common tokenizers, where
+# e.g. "ORGANIZATION" or "BANK_ACCOUNT" cost three or four.
+SHORT_TYPE_CODES: Dict[str, str] = {
+    PIIType.EMAIL.name: "MAIL",
+    PIIType.PHONE.name: "TEL",
+    PIIType.PESEL.name: "PESEL",
+    PIIType.PERSON.name: "PER",
+    PIIType.LOCATION.name: "LOC",
+    PIIType.ORGANIZATION.name: "ORG",
+    PIIType.DATE.name: "DATE",
+    PIIType.BANK_ACCOUNT.name: "ACCT",
+    PIIType.NIP.name: "NIP",
+    PIIType.REGON.name: "REGON",
+    PIIType.IDENTIFIER.name: "ID",
+}
+
+
+@dataclass(frozen=True)
+class PlaceholderFormat:
+    """
+    Syntax of the placeholders PII is replaced with: ``open``, a type code,
+    the number, ``close`` — e.g. ``<PERSON1>`` or ``[PER1]``.
+
+    ``open`` and ``close`` are single, distinct characters, so the
+    streaming de-anonymizer can recognise a placeholder as it arrives
+    character by character. ``type_codes`` maps a ``PIIType`` name to the
+    code written in the placeholder (the name itself when absent).
+
+    ``shape_re`` matches anything *shaped* like a placeholder, whether or
+    not it's a known one, which is how hallucinated or mangled tags are
+    found and stripped. With ``match_any_type`` any upper-case code
+    counts; otherwise only the format's own codes do, so that e.g. a
+    spreadsheet reference like ``[A1]`` isn't mistaken for a placeholder
+    in the square-bracket formats.
+    """
+    name: str
+    open: str
+    close: str
+    type_codes: Dict[str, str] = field(default_factory=dict)
+    match_any_type: bool = False
+
+    _shape: "re.Pattern[str]" = field(init=False, repr=False, compare=False)
+    _names_by_code: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if len(self.open) != 1 or len(self.close) != 1 or self.open == self.close:
+            raise ValueError(f"Placeholder format {self.name!r} needs distinct single-character delimiters")
+        if self.match_any_type:
+            codes = "[A-Z_]+"
+        else:
+            known = sorted({self.code(name) for name in PIIType.__members__}, key=len, reverse=True)
+            codes = "(?:" + "|".join(map(re.escape, known)) + ")"
+        object.__setattr__(self, "_shape", re.compile(f"{re.escape(self.open)}({codes})\\d+{re.escape(self.close)}"))
+        object.__setattr__(self, "_names_by_code", {code: name for name, code in self.type_codes.items()})
+
+    def code(self, type_name: str) -> str:
+        return self.type_codes.get(type_name, type_name)
+
+    def render(self, type_name: str, number: int) -> str:
+        return f"{self.open}{self.code(type_name)}{number}{self.close}"
+
+    def type_name(self, code: str) -> str:
+        """The ``PIIType`` name behind a code (the code itself if unknown)."""
+        return self._names_by_code.get(code, code)
+
+    @property
+    def shape_re(self) -> "re.Pattern[str]":
+        """Matches placeholder-shaped text; group 1 is the type code."""
+        return self._shape
+
+    @property
+    def example(self) -> str:
+        """How the format is described to the LLM in the system prompt."""
+        return f"{self.open}PII_TYPE_AND_ID_NUMBER{self.close}"
+
+
+PLACEHOLDER_FORMATS: Dict[str, PlaceholderFormat] = {
+    fmt.name: fmt
+    for fmt in (
+        PlaceholderFormat("angle", "<", ">", match_any_type=True),
+        PlaceholderFormat("angle_short", "<", ">", SHORT_TYPE_CODES),
+        PlaceholderFormat("square", "[", "]"),
+        PlaceholderFormat("square_short", "[", "]", SHORT_TYPE_CODES),
+        PlaceholderFormat("brace_short", "{", "}", SHORT_TYPE_CODES),
+    )
+}
+
+DEFAULT_PLACEHOLDER_FORMAT = PLACEHOLDER_FORMATS["angle"]
+
+
+def get_placeholder_format(name: Optional[str]) -> PlaceholderFormat:
+    """
+    Raises:
+        ValueError: If ``name`` is not a known format.
+    """
+    if name is None:
+        return DEFAULT_PLACEHOLDER_FORMAT
+    fmt = PLACEHOLDER_FORMATS.get(name.lower())
+    if fmt is None:
+        raise ValueError(f"Unknown placeholder format: {name} (expected one of {', '.join(PLACEHOLDER_FORMATS)})")
+    return fmt
@@ -0,0 +1,177 @@
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.entities.pii_token import PIIToken
+from domain.enums.pii_type import PIIType
+
+Span = Tuple[int, int, PIIType]
+
+_TYPES = {pii_type.value: pii_type for pii_type in PIIType}
+_TYPE_VALUES = np.array(list(_TYPES), dtype=np.uint8)
+# Detection cache record: big-endian uint32 start and end, uint8 type.
+_RECORD = np.dtype([("start", ">u4"), ("end", ">u4"), ("type", "u1")])
+
+
+class SpanSet:
+    """
+    Detected spans of one text as columns — ``starts``, ``ends``, ``types``
+    (``PIIType`` values) and ``scores`` — in detector order.
+
+    Overlap resolution and placeholder filtering run on the columns, and
+    only the spans that survive become :class:`PIIToken` objects with a
+    copy of their text (:meth:`to_tokens`): for a long document, most
+    candidate spans never cost an object or a string. ``scores`` is
+    carried along for detectors that have one; resolution doesn't use it.
+    """
+
+    __slots__ = ("starts", "ends", "types", "scores")
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        types: np.ndarray,
+        scores: Optional[np.ndarray] = None,
+    ) -> None:
+        self.starts = starts
+        self.ends = ends
+        self.types = types
+        self.scores = scores if scores is not None else np.ones(len(starts), dtype=np.float32)
+
+    @classmethod
+    def from_spans(cls, spans: Iterable[Span], scores: Optional[Sequence[float]] = None) -> "SpanSet":
+        """From ``(start, end, type)`` tuples, as a detector produces them."""
+        starts: List[int] = []
+        ends: List[int] = []
+        types: List[int] = []
+        for start, end, pii_type in spans:
+            starts.append(start)
+            ends.append(end)
+            types.append(pii_type.value)
+        return cls(
+            np.array(starts, dtype=np.int64),
+            np.array(ends, dtype=np.int64),
+            np.array(types, dtype=np.uint8),
+            np.array(scores, dtype=np.float32) if scores is not None else None,
+        )
+
+    @classmethod
+    def from_tokens(cls, tokens: Sequence[PIIToken]) -> "SpanSet":
+        return cls.from_spans((t.start, t.end, t.type) for t in tokens)
+
+    @classmethod
+    def concat(cls, sets: Sequence["SpanSet"]) -> "SpanSet":
+        """One set of the spans of ``sets``, in order."""
+        if len(sets) == 1:
+            return sets[0]
+        if not sets:
+            return cls.from_spans(())
+        return cls(
+            np.concatenate([s.starts for s in sets]),
+            np.concatenate([s.ends for s in sets]),
+            np.concatenate([s.types for s in sets]),
+            np.concatenate([s.scores for s in sets]),
+        )
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "SpanSet":
+        """
+        Spans from detection cache records (:meth:`to_bytes`).
+
+        Raises:
+            ValueError: ``value`` isn't a whole number of records, or holds
+                an unknown type or a span ending before it starts.
+        """
+        records = np.frombuffer(value, dtype=_RECORD)
+        if not np.isin(records["type"], _TYPE_VALUES).all() or (records["end"] < records["start"]).any():
+            raise ValueError("Not detection cache records")
+        return cls(
+            records["start"].astype(np.int64),
+            records["end"].astype(np.int64),
+            records["type"].copy(),
+        )
+
+    def to_bytes(self) -> bytes:
+        """The spans as detection cache records: only offsets and types, never text."""
+        records = np.empty(len(self), dtype=_RECORD)
+        records["start"] = self.starts
+        records["end"] = self.ends
+        records["type"] = self.types
+        return records.tobytes()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def take(self, index: np.ndarray) -> "SpanSet":
+        """The spans at ``index`` (positions or a boolean mask), in that order."""
+        return SpanSet(self.starts[index], self.ends[index], self.types[index], self.scores[index])
+
+    def shifted(self, offset: int) -> "SpanSet":
+        """The same spans ``offset`` characters later, e.g. from a region back into its whole text."""
+        if not offset:
+            return self
+        return SpanSet(self.starts + offset, self.ends + offset, self.types, self.scores)
+
+    def resolve_overlaps(self) -> "SpanSet":
+        """
+        The same spans :func:`~domain.services.token_overlap.remove_overlapping_tokens`
+        keeps: sorted by start, longest first on ties (then in detector
+        order), each kept unless it overlaps one kept before it.
+
+        One sort and a running maximum of the ends find every span that
+        overlaps nothing before it, which is kept outright; only the spans
+        inside a run of overlapping ones, where keeping one depends on
+        which were kept before it, are swept one by one.
+        """
+        count = len(self)
+        if count < 2:
+            return self
+        order = np.lexsort((np.arange(count), self.starts - self.ends, self.starts))
+        starts, ends = self.starts[order], self.ends[order]
+        reach = np.maximum.accumulate(ends)
+        keep = np.empty(count, dtype=bool)
+        keep[0] = True
+        np.greater_equal(starts[1:], reach[:-1], out=keep[1:])
+
+        contested = np.flatnonzero(~keep)
+        if contested.size:
+            run_of = (np.cumsum(keep) - 1).tolist()
+            heads = np.flatnonzero(keep).tolist()
+            starts_list, ends_list = starts.tolist(), ends.tolist()
+            run, last_end = -1, 0
+            for index in contested.tolist():
+                if run_of[index] != run:
+                    run = run_of[index]
+                    last_end = ends_list[heads[run]]
+                if starts_list[index] >= last_end:
+                    keep[index] = True
+                    last_end = ends_list[index]
+        return self.take(order[keep])
+
+    def outside(self, protected: Sequence[Tuple[int, int]]) -> "SpanSet":
+        """
+        The spans overlapping none of ``protected``, which must be sorted
+        and disjoint (e.g. the placeholders ``finditer`` found): one binary
+        search per span finds the only protected span it could overlap.
+        """
+        if not protected or not len(self):
+            return self
+        bounds = np.array(protected, dtype=np.int64).reshape(-1, 2)
+        candidate = np.searchsorted(bounds[:, 1], self.starts, side="right")
+        hit = candidate < len(bounds)
+        hit[hit] = bounds[candidate[hit], 0] < self.ends[hit]
+        return self.take(~hit)
+
+    def spans(self) -> List[Span]:
+        return [
+            (start, end, _TYPES[type_value])
+            for start, end, type_value in zip(self.starts.tolist(), self.ends.tolist(), self.types.tolist())
+        ]
+
+    def to_tokens(self, text: str) -> List[PIIToken]:
+        """Fresh tokens of the spans in ``text`` (token assignment mutates them)."""
+        return [
+            PIIToken(type=pii_type, original_value=text[start:end], token_str="", start=start, end=end)
+            for start, end, pii_type in self.spans()
+        ]
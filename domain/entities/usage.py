@@ -3,7 +3,10 @@ from dataclasses import dataclass
 
 @dataclass
 class Usage:
-    """Token usage for a single LLM call, as reported by the provider."""
+    """Token usage for a single LLM call, as reported by the provider.
+    ``cached_tokens`` is the part of ``prompt_tokens`` served from the
+    provider's prompt cache (billed and processed at a discount)."""
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    cached_tokens: int = 0
@@ -12,3 +12,4 @@ class PIIType(Enum):
     BANK_ACCOUNT = auto()
     NIP = auto()
     REGON = auto()
+    IDENTIFIER = auto()
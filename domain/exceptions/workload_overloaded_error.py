@@ -0,0 +1,11 @@
+class WorkloadOverloadedError(Exception):
+    """Raised when a workload pool turns a task away because its queue is
+    full or the wait would exceed the pool's budget. Carries the status
+    code and a Retry-After hint so the API layer can answer 503 without
+    either layer depending on the other."""
+
+    def __init__(self, message: str, retry_after_seconds: int = 1, status_code: int = 503):
+        super().__init__(message)
+        self.message = message
+        self.retry_after_seconds = retry_after_seconds
+        self.status_code = status_code
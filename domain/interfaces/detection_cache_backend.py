@@ -0,0 +1,31 @@
+from typing import Dict, Optional, Protocol
+
+class DetectionCacheBackend(Protocol):
+    """Interface for storage behind the detection cache."""
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """
+        Looks up a cached value.
+
+        Args:
+            key (bytes): Keyed hash identifying a detector set and text.
+
+        Returns:
+            Optional[bytes]: The stored value, or None if absent or expired.
+        """
+        pass
+
+    def set(self, key: bytes, value: bytes, ttl_seconds: float) -> None:
+        """
+        Stores a value, replacing any previous one, for at most ``ttl_seconds``.
+
+        Args:
+            key (bytes): Keyed hash identifying a detector set and text.
+            value (bytes): Encoded detection spans.
+            ttl_seconds (float): Time after which the entry must not be returned.
+        """
+        pass
+
+    def stats(self) -> Dict:
+        """Backend-specific statistics (entries, evictions, ...)."""
+        pass
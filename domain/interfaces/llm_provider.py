@@ -1,6 +1,7 @@
 from typing import Any, AsyncIterator, List, Optional, Protocol
 
 from domain.entities.llm_response import LLMResponse
+from domain.entities.placeholder_format import DEFAULT_PLACEHOLDER_FORMAT, PlaceholderFormat
 from domain.entities.stream_delta import StreamDelta
 
 
@@ -21,6 +22,7 @@ class LLMProvider(Protocol):
         tools: Optional[List[dict]] = None,
         tool_choice: Optional[Any] = None,
         response_format: Optional[dict] = None,
+        placeholder_format: Optional[PlaceholderFormat] = DEFAULT_PLACEHOLDER_FORMAT,
     ) -> LLMResponse:
         """
         Sends a conversation to the LLM and returns the full response.
@@ -34,6 +36,10 @@ class LLMProvider(Protocol):
                 forwarded to the provider only when set.
             tools, tool_choice, response_format: Optional passthrough params for function
                 calling / structured output.
+            placeholder_format (Optional[PlaceholderFormat]): Syntax of the
+                placeholders in ``messages``, as described to the model in the
+                gateway's system prompt; ``None`` when the messages contain no
+                placeholders and the system prompt should be left out.
 
         Returns:
             LLMResponse: The LLM's complete response.
@@ -54,6 +60,7 @@ class LLMProvider(Protocol):
         tools: Optional[List[dict]] = None,
         tool_choice: Optional[Any] = None,
         response_format: Optional[dict] = None,
+        placeholder_format: Optional[PlaceholderFormat] = DEFAULT_PLACEHOLDER_FORMAT,
     ) -> AsyncIterator[StreamDelta]:
         """
         Sends a conversation to the LLM and streams the response chunk by chunk.
@@ -14,4 +14,19 @@ class PIIDetector(Protocol):
         Returns:
             List[PIIToken]: List of detected PII tokens with their positions/values.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def detect_batch(self, texts: List[str]) -> List[List[PIIToken]]:
+        """
+        Detects PII in several texts at once, e.g. the messages of a
+        conversation or the paragraphs of a document. Detectors that can
+        share work between texts (one padded forward pass, one request)
+        override this; by default each text is detected on its own.
+
+        Args:
+            texts (List[str]): Input texts to analyze.
+
+        Returns:
+            List[List[PIIToken]]: The tokens of each text, in input order.
+        """
+        return [self.detect(text) for text in texts]
@@ -1,38 +1,237 @@
 import asyncio
+import copy
 import logging
 import re
-from typing import Callable, List, Tuple, Dict
+import time
+from concurrent.futures import Executor
+from typing import Callable, List, Optional, Sequence, Set, Tuple, Dict, Union
 from domain.entities.pii_token import PIIToken
+from domain.entities.placeholder_format import DEFAULT_PLACEHOLDER_FORMAT, PlaceholderFormat
+from domain.entities.span_set import SpanSet
 from domain.interfaces.pii_detector import PIIDetector
-from domain.services.token_overlap import remove_overlapping_tokens
+from domain.services.detection_cache import DetectionCache
+from domain.services.detector_timings import DetectorTimings
+from domain.services.placeholder_numbering import SequentialNumbering, StableNumbering
+from domain.services.workload_pool import WorkloadPool
 
 logger = logging.getLogger(__name__)
 
-_RESIDUAL_PLACEHOLDER_RE = re.compile(r"<[A-Z_]+\d+>")
+# Where a response (and the prompt it's compared with) splits into sentences.
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?…])\s+|\n+")
+
+
+def detector_fingerprint(detectors: List[PIIDetector]) -> str:
+    """
+    Identifies a detector set and its configuration, so cached detection
+    results are never reused across a different set or e.g. NER model.
+    A detector may contribute its own settings via a ``fingerprint()``
+    method; otherwise its class name stands for it.
+    """
+    parts = []
+    for detector in detectors:
+        part = f"{type(detector).__module__}.{type(detector).__qualname__}"
+        fingerprint = getattr(detector, "fingerprint", None)
+        if callable(fingerprint):
+            part += f"({fingerprint()})"
+        parts.append(part)
+    return "|".join(parts)
+
+
+def detect_batch(detector: PIIDetector, texts: List[str]) -> List[List[PIIToken]]:
+    """
+    ``detector.detect_batch(texts)``, or one ``detect`` per text for a
+    detector that only implements ``detect`` (the protocol's default is only
+    inherited by classes that subclass it).
+    """
+    batch = getattr(detector, "detect_batch", None)
+    if callable(batch):
+        return batch(texts)
+    return [detector.detect(text) for text in texts]
+
+
+def detect_spans_batch(detector: PIIDetector, texts: List[str]) -> List[SpanSet]:
+    """
+    The spans ``detector`` finds in each text, as :class:`SpanSet` columns:
+    from its own ``detect_spans_batch`` when it can fill them directly,
+    without a token object per span, otherwise from its tokens.
+    """
+    spans = getattr(detector, "detect_spans_batch", None)
+    if callable(spans):
+        return spans(texts)
+    return [SpanSet.from_tokens(tokens) for tokens in detect_batch(detector, texts)]
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """``(start, end)`` of each sentence or line of ``text``, without the whitespace between them."""
+    spans = []
+    start = 0
+    for match in _SENTENCE_BREAK.finditer(text):
+        if match.start() > start:
+            spans.append((start, match.start()))
+        start = match.end()
+    if start < len(text):
+        spans.append((start, len(text)))
+    return spans
+
+
+def detector_name(detector: PIIDetector) -> str:
+    """A detector's own ``name`` if it has one, else its class name."""
+    return getattr(detector, "name", None) or type(detector).__name__
+
 
 class AnonymizerService:
     """Service responsible for replacing PII with tokens and restoring them."""
 
-    def __init__(self, detectors: List[PIIDetector]):
+    def __init__(
+        self,
+        detectors: List[PIIDetector],
+        cache: Optional[DetectionCache] = None,
+        numbering: Union[SequentialNumbering, StableNumbering, None] = None,
+        placeholder_format: PlaceholderFormat = DEFAULT_PLACEHOLDER_FORMAT,
+        executor: Union[Executor, WorkloadPool, None] = None,
+        timings: Optional[DetectorTimings] = None,
+        pool: Optional[WorkloadPool] = None,
+    ):
         """
         Args:
             detectors (List[PIIDetector]): List of detectors to use for finding PII.
+            cache (Optional[DetectionCache]): Shared cache of detection results,
+                consulted before running the detectors on a text.
+            numbering (Union[SequentialNumbering, StableNumbering, None]): How
+                new placeholders are numbered; sequential by default.
+            placeholder_format (PlaceholderFormat): Syntax placeholders are
+                written in, and recognised in LLM output by.
+            executor (Union[Executor, WorkloadPool, None]): When given, the
+                detectors of one text run concurrently: the first (NER) on
+                the calling thread, the others on this executor (e.g. the
+                fast workload pool). Otherwise one after another.
+            timings (Optional[DetectorTimings]): Where each detector's wall
+                time per call is recorded.
+            pool (Optional[WorkloadPool]): Where the async methods are
+                offloaded to (the event loop's default executor when not
+                given), and where detection called synchronously from other
+                threads is queued.
         """
         self.detectors = detectors
+        self.cache = cache
+        self.numbering = numbering or SequentialNumbering()
+        self.placeholder_format = placeholder_format
+        self.executor = executor
+        self.timings = timings
+        self.pool = pool
+        self._fingerprint = detector_fingerprint(detectors) if cache is not None else ""
+
+    def with_format(self, placeholder_format: PlaceholderFormat) -> "AnonymizerService":
+        """
+        The same service (detectors, cache, numbering) writing placeholders
+        in ``placeholder_format`` — e.g. the one chosen for a request's model.
+        """
+        if placeholder_format == self.placeholder_format:
+            return self
+        service = copy.copy(self)
+        service.placeholder_format = placeholder_format
+        return service
+
+    def with_numbering_scope(self, *scope: Optional[str]) -> "AnonymizerService":
+        """
+        The same service numbering placeholders within ``scope`` (see
+        :meth:`StableNumbering.scoped`) — e.g. a request's client and
+        conversation.
+        """
+        numbering = self.numbering.scoped(*scope)
+        if numbering is self.numbering:
+            return self
+        service = copy.copy(self)
+        service.numbering = numbering
+        return service
 
     def _detect_tokens(self, text: str) -> List[PIIToken]:
+        """Detects PII in a single text; see :meth:`_detect_tokens_batch`."""
+        return self._detect_tokens_batch([text])[0]
+
+    def _detect_tokens_batch(self, texts: List[str]) -> List[List[PIIToken]]:
+        """The tokens of :meth:`_detect_spans_batch`'s spans of each text."""
+        return [spans.to_tokens(text) for text, spans in zip(texts, self._detect_spans_batch(texts))]
+
+    def _detect_spans_batch(self, texts: List[str]) -> List[SpanSet]:
         """
-        Runs all detectors over text and resolves overlaps.
+        Runs all detectors over the texts and resolves overlaps per text.
 
         This is the expensive, CPU/model-bound part of anonymization and has
-        no dependency on cross-message state, so it's safe to run concurrently
-        for multiple texts (see :meth:`anonymize_texts_async`).
+        no dependency on cross-message state. The texts go to each detector
+        together (:meth:`PIIDetector.detect_batch`), so the NER model can run
+        them as padded batches instead of one forward pass per text.
+
+        The detectors' spans are merged and resolved as columns
+        (:meth:`SpanSet.resolve_overlaps`); tokens are only made of the
+        spans that survive, by the caller.
+
+        With a cache, a text seen before under the same detector set skips
+        detection entirely: only its spans are cached, and numbering still
+        happens afterwards in :meth:`_assign_tokens`, so placeholders come
+        out exactly as if detection had run.
         """
-        all_tokens: List[PIIToken] = []
-        for detector in self.detectors:
-            all_tokens.extend(detector.detect(text))
-
-        return remove_overlapping_tokens(all_tokens)
+        results: List[Optional[SpanSet]] = [None] * len(texts)
+        keys: List[bytes] = []
+        if self.cache is not None:
+            keys = [self.cache.key(self._fingerprint, text) for text in texts]
+            for index, key in enumerate(keys):
+                results[index] = self.cache.get(key)
+
+        pending = [index for index, spans in enumerate(results) if spans is None]
+        if not pending:
+            return results
+
+        pending_texts = [texts[index] for index in pending]
+
+        def detect() -> Tuple[List[List[SpanSet]], float]:
+            started = time.perf_counter()
+            return self._run_detectors(pending_texts), time.perf_counter() - started
+
+        if self.pool is not None and not self.pool.in_worker():
+            # Called synchronously from elsewhere, e.g. a document's pages
+            # on the document pool: still queue for the detection threads,
+            # under the scheduler, rather than run beside them.
+            per_detector, seconds = self.pool.call(detect, cost=sum(map(len, pending_texts)))
+        else:
+            per_detector, seconds = detect()
+        # Detection of the batch is shared, so each text is charged its
+        # share of the wall time when compared with cache lookups.
+        detect_seconds = seconds / len(pending)
+
+        for position, index in enumerate(pending):
+            spans = SpanSet.concat([detected[position] for detected in per_detector]).resolve_overlaps()
+            if self.cache is not None:
+                self.cache.put(keys[index], spans, detect_seconds)
+            results[index] = spans
+        return results
+
+    def _run_detectors(self, texts: List[str]) -> List[List[SpanSet]]:
+        """
+        Each detector's spans for each text, in detector order (which
+        decides ties in :meth:`SpanSet.resolve_overlaps`, so results don't
+        depend on which detector finishes first).
+
+        With an executor, the regex/checksum detectors no longer wait for
+        the NER model call to finish: the model's forward pass releases the
+        GIL (or happens in another process, for a remote NER server), so
+        they overlap with it.
+        """
+        if self.executor is None or len(self.detectors) < 2:
+            return [self._timed_detect(detector, texts) for detector in self.detectors]
+
+        futures = [self.executor.submit(self._timed_detect, detector, texts) for detector in self.detectors[1:]]
+        first = self._timed_detect(self.detectors[0], texts)
+        return [first] + [future.result() for future in futures]
+
+    def _timed_detect(self, detector: PIIDetector, texts: List[str]) -> List[SpanSet]:
+        if self.timings is None:
+            return detect_spans_batch(detector, texts)
+        started = time.perf_counter()
+        try:
+            return detect_spans_batch(detector, texts)
+        finally:
+            self.timings.record(detector_name(detector), time.perf_counter() - started)
 
     def _assign_tokens(self, text: str, tokens: List[PIIToken], state_type_counters: Dict[str, int] = None, state_value_to_token_str: Dict[str, str] = None) -> Tuple[str, Dict[str, PIIToken]]:
         """
@@ -48,6 +247,16 @@ class AnonymizerService:
         mapping: Dict[str, PIIToken] = {}
         value_to_token_str: Dict[str, str] = state_value_to_token_str if state_value_to_token_str is not None else {}
         type_counters: Dict[str, int] = state_type_counters if state_type_counters is not None else {}
+        taken: Optional[Set[str]] = None
+
+        render = self.placeholder_format.render
+
+        def is_taken(number: int) -> bool:
+            nonlocal taken
+            if taken is None:
+                taken = set(value_to_token_str.values())
+            return render(type_name, number) in taken
+
         for token in tokens:
             result_parts.append(text[last_idx:token.start])
 
@@ -55,9 +264,11 @@ class AnonymizerService:
                 token_str = value_to_token_str[token.original_value]
             else:
                 type_name = token.type.name
-                type_counters[type_name] = type_counters.get(type_name, 0) + 1
-                token_str = f"<{type_name}{type_counters[type_name]}>"
+                number = self.numbering.number(type_name, token.original_value, type_counters, is_taken)
+                token_str = render(type_name, number)
                 value_to_token_str[token.original_value] = token_str
+                if taken is not None:
+                    taken.add(token_str)
 
             token.token_str = token_str
             mapping[token_str] = token
@@ -103,11 +314,37 @@ class AnonymizerService:
 
         return anonymize_text
 
+    def scoped_batch(self) -> Callable[[List[str]], List[str]]:
+        """
+        Like :meth:`scoped`, for a whole batch of texts per call — e.g. every
+        paragraph and table cell of a document at once — so detection runs
+        over them together. Blank/whitespace-only texts pass through
+        unchanged and aren't sent to the detectors.
+        """
+        type_counters: Dict[str, int] = {}
+        value_to_token_str: Dict[str, str] = {}
+
+        def anonymize_texts(texts: List[str]) -> List[str]:
+            results = list(texts)
+            pending = [index for index, text in enumerate(texts) if text.strip()]
+            anonymized, _ = self.anonymize_batch([texts[i] for i in pending], type_counters, value_to_token_str)
+            for index, anon_text in zip(pending, anonymized):
+                results[index] = anon_text
+            return results
+
+        return anonymize_texts
+
     def deanonymize(self, text: str, mapping: Dict[str, PIIToken]) -> str:
         """
         Restores PII in the text using the provided mapping.
 
-        Any `<TYPE#>`-shaped span left over after restoring known tokens
+        A single scan for placeholder-shaped spans, each resolved by a dict
+        lookup: the cost grows with the text, not with the mapping, which
+        for a long document can hold thousands of placeholders. Every
+        placeholder this service assigns has its format's shape, so none
+        is missed.
+
+        Any `<TYPE#>`-shaped span (in the service's placeholder format) not in the mapping
         (a hallucinated placeholder number, or one mangled by the LLM) is
         stripped rather than forwarded to the client: it can't be a real
         restoration, since it wasn't in the mapping, and the placeholder
@@ -121,19 +358,14 @@ class AnonymizerService:
         Returns:
             str: The de-anonymized text.
         """
-        if mapping:
-            pattern = re.compile("|".join(map(re.escape, sorted(mapping.keys(), key=len, reverse=True))))
-
-            def replace_match(match: re.Match) -> str:
-                return mapping[match.group(0)].original_value
-
-            text = pattern.sub(replace_match, text)
-
-        def strip_residual(match: re.Match) -> str:
+        def resolve(match: re.Match) -> str:
+            pii = mapping.get(match.group(0))
+            if pii is not None:
+                return pii.original_value
             logger.warning("Stripped unresolved placeholder tag from LLM response: %s", match.group(0))
             return ""
 
-        return _RESIDUAL_PLACEHOLDER_RE.sub(strip_residual, text)
+        return self.placeholder_format.shape_re.sub(resolve, text)
 
     def redact(self, text: str) -> Tuple[str, List[PIIToken]]:
         """
@@ -160,59 +392,193 @@ class AnonymizerService:
             tokens that were found and redacted (for logging; callers
             should log only ``type``/count, never ``original_value``).
         """
-        protected_spans = [m.span() for m in _RESIDUAL_PLACEHOLDER_RE.finditer(text)]
+        return self.redact_batch([text])[0]
 
-        def overlaps_placeholder(token: PIIToken) -> bool:
-            return any(token.start < end and token.end > start for start, end in protected_spans)
+    def redact_batch(self, texts: List[str]) -> List[Tuple[str, List[PIIToken]]]:
+        """
+        :meth:`redact` of each of ``texts``, with the detectors run over
+        them as one batch — e.g. the words of one streamed chunk, each
+        still scanned on its own.
+        """
+        results = []
+        for text, spans in zip(texts, self._detect_spans_batch(texts)):
+            protected_spans = [m.span() for m in self.placeholder_format.shape_re.finditer(text)]
+            tokens = spans.outside(protected_spans).to_tokens(text)
+            if not tokens:
+                results.append((text, []))
+                continue
+
+            result_parts = []
+            last_idx = 0
+            for token in tokens:
+                result_parts.append(text[last_idx:token.start])
+                result_parts.append(f"[REDACTED:{token.type.name}]")
+                last_idx = token.end
+            result_parts.append(text[last_idx:])
+
+            logger.warning(
+                "Redacted %d hallucinated PII span(s) from LLM output: %s",
+                len(tokens), [t.type.name for t in tokens],
+            )
+            results.append(("".join(result_parts), tokens))
+        return results
+
+    def finalize_response(
+        self,
+        text: str,
+        mapping: Dict[str, PIIToken],
+        prompt_texts: Sequence[str] = (),
+    ) -> Tuple[str, str, List[PIIToken]]:
+        """
+        :meth:`redact` and then :meth:`deanonymize` of a complete LLM
+        response, fused: one scan for placeholders serves both to protect
+        them from the detectors and to restore them, and the output is
+        built in a single pass over the text.
+
+        Sentences (or lines) found verbatim in ``prompt_texts`` — the
+        anonymized messages the LLM was sent — aren't scanned at all: the
+        model is only echoing text the detectors already passed, e.g.
+        quoting a document back. The rest is scanned as runs of
+        consecutive sentences, so NER still sees them in context; with no
+        echo, that's the whole response, exactly as :meth:`redact` scans it.
 
-        tokens = [t for t in self._detect_tokens(text) if not overlaps_placeholder(t)]
-        if not tokens:
-            return text, []
+        Args:
+            text (str): The LLM response.
+            mapping (Dict[str, PIIToken]): Token to PII mapping.
+            prompt_texts (Sequence[str]): The anonymized prompt texts.
+
+        Returns:
+            Tuple[str, str, List[PIIToken]]: The response to return to the
+            client; the same response with its placeholders left in place
+            (what to send the LLM when the client sends the response back
+            as history); and the hallucinated PII tokens that were redacted
+            (for logging only ``type``/count, as with :meth:`redact`).
+        """
+        echoed = {prompt[start:end] for prompt in prompt_texts for start, end in sentence_spans(prompt)}
+        regions: List[Tuple[int, int]] = []
+        if echoed:
+            previous_echoed = True
+            for start, end in sentence_spans(text):
+                if text[start:end] in echoed:
+                    previous_echoed = True
+                elif previous_echoed:
+                    regions.append((start, end))
+                    previous_echoed = False
+                else:
+                    regions[-1] = (regions[-1][0], end)
+        elif text:
+            regions.append((0, len(text)))
+
+        detected = self._detect_spans_batch([text[start:end] for start, end in regions])
+        placeholders = list(self.placeholder_format.shape_re.finditer(text))
+        spans = SpanSet.concat(
+            [spans.shifted(start) for spans, (start, _) in zip(detected, regions)]
+        ).outside([match.span() for match in placeholders])
+        tokens = spans.to_tokens(text)
+
+        # (start, end, restored replacement, anonymized replacement)
+        replacements: List[Tuple[int, int, str, str]] = [
+            (token.start, token.end, f"[REDACTED:{token.type.name}]", f"[REDACTED:{token.type.name}]")
+            for token in tokens
+        ]
+        for match in placeholders:
+            pii = mapping.get(match.group(0))
+            if pii is None:
+                logger.warning("Stripped unresolved placeholder tag from LLM response: %s", match.group(0))
+                replacements.append((match.start(), match.end(), "", ""))
+            else:
+                replacements.append((match.start(), match.end(), pii.original_value, match.group(0)))
+        replacements.sort()
 
         result_parts = []
+        anonymized_parts = []
         last_idx = 0
-        for token in tokens:
-            result_parts.append(text[last_idx:token.start])
-            result_parts.append(f"[REDACTED:{token.type.name}]")
-            last_idx = token.end
+        for start, end, replacement, anonymized in replacements:
+            result_parts.append(text[last_idx:start])
+            result_parts.append(replacement)
+            anonymized_parts.append(text[last_idx:start])
+            anonymized_parts.append(anonymized)
+            last_idx = end
         result_parts.append(text[last_idx:])
+        anonymized_parts.append(text[last_idx:])
 
-        logger.warning(
-            "Redacted %d hallucinated PII span(s) from LLM output: %s",
-            len(tokens), [t.type.name for t in tokens],
-        )
+        if tokens:
+            logger.warning(
+                "Redacted %d hallucinated PII span(s) from LLM output: %s",
+                len(tokens), [t.type.name for t in tokens],
+            )
 
-        return "".join(result_parts), tokens
+        return "".join(result_parts), "".join(anonymized_parts), tokens
 
+    @staticmethod
+    async def _offload(pool: Optional[WorkloadPool], fn: Callable, *args, cost: float = 1.0, admit: bool = True):
+        """``fn(*args)`` on ``pool``, scheduled by ``cost`` (the characters to process)."""
+        if pool is not None:
+            return await pool.run(fn, *args, cost=cost, admit=admit)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, fn, *args)
 
     async def anonymize_async(self, text: str, state_type_counters: Dict[str, int] = None, state_value_to_token_str: Dict[str, str] = None) -> Tuple[str, Dict[str, PIIToken]]:
         """
-        Async wrapper for anonymize. Offloads processing to a ThreadPoolExecutor.
+        Async wrapper for anonymize. Offloads processing to its workload pool.
         """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.anonymize, text, state_type_counters, state_value_to_token_str)
+        return await self._offload(
+            self.pool, self.anonymize, text, state_type_counters, state_value_to_token_str, cost=len(text)
+        )
 
-    async def anonymize_texts_async(self, texts: List[str]) -> Tuple[List[str], Dict[str, PIIToken]]:
+    async def anonymize_texts_async(
+        self,
+        texts: List[str],
+        state_type_counters: Dict[str, int] = None,
+        state_value_to_token_str: Dict[str, str] = None,
+    ) -> Tuple[List[str], Dict[str, PIIToken]]:
         """
         Anonymizes multiple texts (e.g. all messages in a conversation) under a
         single shared numbering scheme, the same PII value gets the same token
         wherever it appears, and per-type counters keep incrementing across texts.
 
-        Detection is the expensive, model-bound step, so it runs concurrently
-        across all texts. Token assignment is cheap string work but must stay
-        sequential, in input order, so numbering comes out identical to calling
-        `anonymize` once per text in a loop with shared state.
+        Detection is the expensive, model-bound step, so all texts go to the
+        detectors as one batch, off the event loop. Token assignment is cheap
+        string work but must stay sequential, in input order, so numbering
+        comes out identical to calling `anonymize` once per text in a loop
+        with shared state.
+
+        The numbering state may be passed in (e.g. carried over from earlier
+        turns of the same conversation); it is updated in place.
         """
         if not texts:
             return [], {}
 
-        loop = asyncio.get_running_loop()
-        detected = await asyncio.gather(
-            *(loop.run_in_executor(None, self._detect_tokens, text) for text in texts)
-        )
+        detected = await self._offload(self.pool, self._detect_tokens_batch, texts, cost=sum(map(len, texts)))
+        return self._assign_batch(texts, detected, state_type_counters, state_value_to_token_str)
 
-        state_type_counters: Dict[str, int] = {}
-        state_value_to_token_str: Dict[str, str] = {}
+    def anonymize_batch(
+        self,
+        texts: List[str],
+        state_type_counters: Dict[str, int] = None,
+        state_value_to_token_str: Dict[str, str] = None,
+    ) -> Tuple[List[str], Dict[str, PIIToken]]:
+        """
+        Synchronous :meth:`anonymize_texts_async`: the texts are detected as
+        one batch and numbered in input order under shared state, exactly as
+        calling :meth:`anonymize` on each in turn would number them.
+        """
+        if not texts:
+            return [], {}
+        detected = self._detect_tokens_batch(texts)
+        return self._assign_batch(texts, detected, state_type_counters, state_value_to_token_str)
+
+    def _assign_batch(
+        self,
+        texts: List[str],
+        detected: List[List[PIIToken]],
+        state_type_counters: Optional[Dict[str, int]],
+        state_value_to_token_str: Optional[Dict[str, str]],
+    ) -> Tuple[List[str], Dict[str, PIIToken]]:
+        if state_type_counters is None:
+            state_type_counters = {}
+        if state_value_to_token_str is None:
+            state_value_to_token_str = {}
         global_mapping: Dict[str, PIIToken] = {}
         anonymized_texts: List[str] = []
 
@@ -225,14 +591,31 @@ class AnonymizerService:
 
     async def deanonymize_async(self, text: str, mapping: Dict[str, PIIToken]) -> str:
         """
-        Async wrapper for deanonymize. Offloads processing to a ThreadPoolExecutor.
+        Async wrapper for deanonymize. Offloads processing to its workload pool.
         """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.deanonymize, text, mapping)
+        return await self._offload(self.pool, self.deanonymize, text, mapping, cost=len(text))
 
     async def redact_async(self, text: str) -> Tuple[str, List[PIIToken]]:
         """
-        Async wrapper for redact. Offloads processing to a ThreadPoolExecutor.
+        Async wrapper for redact. Offloads processing to its workload pool.
         """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.redact, text)
+        return await self._offload(self.pool, self.redact, text, cost=len(text))
+
+    async def redact_batch_async(self, texts: List[str], admit: bool = True) -> List[Tuple[str, List[PIIToken]]]:
+        """
+        Async wrapper for redact_batch. Offloads processing to its workload
+        pool; without ``admit``, past its admission control (see
+        :meth:`WorkloadPool.run`).
+        """
+        return await self._offload(self.pool, self.redact_batch, texts, cost=sum(map(len, texts)), admit=admit)
+
+    async def finalize_response_async(
+        self,
+        text: str,
+        mapping: Dict[str, PIIToken],
+        prompt_texts: Sequence[str] = (),
+    ) -> Tuple[str, str, List[PIIToken]]:
+        """
+        Async wrapper for finalize_response. Offloads processing to its workload pool.
+        """
+        return await self._offload(self.pool, self.finalize_response, text, mapping, prompt_texts, cost=len(text))
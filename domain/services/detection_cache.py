@@ -0,0 +1,114 @@
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from domain.entities.span_set import SpanSet
+from domain.interfaces.detection_cache_backend import DetectionCacheBackend
+from domain.services.latency_window import LatencyWindow
+
+logger = logging.getLogger(__name__)
+
+
+class DetectionCache:
+    """
+    Content-addressed cache of detection results, so text that is sent
+    again (clients resend the whole conversation every turn) doesn't go
+    through NER and every regex detector again.
+
+    Keys are an HMAC-SHA256 of the detector fingerprint and the text under
+    ``key_secret``, so the stored keys can't be used to confirm a guessed
+    text by whoever can read the backend. Values are only
+    ``(start, end, type)`` spans; neither the text nor any detected value
+    is stored (:meth:`SpanSet.to_bytes`). Callers rebuild tokens by
+    slicing the text they already have (:meth:`SpanSet.to_tokens`).
+
+    Storage is delegated to a :class:`DetectionCacheBackend` (in-process,
+    host-local or shared by a fleet). A failing backend, or an entry that
+    doesn't decode, is logged and treated as a miss: caching must never
+    fail a request. Lookup, store and detection latencies are recorded
+    side by side, so a backend whose lookups cost more than re-detecting
+    shows up in :meth:`stats`.
+    """
+
+    def __init__(
+        self,
+        backend: DetectionCacheBackend,
+        ttl_seconds: float,
+        key_secret: bytes,
+        backend_name: str = "",
+    ) -> None:
+        self.backend = backend
+        self.backend_name = backend_name or type(backend).__name__
+        self.ttl_seconds = ttl_seconds
+        self._key_secret = key_secret
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._latency = {"get": LatencyWindow(), "set": LatencyWindow(), "detect": LatencyWindow()}
+
+    def key(self, fingerprint: str, text: str) -> bytes:
+        digest = hmac.new(self._key_secret, fingerprint.encode("utf-8"), hashlib.sha256)
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8", errors="surrogatepass"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[SpanSet]:
+        started = time.perf_counter()
+        spans: Optional[SpanSet] = None
+        try:
+            value = self.backend.get(key)
+            if value is not None:
+                spans = SpanSet.from_bytes(value)
+        except Exception as e:
+            self._record_error("lookup", e)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._latency["get"].record(elapsed)
+            if spans is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return spans
+
+    def put(self, key: bytes, spans: SpanSet, detect_seconds: Optional[float] = None) -> None:
+        """
+        Stores ``spans``; ``detect_seconds`` is how long the
+        detection that produced them took, for comparison with lookups.
+        """
+        started = time.perf_counter()
+        try:
+            self.backend.set(key, spans.to_bytes(), self.ttl_seconds)
+        except Exception as e:
+            self._record_error("store", e)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._latency["set"].record(elapsed)
+            if detect_seconds is not None:
+                self._latency["detect"].record(detect_seconds)
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        with self._lock:
+            self._errors += 1
+        logger.warning(f"Detection cache {operation} failed on {self.backend_name}: {error}")
+
+    def stats(self) -> Dict:
+        try:
+            backend_stats = self.backend.stats()
+        except Exception as e:
+            backend_stats = {"error": str(e)}
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": self.backend_name,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "errors": self._errors,
+                "latency": {op: window.summary() for op, window in self._latency.items()},
+                **backend_stats,
+            }
@@ -0,0 +1,27 @@
+import threading
+from typing import Dict
+from domain.services.latency_window import LatencyWindow
+
+
+class DetectorTimings:
+    """
+    Wall time of each detector call (one text, or one batch of texts), by
+    detector name, shared by every anonymizer of a worker so it can be
+    reported in one place.
+    """
+
+    def __init__(self, window: int = 1024) -> None:
+        self._window = window
+        self._lock = threading.Lock()
+        self._latency: Dict[str, LatencyWindow] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            latency = self._latency.get(name)
+            if latency is None:
+                latency = self._latency[name] = LatencyWindow(self._window)
+            latency.record(seconds)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {name: latency.summary() for name, latency in self._latency.items()}
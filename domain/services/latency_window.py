@@ -0,0 +1,24 @@
+from collections import deque
+from typing import Deque, Dict
+
+
+class LatencyWindow:
+    """Latency percentiles over the most recent ``size`` samples."""
+
+    def __init__(self, size: int = 1024) -> None:
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._count = 0
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._count += 1
+
+    def summary(self) -> Dict:
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": self._count}
+
+        def percentile(p: float) -> float:
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 3)
+
+        return {"count": self._count, "p50_ms": percentile(0.5), "p95_ms": percentile(0.95), "p99_ms": percentile(0.99)}
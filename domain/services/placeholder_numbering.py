@@ -0,0 +1,69 @@
+import hashlib
+import hmac
+from typing import Callable, Dict, Optional
+
+
+class SequentialNumbering:
+    """
+    ``<PERSON1>``, ``<PERSON2>``, ... in order of first appearance. Compact,
+    but a value inserted early in a conversation (e.g. an edited message)
+    shifts the number of every value after it.
+    """
+
+    def number(self, type_name: str, value: str, type_counters: Dict[str, int], is_taken: Callable[[int], bool]) -> int:
+        type_counters[type_name] = type_counters.get(type_name, 0) + 1
+        return type_counters[type_name]
+
+    def scoped(self, *scope: Optional[str]) -> "SequentialNumbering":
+        """The same numbering: sequential numbers carry nothing between scopes."""
+        return self
+
+
+class StableNumbering:
+    """
+    Derives each value's number from a keyed hash of its type and value,
+    so a value gets the same placeholder regardless of what precedes it
+    and earlier messages anonymize to the same bytes on every turn —
+    which is what provider-side prompt caching needs.
+
+    Numbers fall in ``1 .. 10**digits - 1``; on a collision with a
+    placeholder already taken in the same scope (``is_taken(number)``),
+    the next free number is used (the value assigned later moves, so
+    existing placeholders never change). The key keeps numbers from being
+    linkable to values by anyone without it, and must be shared by all
+    workers for their prompts to match.
+
+    Under one key, a value gets the same number everywhere, so whoever
+    sees the prompts (the LLM provider) could link a person across
+    unrelated conversations. :meth:`scoped` derives a key per client
+    and conversation to keep numbers stable within one only.
+    """
+
+    def __init__(self, key: bytes, digits: int = 4) -> None:
+        self._key = key
+        self.digits = digits
+        self.modulus = 10 ** max(1, digits) - 1
+
+    def scoped(self, *scope: Optional[str]) -> "StableNumbering":
+        """
+        Numbering under a key derived from this one and ``scope`` (e.g. the
+        client and conversation id): numbers match only within the same
+        scope. Without a scope, this numbering itself.
+        """
+        if not scope:
+            return self
+        label = "\0".join(part or "" for part in scope).encode("utf-8", errors="surrogatepass")
+        return StableNumbering(hmac.new(self._key, label, hashlib.sha256).digest(), self.digits)
+
+    def number(self, type_name: str, value: str, type_counters: Dict[str, int], is_taken: Callable[[int], bool]) -> int:
+        type_counters[type_name] = type_counters.get(type_name, 0) + 1
+        digest = hmac.new(self._key, f"{type_name}\0{value}".encode("utf-8", errors="surrogatepass"), hashlib.sha256).digest()
+        number = int.from_bytes(digest[:8], "big") % self.modulus + 1
+
+        for _ in range(self.modulus):
+            if not is_taken(number):
+                return number
+            number = number % self.modulus + 1
+
+        # Every number in range is taken: continue past it.
+        return self.modulus + type_counters[type_name]
@@ -0,0 +1,253 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from domain.exceptions.workload_overloaded_error import WorkloadOverloadedError
+from domain.services.latency_window import LatencyWindow
+
+T = TypeVar("T")
+
+# Scheduling classes, highest priority first: streamed chats wait on every
+# token, non-streamed chats on the whole answer, text anonymization is an
+# API call, documents are bulk work.
+PRIORITY_CLASSES = ("stream", "chat", "text", "document")
+DEFAULT_PRIORITY_CLASS = "chat"
+
+# Weight of the latest task in the running mean of task run time.
+_SMOOTHING = 0.2
+
+_workload: ContextVar[Tuple[str, Optional[str]]] = ContextVar("workload", default=(DEFAULT_PRIORITY_CLASS, None))
+_worker = threading.local()
+
+
+def set_workload(priority_class: str, client: Optional[str]) -> None:
+    """
+    Tags the work the current request submits to workload pools from here
+    on (in this context, and in tasks it submits) with its scheduling
+    class and client.
+
+    Raises:
+        ValueError: If ``priority_class`` is not one of ``PRIORITY_CLASSES``.
+    """
+    if priority_class not in PRIORITY_CLASSES:
+        raise ValueError(f"Unknown priority class: {priority_class} (expected one of {', '.join(PRIORITY_CLASSES)})")
+    _workload.set((priority_class, client))
+
+
+@dataclass
+class _Task:
+    fn: Callable[..., Any]
+    args: Tuple
+    future: Future
+    context: contextvars.Context
+    priority: int
+    client: str
+    start_tag: float
+    submitted: float
+
+
+class WorkloadPool:
+    """
+    A dedicated, fixed-size thread pool for one class of CPU-bound work
+    (NER detection, fast detection, documents), with admission control,
+    so that e.g. a large document upload can't take the threads that
+    interactive chats need.
+
+    Waiting tasks are scheduled rather than run first come, first served:
+    by the priority class of the request that submitted them (see
+    :func:`set_workload`), strictly, and within a class by weighted fair
+    queuing between clients — start-time fair queuing, with a task's cost
+    (e.g. its characters) divided by its client's weight. A client
+    sending a flood of large texts then only delays its own tasks, and
+    interactive chats overtake queued document work.
+
+    A task submitted with :meth:`run` is admitted only while fewer than
+    ``max_queue`` tasks wait and the wait it can expect — the tasks ahead
+    of it (of its class or higher) times the mean run time of recent
+    tasks, spread over the ``workers`` — stays within
+    ``max_wait_seconds``. Otherwise :meth:`run` raises
+    :class:`WorkloadOverloadedError` at once, with that expected wait as
+    the Retry-After hint, instead of letting the caller queue up.
+    :meth:`call` is for work inside an already admitted request (e.g. a
+    document's detection batches): it only queues.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        max_queue: int,
+        max_wait_seconds: float,
+        client_weights: Optional[Dict[str, float]] = None,
+        window: int = 1024,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"Workload pool {name!r} needs at least one worker")
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.client_weights = client_weights or {}
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix=f"{name}-pool")
+        self._window = window
+        self._lock = threading.Lock()
+        self._queues: List[List[Tuple[float, int, _Task]]] = [[] for _ in PRIORITY_CLASSES]
+        self._virtual_time = [0.0] * len(PRIORITY_CLASSES)
+        self._finish_tags: Dict[Tuple[int, str], float] = {}
+        self._sequence = itertools.count()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._mean_run_seconds = 0.0
+        self._wait = LatencyWindow(window)
+        self._run = LatencyWindow(window)
+        self._class_wait = {name: LatencyWindow(window) for name in PRIORITY_CLASSES}
+        self._client_wait: Dict[str, LatencyWindow] = {}
+
+    def _expected_wait(self, priority: int) -> float:
+        ahead = sum(len(queue) for queue in self._queues[:priority + 1])
+        if not ahead and self._running < self.workers:
+            return 0.0
+        return (ahead + 1) * self._mean_run_seconds / self.workers
+
+    def submit(self, fn: Callable[..., T], *args, cost: float = 1.0, admit: bool = False) -> "Future[T]":
+        """
+        Queues ``fn(*args)`` under the current request's class and client,
+        to run in a copy of the caller's context.
+
+        Raises:
+            WorkloadOverloadedError: With ``admit``, if the task isn't admitted.
+        """
+        priority_class, client = _workload.get()
+        priority = PRIORITY_CLASSES.index(priority_class)
+        client = client or "anonymous"
+        future: "Future[T]" = Future()
+        with self._lock:
+            if admit:
+                expected_wait = self._expected_wait(priority)
+                if self._queued >= self.max_queue or expected_wait > self.max_wait_seconds:
+                    self._rejected += 1
+                    raise WorkloadOverloadedError(
+                        f"The {self.name} workload is over capacity, retry later",
+                        retry_after_seconds=max(1, math.ceil(expected_wait)),
+                    )
+            start_tag = max(self._virtual_time[priority], self._finish_tags.get((priority, client), 0.0))
+            finish_tag = start_tag + cost / self.client_weights.get(client, 1.0)
+            self._finish_tags[(priority, client)] = finish_tag
+            task = _Task(fn, args, future, contextvars.copy_context(), priority, client, start_tag, time.perf_counter())
+            heapq.heappush(self._queues[priority], (finish_tag, next(self._sequence), task))
+            self._queued += 1
+            ready = self._dispatch()
+        for ready_task in ready:
+            self._executor.submit(self._execute, ready_task)
+        return future
+
+    def _dispatch(self) -> List[_Task]:
+        """Takes the next tasks off the queues while workers are free; call with the lock held."""
+        ready = []
+        while self._running < self.workers and self._queued:
+            queue = next(queue for queue in self._queues if queue)
+            _, _, task = heapq.heappop(queue)
+            self._virtual_time[task.priority] = task.start_tag
+            self._queued -= 1
+            self._running += 1
+            ready.append(task)
+        return ready
+
+    def _execute(self, task: _Task) -> None:
+        started = time.perf_counter()
+        waited = started - task.submitted
+        with self._lock:
+            self._wait.record(waited)
+            self._class_wait[PRIORITY_CLASSES[task.priority]].record(waited)
+            client_wait = self._client_wait.get(task.client)
+            if client_wait is None:
+                client_wait = self._client_wait[task.client] = LatencyWindow(self._window)
+            client_wait.record(waited)
+        result: Any = None
+        error: Optional[BaseException] = None
+        run = task.future.set_running_or_notify_cancel()
+        if run:
+            _worker.pool = self
+            try:
+                result = task.context.run(task.fn, *task.args)
+            except BaseException as e:
+                error = e
+            finally:
+                _worker.pool = None
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._running -= 1
+            self._completed += 1
+            self._run.record(elapsed)
+            if self._completed == 1:
+                self._mean_run_seconds = elapsed
+            else:
+                self._mean_run_seconds += _SMOOTHING * (elapsed - self._mean_run_seconds)
+            ready = self._dispatch()
+        for ready_task in ready:
+            self._executor.submit(self._execute, ready_task)
+
+        # Resolved last, so a caller woken by it sees the task accounted for.
+        if run:
+            if error is not None:
+                task.future.set_exception(error)
+            else:
+                task.future.set_result(result)
+
+    async def run(self, fn: Callable[..., T], *args, cost: float = 1.0, admit: bool = True) -> T:
+        """
+        Runs ``fn(*args)`` on the pool, if admitted. Without ``admit``, it
+        only queues: for the rest of a request already underway, e.g. a
+        stream that can no longer answer 503.
+
+        Raises:
+            WorkloadOverloadedError: With ``admit``, if the task isn't admitted.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, cost=cost, admit=admit))
+
+    def call(self, fn: Callable[..., T], *args, cost: float = 1.0) -> T:
+        """
+        Runs ``fn(*args)`` on the pool and waits for it, from a thread
+        outside it; without admission control. On one of the pool's own
+        threads, ``fn`` runs right away instead.
+        """
+        if self.in_worker():
+            return fn(*args)
+        return self.submit(fn, *args, cost=cost).result()
+
+    def in_worker(self) -> bool:
+        """Whether the calling thread is running one of this pool's tasks."""
+        return getattr(_worker, "pool", None) is self
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "queued": self._queued,
+                "max_queue": self.max_queue,
+                "max_wait_seconds": self.max_wait_seconds,
+                "expected_wait_seconds": round(self._expected_wait(len(PRIORITY_CLASSES) - 1), 3),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "wait": self._wait.summary(),
+                "run": self._run.summary(),
+                "classes": {
+                    name: {"queued": len(queue), "wait": self._class_wait[name].summary()}
+                    for name, queue in zip(PRIORITY_CLASSES, self._queues)
+                },
+                "clients": {client: wait.summary() for client, wait in self._client_wait.items()},
+            }
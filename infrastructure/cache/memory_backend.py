@@ -0,0 +1,53 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from domain.interfaces.detection_cache_backend import DetectionCacheBackend
+
+
+class MemoryCacheBackend(DetectionCacheBackend):
+    """
+    In-process store: fastest, but only helps the worker that served the
+    earlier request.
+
+    Bounded to ``max_entries`` with least-recently-used eviction; expired
+    entries are dropped when looked up. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
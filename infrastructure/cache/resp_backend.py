@@ -0,0 +1,155 @@
+import os
+import socket
+import threading
+from typing import Dict, List, Optional, Union
+from urllib.parse import unquote, urlparse
+from domain.interfaces.detection_cache_backend import DetectionCacheBackend
+
+RespValue = Union[bytes, int, List["RespValue"], None]
+
+
+class RespError(Exception):
+    """Raised when the server answers a command with a RESP error reply."""
+
+
+def encode_command(*args: Union[bytes, str, int]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, int):
+            arg = str(arg)
+        if isinstance(arg, str):
+            arg = arg.encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+class _Reader:
+    """Buffered reader for RESP2 replies on a blocking socket."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._buffer = bytearray()
+
+    def _fill(self) -> None:
+        chunk = self._sock.recv(65536)
+        if not chunk:
+            raise ConnectionError("Cache server closed the connection")
+        self._buffer.extend(chunk)
+
+    def _line(self) -> bytes:
+        while True:
+            end = self._buffer.find(b"\r\n")
+            if end != -1:
+                line = bytes(self._buffer[:end])
+                del self._buffer[:end + 2]
+                return line
+            self._fill()
+
+    def _exact(self, size: int) -> bytes:
+        while len(self._buffer) < size + 2:
+            self._fill()
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size + 2]
+        return data
+
+    def read(self) -> RespValue:
+        line = self._line()
+        kind, rest = line[:1], line[1:]
+        if kind == b"+":
+            return rest
+        if kind == b"-":
+            raise RespError(rest.decode("utf-8", errors="replace"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            return None if length < 0 else self._exact(length)
+        if kind == b"*":
+            length = int(rest)
+            return None if length < 0 else [self.read() for _ in range(length)]
+        raise ConnectionError(f"Malformed reply from cache server: {line[:32]!r}")
+
+
+class RespCacheBackend(DetectionCacheBackend):
+    """
+    Store on a Redis-protocol server (Redis, Valkey, KeyDB, ...), shared by
+    every gateway in a fleet. Speaks just enough RESP2 for ``GET`` and
+    ``SET ... PX`` itself, so no client library is needed.
+
+    Each thread keeps its own connection, authenticated and switched to
+    the database from ``url`` (``redis://[:password@]host[:port][/db]``)
+    when opened (and again in a forked child). A dropped connection is
+    re-established once per call.
+
+    The timeout is deliberately short: a slow lookup is worth less than
+    just running detection again.
+    """
+
+    def __init__(self, url: str, timeout: float = 0.1, key_prefix: str = "piast-gate:det:") -> None:
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"Unsupported cache server URL scheme: {parsed.scheme!r}")
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.key_prefix = key_prefix.encode("utf-8")
+        self._local = threading.local()
+
+    def _connect(self) -> "tuple[socket.socket, _Reader]":
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reader = _Reader(sock)
+        self._local.conn = (sock, reader)
+        self._local.pid = os.getpid()
+        try:
+            if self.password is not None:
+                auth = ("AUTH", self.username, self.password) if self.username else ("AUTH", self.password)
+                self._call(sock, reader, *auth)
+            if self.db:
+                self._call(sock, reader, "SELECT", self.db)
+        except Exception:
+            self._disconnect()
+            raise
+        return sock, reader
+
+    def _disconnect(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn[0].close()
+            self._local.conn = None
+
+    @staticmethod
+    def _call(sock: socket.socket, reader: _Reader, *args) -> RespValue:
+        sock.sendall(encode_command(*args))
+        return reader.read()
+
+    def execute(self, *args) -> RespValue:
+        """Sends one command and returns its reply, reconnecting once if needed."""
+        if getattr(self._local, "pid", None) != os.getpid():
+            # Inherited across fork: the socket belongs to the parent.
+            self._local.conn = None
+        for attempt in (1, 2):
+            sock, reader = getattr(self._local, "conn", None) or self._connect()
+            try:
+                return self._call(sock, reader, *args)
+            except TimeoutError:
+                # The reply may still arrive later and desync the stream;
+                # and retrying a slow server only doubles the wait.
+                self._disconnect()
+                raise
+            except (ConnectionError, OSError):
+                self._disconnect()
+                if attempt == 2:
+                    raise
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        return self.execute("GET", self.key_prefix + key)
+
+    def set(self, key: bytes, value: bytes, ttl_seconds: float) -> None:
+        self.execute("SET", self.key_prefix + key, value, "PX", max(1, int(ttl_seconds * 1000)))
+
+    def stats(self) -> Dict:
+        return {"server": f"{self.host}:{self.port}/{self.db}"}
@@ -0,0 +1,90 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional
+from domain.interfaces.detection_cache_backend import DetectionCacheBackend
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS detections (
+    key BLOB PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class SqliteCacheBackend(DetectionCacheBackend):
+    """
+    On-disk store in one SQLite file, shared by every worker on the host
+    (WAL mode, so readers never block the single writer).
+
+    Each thread keeps its own connection. Expired rows are never returned;
+    every ``prune_every`` writes, they are deleted and the table is trimmed
+    back to ``max_entries`` by dropping the rows closest to expiry.
+
+    Expiry uses wall-clock time, since it is compared across processes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int,
+        prune_every: int = 1000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.prune_every = max(1, prune_every)
+        self._clock = clock
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().execute(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=1.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        row = self._connection().execute(
+            "SELECT value FROM detections WHERE key = ? AND expires_at > ?", (key, self._clock())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: bytes, value: bytes, ttl_seconds: float) -> None:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO detections (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, self._clock() + ttl_seconds),
+        )
+        with self._writes_lock:
+            self._writes += 1
+            prune = self._writes % self.prune_every == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> None:
+        """Deletes expired rows and trims the table to ``max_entries``."""
+        conn = self._connection()
+        conn.execute("DELETE FROM detections WHERE expires_at <= ?", (self._clock(),))
+        conn.execute(
+            "DELETE FROM detections WHERE key IN ("
+            "SELECT key FROM detections ORDER BY expires_at "
+            "LIMIT max(0, (SELECT count(*) FROM detections) - ?))",
+            (self.max_entries,),
+        )
+
+    def stats(self) -> Dict:
+        (entries,) = self._connection().execute("SELECT count(*) FROM detections").fetchone()
+        return {"entries": entries, "max_entries": self.max_entries, "path": self.path}
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import List, Optional
 from domain.entities.pii_token import PIIToken
 from domain.enums.pii_type import PIIType
 from domain.interfaces.pii_detector import PIIDetector
@@ -8,6 +8,32 @@ from domain.services.token_overlap import remove_overlapping_tokens
 
 _WHITESPACE = re.compile(r"[ \t]")
 
+NRB_PATTERN = re.compile(r"\b(?:\d[ \t]*){26}\b")
+IBAN_PATTERN = re.compile(r"\b[A-Z]{2}[ \t]*\d{2}[ \t]*(?:[A-Z0-9][ \t]*){11,30}\b")
+BANK_ACCOUNT_PATTERNS = [NRB_PATTERN, IBAN_PATTERN]
+
+
+def bank_account_checksum_input(raw_val: str) -> str:
+    """The IBAN a candidate is checked as: spacing removed, "PL" added to a bare NRB."""
+    compact = _WHITESPACE.sub("", raw_val)
+    return compact if compact[:2].isalpha() else "PL" + compact
+
+
+def bank_account_token(text: str, start: int, end: int) -> Optional[PIIToken]:
+    """The bank account token for a candidate span, or None if its checksum fails."""
+    raw_val = text[start:end]
+    if not is_valid_iban_checksum(bank_account_checksum_input(raw_val)):
+        return None
+
+    return PIIToken(
+        type=PIIType.BANK_ACCOUNT,
+        original_value=raw_val,
+        token_str="",
+        start=start,
+        end=end,
+    )
+
+
 class BankAccountDetector(PIIDetector):
     """
     Detects bank account numbers (NRB and IBAN) in text.
@@ -25,28 +51,10 @@ class BankAccountDetector(PIIDetector):
         """
         tokens: List[PIIToken] = []
 
-        patterns = [
-            r"\b(?:\d[ \t]*){26}\b",
-            r"\b[A-Z]{2}[ \t]*\d{2}[ \t]*(?:[A-Z0-9][ \t]*){11,30}\b",
-        ]
-
-        for pattern in patterns:
-            for match in re.finditer(pattern, text):
-                raw_val = match.group()
-                compact = _WHITESPACE.sub("", raw_val)
-
-                checksum_input = compact if compact[:2].isalpha() else "PL" + compact
-                if not is_valid_iban_checksum(checksum_input):
-                    continue
-
-                tokens.append(
-                    PIIToken(
-                        type=PIIType.BANK_ACCOUNT,
-                        original_value=raw_val,
-                        token_str="",
-                        start=match.start(),
-                        end=match.end(),
-                    )
-                )
+        for pattern in BANK_ACCOUNT_PATTERNS:
+            for match in pattern.finditer(text):
+                token = bank_account_token(text, *match.span())
+                if token is not None:
+                    tokens.append(token)
 
         return remove_overlapping_tokens(tokens)
@@ -10,12 +10,22 @@ _MONTHS = (
     r"sierpnia|września|października|listopada|grudnia"
 )
 
-_PATTERNS = [
+DATE_PATTERNS = [
     re.compile(r"\b\d{4}-\d{2}-\d{2}\b"),
     re.compile(r"\b\d{1,2}[./-]\d{1,2}[./-]\d{4}\b"),
     re.compile(rf"\b\d{{1,2}}\s+(?:{_MONTHS})\s+\d{{4}}\b(?:\s+roku\b)?"),
 ]
 
+
+def date_token(text: str, start: int, end: int) -> PIIToken:
+    return PIIToken(
+        type=PIIType.DATE,
+        original_value=text[start:end],
+        token_str="",
+        start=start,
+        end=end,
+    )
+
 class DateDetector(PIIDetector):
     """Detects dates (ISO, numeric and Polish long-form) in text."""
 
@@ -31,16 +41,8 @@ class DateDetector(PIIDetector):
         """
         tokens: List[PIIToken] = []
 
-        for pattern in _PATTERNS:
+        for pattern in DATE_PATTERNS:
             for match in pattern.finditer(text):
-                tokens.append(
-                    PIIToken(
-                        type=PIIType.DATE,
-                        original_value=match.group(),
-                        token_str="",
-                        start=match.start(),
-                        end=match.end(),
-                    )
-                )
+                tokens.append(date_token(text, *match.span()))
 
         return remove_overlapping_tokens(tokens)
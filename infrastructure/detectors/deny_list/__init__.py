@@ -0,0 +1,3 @@
+from .detector import DenyListDetector
+
+__all__ = ["DenyListDetector"]
@@ -0,0 +1,278 @@
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import unicodedata
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+_WORD = re.compile(r"\w+")
+
+FOLD_CASE = 1
+FOLD_DIACRITICS = 2
+
+# Magic, folding options, terms, vocabulary size, states, transitions, entry types.
+_HEADER = struct.Struct("<8sIIIIII")
+_MAGIC = b"PGDENY01"
+_TYPE_NAME = struct.Struct("16s")
+# Letters NFKD doesn't split into a base letter and a diacritic.
+_UNDECOMPOSABLE = str.maketrans({"ł": "l", "Ł": "L", "ø": "o", "Ø": "O", "đ": "d", "Đ": "D", "ß": "ss"})
+
+Match = Tuple[int, int, str]
+
+
+def fold(word: str, options: int) -> str:
+    """``word`` as the automaton stores it, under the given folding options."""
+    if options & FOLD_DIACRITICS:
+        decomposed = unicodedata.normalize("NFKD", word.translate(_UNDECOMPOSABLE))
+        word = "".join(c for c in decomposed if not unicodedata.combining(c))
+    if options & FOLD_CASE:
+        word = word.casefold()
+    return word
+
+
+def words_of(term: str, options: int) -> List[str]:
+    return [fold(word, options) for word in _WORD.findall(term)]
+
+
+def write_automaton(entries: Iterable[Tuple[str, str]], path: Union[str, Path], options: int) -> int:
+    """
+    Compiles ``(type name, term)`` entries into an Aho-Corasick automaton
+    over words and writes it to ``path``; returns the number of distinct
+    terms. A term later in ``entries`` overrides the type of an earlier,
+    identical one.
+
+    The trie is built level by level from the terms sorted as word-id
+    sequences, so states come out numbered breadth-first with each state's
+    transitions contiguous and sorted — exactly the layout the matcher
+    binary-searches — without a Python object per state. The file is
+    written to a temporary sibling and renamed into place, so a running
+    detector swapping to it never maps a half-written automaton.
+    """
+    type_names: List[str] = []
+    type_index: Dict[str, int] = {}
+    terms: Dict[Tuple[str, ...], int] = {}
+    for type_name, term in entries:
+        words = tuple(words_of(term, options))
+        if not words:
+            continue
+        if type_name not in type_index:
+            type_index[type_name] = len(type_names)
+            type_names.append(type_name)
+        terms[words] = type_index[type_name]
+    count = len(terms)
+
+    vocabulary = sorted({word.encode("utf-8") for words in terms for word in words})
+    word_ids = {word.decode("utf-8"): index + 1 for index, word in enumerate(vocabulary)}
+    patterns = sorted((tuple(word_ids[w] for w in words), type_id) for words, type_id in terms.items())
+    del terms
+
+    # Trie, breadth-first: the states at depth d + 1 are the distinct
+    # (parent, word) pairs of the active patterns, in sorted order.
+    trans_parent, trans_word, trans_next = array("I"), array("I"), array("I")
+    out_len, out_type = array("I", [0]), array("I", [0])
+    node = array("I", [0]) * len(patterns)
+    active = list(range(len(patterns)))
+    depth = 0
+    while active:
+        still_active = []
+        previous = None
+        for index in active:
+            ids, type_id = patterns[index]
+            key = (node[index], ids[depth])
+            if key != previous:
+                previous = key
+                trans_parent.append(key[0])
+                trans_word.append(key[1])
+                trans_next.append(len(out_len))
+                out_len.append(0)
+                out_type.append(0)
+            node[index] = len(out_len) - 1
+            if len(ids) == depth + 1:
+                out_len[node[index]] = depth + 1
+                out_type[node[index]] = type_id
+            else:
+                still_active.append(index)
+        active = still_active
+        depth += 1
+    del node, patterns
+
+    states = len(out_len)
+    trans_start = array("I", [0]) * (states + 1)
+    for parent in trans_parent:
+        trans_start[parent + 1] += 1
+    for state in range(states):
+        trans_start[state + 1] += trans_start[state]
+    del trans_parent
+
+    def goto(state: int, word: int) -> int:
+        lo, hi = trans_start[state], trans_start[state + 1]
+        i = bisect_left(trans_word, word, lo, hi)
+        return trans_next[i] if i < hi and trans_word[i] == word else -1
+
+    fail = array("I", [0]) * states
+    out_link = array("I", [0]) * states
+    for state in range(states):
+        for i in range(trans_start[state], trans_start[state + 1]):
+            child, word = trans_next[i], trans_word[i]
+            target = 0
+            if state:
+                f = fail[state]
+                while True:
+                    target = goto(f, word)
+                    if target >= 0 or f == 0:
+                        break
+                    f = fail[f]
+                target = max(target, 0)
+            fail[child] = target
+            out_link[child] = target if out_len[target] else out_link[target]
+
+    vocab_offsets = array("I")
+    arrays = (trans_start, trans_word, trans_next, fail, out_len, out_link, out_type)
+    position = (
+        _HEADER.size + _TYPE_NAME.size * len(type_names)
+        + 4 * (len(vocabulary) + 1) + sum(4 * len(a) for a in arrays)
+    )
+    for word in vocabulary:
+        vocab_offsets.append(position)
+        position += len(word)
+    vocab_offsets.append(position)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, staging = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, options, count, len(vocabulary), states, len(trans_word), len(type_names)))
+            for type_name in type_names:
+                f.write(_TYPE_NAME.pack(type_name.encode("ascii")))
+            for a in (vocab_offsets,) + arrays:
+                if sys.byteorder != "little":
+                    a.byteswap()
+                f.write(a.tobytes())
+            for word in vocabulary:
+                f.write(word)
+        os.replace(staging, path)
+    except BaseException:
+        os.unlink(staging)
+        raise
+    return count
+
+
+class DenyListAutomaton:
+    """
+    A compiled deny-list, memory-mapped read-only: every worker on a host
+    shares the same page-cache pages, and opening it reads only the header.
+
+    Matching runs the automaton over the words of a text (``\\w+`` runs,
+    folded as when it was built), so it is linear in the text whatever
+    the number of terms, terms only match as whole words, and punctuation
+    or spacing between a term's words doesn't matter.
+    """
+
+    def __init__(self, path: Union[str, Path], cache_size: int = 65536) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.options, self.terms, self.words, self.states, transitions, types = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a deny-list automaton: {self.path}")
+        position = _HEADER.size
+        self.type_names: List[str] = []
+        for _ in range(types):
+            self.type_names.append(_TYPE_NAME.unpack_from(self._mm, position)[0].rstrip(b"\0").decode("ascii"))
+            position += _TYPE_NAME.size
+
+        def table(count: int) -> Sequence[int]:
+            nonlocal position
+            section = slice(position, position + 4 * count)
+            position += 4 * count
+            if sys.byteorder == "little":
+                return memoryview(self._mm)[section].cast("I")
+            swapped = array("I", self._mm[section])
+            swapped.byteswap()
+            return swapped
+
+        self._vocab_offsets = table(self.words + 1)
+        self._trans_start = table(self.states + 1)
+        self._trans_word = table(transitions)
+        self._trans_next = table(transitions)
+        self._fail = table(self.states)
+        self._out_len = table(self.states)
+        self._out_link = table(self.states)
+        self._out_type = table(self.states)
+        self._word_id = lru_cache(maxsize=cache_size)(self._lookup_word)
+
+    def _lookup_word(self, word: str) -> int:
+        key = fold(word, self.options).encode("utf-8")
+        offsets, data = self._vocab_offsets, self._mm
+        lo, hi = 0, self.words
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = data[offsets[mid]:offsets[mid + 1]]
+            if entry < key:
+                lo = mid + 1
+            elif entry > key:
+                hi = mid
+            else:
+                return mid + 1
+        return 0
+
+    def _goto(self, state: int, word: int) -> int:
+        lo, hi = self._trans_start[state], self._trans_start[state + 1]
+        i = bisect_left(self._trans_word, word, lo, hi)
+        return self._trans_next[i] if i < hi and self._trans_word[i] == word else -1
+
+    def find(self, text: str) -> List[Match]:
+        """
+        ``(start, end, type name)`` of the terms in ``text``: leftmost
+        first, the longest where several start at the same word, never
+        overlapping.
+        """
+        fail, out_len, out_link = self._fail, self._out_len, self._out_link
+        spans: List[Tuple[int, int]] = []
+        candidates: List[Tuple[int, int, int]] = []
+        state = 0
+        for match in _WORD.finditer(text):
+            spans.append(match.span())
+            word = self._word_id(match.group())
+            while True:
+                following = self._goto(state, word) if word else -1
+                if following >= 0:
+                    state = following
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+            if state == 0:
+                continue
+            # Every term ending at this word: this state's own and those of
+            # the accepting states along its failure links, longest first.
+            last = len(spans) - 1
+            accepting = state if out_len[state] else out_link[state]
+            while accepting:
+                candidates.append((last - out_len[accepting] + 1, last, accepting))
+                accepting = out_link[accepting]
+
+        matches: List[Match] = []
+        next_free = 0
+        for first, last, accepting in sorted(candidates, key=lambda c: (c[0], c[0] - c[1])):
+            if first >= next_free:
+                matches.append((spans[first][0], spans[last][1], self.type_names[self._out_type[accepting]]))
+                next_free = last + 1
+        return matches
+
+    def close(self) -> None:
+        for table in (
+            self._vocab_offsets, self._trans_start, self._trans_word, self._trans_next,
+            self._fail, self._out_len, self._out_link, self._out_type,
+        ):
+            if isinstance(table, memoryview):
+                table.release()
+        self._mm.close()
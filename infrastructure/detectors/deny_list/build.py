@@ -0,0 +1,61 @@
+"""
+Compiles deny-lists — terms that must always be anonymized, e.g. a
+customer registry's client names, company names and internal IDs — into
+the memory-mapped automaton DenyListDetector reads. One term per line,
+optionally preceded by its PII type and a tab (``ORGANIZATION<TAB>ACME
+Sp. z o.o.``); ``--default-type`` applies to the rest.
+
+The new automaton replaces the file at ``--output`` atomically: running
+workers pick it up within DENY_LIST_RELOAD_SECONDS, no restart needed.
+
+    uv run python -m infrastructure.detectors.deny_list.build registry.txt --output models/deny_list.bin
+    uv run python -m infrastructure.detectors.deny_list.build clients.txt ids.txt --default-type IDENTIFIER --no-fold-diacritics
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+
+from api.config.config import settings
+from domain.enums.pii_type import PIIType
+from .automaton import FOLD_CASE, FOLD_DIACRITICS, write_automaton
+
+
+def read_terms(paths: List[Union[str, Path]], default_type: str) -> Iterator[Tuple[str, str]]:
+    """
+    ``(type name, term)`` of every non-empty line of the given files.
+
+    Raises:
+        ValueError: If a line or ``default_type`` names an unknown PII type.
+    """
+    if default_type not in PIIType.__members__:
+        raise ValueError(f"Unknown PII type: {default_type}")
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                type_name, tab, term = line.rstrip("\r\n").partition("\t")
+                if not tab:
+                    type_name, term = default_type, type_name
+                elif type_name not in PIIType.__members__:
+                    raise ValueError(f"{path}:{number}: unknown PII type {type_name!r}")
+                if term.strip():
+                    yield type_name, term
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("lists", type=Path, nargs="+", help="Term list files")
+    parser.add_argument("--output", type=Path, default=Path(settings.deny_list_path or "models/deny_list.bin"))
+    parser.add_argument("--default-type", default="PERSON", choices=list(PIIType.__members__), help="PII type of lines without one")
+    parser.add_argument("--no-fold-case", action="store_true", help="Match terms case-sensitively")
+    parser.add_argument("--no-fold-diacritics", action="store_true", help="Don't match 'Zażółć' as 'Zazolc'")
+    args = parser.parse_args()
+
+    options = (0 if args.no_fold_case else FOLD_CASE) | (0 if args.no_fold_diacritics else FOLD_DIACRITICS)
+    started = time.perf_counter()
+    count = write_automaton(read_terms(args.lists, args.default_type), args.output, options)
+    print(f"Compiled {count} terms to {args.output} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from domain.entities.pii_token import PIIToken
+from domain.entities.span_set import SpanSet
+from domain.enums.pii_type import PIIType
+from domain.interfaces.pii_detector import PIIDetector
+from api.config.config import settings
+from .automaton import DenyListAutomaton
+
+logger = logging.getLogger(__name__)
+
+_Signature = Tuple[int, int, int]
+
+
+class DenyListDetector(PIIDetector):
+    """
+    Detects the terms of a compiled deny-list (see ``build.py``), each as
+    the PII type it was listed with.
+
+    The automaton file is checked at most every ``reload_seconds``; when it
+    has been replaced (a new inode, size or mtime), the new one is mapped
+    and swapped in for subsequent calls, while calls already running finish
+    on the old one. A file that fails to load is logged and the previous
+    automaton kept. With no file (yet), nothing is detected. The loaded
+    version is part of :meth:`fingerprint`, so detections cached under the
+    previous list aren't reused.
+    """
+
+    def __init__(self, path: Optional[str] = None, reload_seconds: Optional[float] = None) -> None:
+        self.path = path if path is not None else settings.deny_list_path
+        self.reload_seconds = settings.deny_list_reload_seconds if reload_seconds is None else reload_seconds
+        self._automaton: Optional[DenyListAutomaton] = None
+        self._signature: Optional[_Signature] = None
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._reloads = 0
+        self._failed_reloads = 0
+        self.reload()
+
+    def _stat(self) -> Optional[_Signature]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def reload(self) -> bool:
+        """Maps the deny-list file again if it changed; returns whether it did."""
+        if not self.path:
+            return False
+        with self._lock:
+            self._next_check = time.monotonic() + self.reload_seconds
+            signature = self._stat()
+            if signature is None or signature == self._signature:
+                return False
+            try:
+                automaton = DenyListAutomaton(self.path)
+            except (OSError, ValueError) as e:
+                self._failed_reloads += 1
+                logger.error(f"Failed to load deny-list {self.path}, keeping the previous one: {e}")
+                return False
+            self._automaton, self._signature = automaton, signature
+            self._reloads += 1
+        logger.info(f"Loaded deny-list {self.path}: {automaton.terms} terms, {automaton.states} states")
+        return True
+
+    def _current(self) -> Optional[DenyListAutomaton]:
+        if self.path and time.monotonic() >= self._next_check:
+            self.reload()
+        return self._automaton
+
+    def fingerprint(self) -> str:
+        """The loaded deny-list version, so cached detections don't outlive a swap."""
+        self._current()
+        return f"{self.path};{self._signature}"
+
+    def detect(self, text: str) -> List[PIIToken]:
+        automaton = self._current()
+        if automaton is None:
+            return []
+        return [
+            PIIToken(type=PIIType[type_name], original_value=text[start:end], token_str="", start=start, end=end)
+            for start, end, type_name in automaton.find(text)
+        ]
+
+    def detect_spans_batch(self, texts: List[str]) -> List[SpanSet]:
+        """The spans of :meth:`detect` as columns, without a token per term."""
+        automaton = self._current()
+        if automaton is None:
+            return [SpanSet.from_spans(()) for _ in texts]
+        return [
+            SpanSet.from_spans((start, end, PIIType[type_name]) for start, end, type_name in automaton.find(text))
+            for text in texts
+        ]
+
+    def stats(self) -> Dict:
+        automaton = self._automaton
+        return {
+            "path": self.path,
+            "terms": automaton.terms if automaton is not None else 0,
+            "states": automaton.states if automaton is not None else 0,
+            "reloads": self._reloads,
+            "failed_reloads": self._failed_reloads,
+        }
@@ -0,0 +1,112 @@
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_DIGIT_RUN = re.compile(r"\d+")
+_SPACING = frozenset(" \t")
+
+Span = Tuple[int, int]
+
+
+def _is_word(char: str) -> bool:
+    # Exactly what \w matches in a str pattern.
+    return char.isalnum() or char == "_"
+
+
+class DigitGroups:
+    """
+    Every maximal run of digits in a stretch of text, found in one linear
+    pass, from which the candidates of each fixed-length identifier are
+    read off by length and by the separators between runs — instead of
+    each identifier's regex rediscovering the same digits.
+
+    Each method yields exactly the spans ``finditer`` would for the
+    pattern it stands in for (the same ``\\b`` rules, leftmost and
+    non-overlapping), so validators see the same candidates as before.
+    """
+
+    def __init__(self, text: str, start: int = 0, end: Optional[int] = None) -> None:
+        self.text = text
+        self.runs: List[Span] = [m.span() for m in _DIGIT_RUN.finditer(text, start, len(text) if end is None else end)]
+        self.by_length: Dict[int, List[int]] = {}
+        for index, (run_start, run_end) in enumerate(self.runs):
+            self.by_length.setdefault(run_end - run_start, []).append(index)
+
+    def _boundary_before(self, start: int) -> bool:
+        return start == 0 or not _is_word(self.text[start - 1])
+
+    def _boundary_after(self, end: int) -> bool:
+        return end == len(self.text) or not _is_word(self.text[end])
+
+    def plain(self, length: int) -> Iterator[Span]:
+        """Runs of exactly ``length`` digits standing alone: ``\\b\\d{length}\\b``."""
+        for index in self.by_length.get(length, ()):
+            start, end = self.runs[index]
+            if self._boundary_before(start) and self._boundary_after(end):
+                yield start, end
+
+    def dashed(self, lengths: Tuple[int, ...]) -> Iterator[Span]:
+        """
+        Consecutive runs of the given lengths joined by single dashes, e.g.
+        ``(3, 3, 2, 2)`` for ``\\b\\d{3}-\\d{3}-\\d{2}-\\d{2}\\b``.
+        """
+        runs, text, count = self.runs, self.text, len(lengths)
+        last_end = 0
+        for first in self.by_length.get(lengths[0], ()):
+            start = runs[first][0]
+            if first + count > len(runs) or start < last_end or not self._boundary_before(start):
+                continue
+            for offset in range(1, count):
+                previous_end = runs[first + offset - 1][1]
+                run_start, run_end = runs[first + offset]
+                if run_start != previous_end + 1 or text[previous_end] != "-" or run_end - run_start != lengths[offset]:
+                    break
+            else:
+                end = runs[first + count - 1][1]
+                if self._boundary_after(end):
+                    last_end = end
+                    yield start, end
+
+    def spaced(self, digits: int) -> Iterator[Span]:
+        """
+        ``digits`` digits in runs separated only by spaces and tabs, as in
+        ``\\b(?:\\d[ \\t]*){digits}\\b``: the last digit must end a run, and
+        the spacing after it belongs to the match only when a word character
+        follows it (otherwise the final ``\\b`` is right after the digit).
+        """
+        runs, text, n = self.runs, self.text, len(self.text)
+        count = len(runs)
+        # Digits before each run, and the last run reachable from each one
+        # across spaces/tabs only: with the run holding the last digit found
+        # by a pointer that only moves forward, this stays linear however
+        # the digits are split.
+        before = [0] * (count + 1)
+        for index, (run_start, run_end) in enumerate(runs):
+            before[index + 1] = before[index] + run_end - run_start
+        chain_end = list(range(count))
+        for index in range(count - 2, -1, -1):
+            if not text[runs[index][1]:runs[index + 1][0]].strip(" \t"):
+                chain_end[index] = chain_end[index + 1]
+
+        last_end = 0
+        index = 0
+        for first, (start, _) in enumerate(runs):
+            if index < first:
+                index = first
+            while index < count and before[index + 1] - before[first] < digits:
+                index += 1
+            if index == count or before[index + 1] - before[first] != digits or index > chain_end[first]:
+                continue
+            if start < last_end or not self._boundary_before(start):
+                continue
+
+            end = runs[index][1]
+            spacing_end = end
+            while spacing_end < n and text[spacing_end] in _SPACING:
+                spacing_end += 1
+            if spacing_end > end and spacing_end < n and _is_word(text[spacing_end]):
+                end = spacing_end
+            elif not self._boundary_after(end):
+                continue
+
+            last_end = end
+            yield start, end
@@ -4,22 +4,21 @@ from domain.entities.pii_token import PIIToken
 from domain.enums.pii_type import PIIType
 from domain.interfaces.pii_detector import PIIDetector
 
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+
+def email_token(text: str, start: int, end: int) -> PIIToken:
+    return PIIToken(
+        type=PIIType.EMAIL,
+        original_value=text[start:end],
+        token_str="",
+        start=start,
+        end=end
+    )
+
+
 class EmailDetector(PIIDetector):
     """Detects email addresses using regular expressions."""
 
     def detect(self, text: str) -> List[PIIToken]:
-        tokens: List[PIIToken] = []
-
-        pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.finditer(pattern, text)
-        for match in matches:
-            val = match.group()
-            tokens.append(PIIToken(
-                type=PIIType.EMAIL,
-                original_value=val,
-                token_str="",
-                start=match.start(),
-                end=match.end()
-            ))
-        
-        return tokens
+        return [email_token(text, *match.span()) for match in EMAIL_PATTERN.finditer(text)]
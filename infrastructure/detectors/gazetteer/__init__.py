@@ -0,0 +1,3 @@
+from .detector import GazetteerDetector
+
+__all__ = ["GazetteerDetector"]
@@ -0,0 +1,89 @@
+"""
+Compiles name and place lists into the memory-mapped gazetteer file
+GazetteerDetector reads. Each list has one lemma per line (``#`` starts a
+comment); inflected forms are generated, and a line ``Lemma: Form, Form``
+lists forms explicitly instead.
+
+Without arguments, compiles the lists bundled in ``data/`` (which is also
+done automatically on first use when GAZETTEER_PATH doesn't exist yet):
+
+    uv run python -m infrastructure.detectors.gazetteer.build
+    uv run python -m infrastructure.detectors.gazetteer.build --first-names imiona.txt --surnames nazwiska.txt --places teryt.txt
+"""
+import argparse
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Set, Tuple, Union
+
+from api.config.config import settings
+from .inflection import first_name_forms, place_forms, surname_forms
+from .store import FIRST_NAME, PLACE, SURNAME, Gazetteer, write_gazetteer
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent / "data"
+BUNDLED = {
+    "first_names": DATA_DIR / "first_names.txt",
+    "surnames": DATA_DIR / "surnames.txt",
+    "places": DATA_DIR / "places.txt",
+}
+
+_KINDS: Dict[str, Tuple[int, Callable[[str], Set[str]]]] = {
+    "first_names": (FIRST_NAME, first_name_forms),
+    "surnames": (SURNAME, surname_forms),
+    "places": (PLACE, place_forms),
+}
+
+
+def read_list(path: Union[str, Path]) -> Iterator[Tuple[str, List[str]]]:
+    """``(lemma, explicit forms)`` of each entry of a list file."""
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        lemma, _, forms = line.partition(":")
+        yield lemma.strip(), [form.strip() for form in forms.split(",") if form.strip()]
+
+
+def build_entries(lists: Dict[str, Union[str, Path]]) -> Dict[str, int]:
+    """Every form of every entry of the given lists (by kind), lowercased, with its flags."""
+    entries: Dict[str, int] = {}
+    for kind, path in lists.items():
+        flag, inflect = _KINDS[kind]
+        for lemma, explicit in read_list(path):
+            forms = {lemma, *explicit} if explicit else inflect(lemma)
+            for form in forms:
+                key = " ".join(form.lower().split())
+                entries[key] = entries.get(key, 0) | flag
+    return entries
+
+
+def build_gazetteer(path: Union[str, Path], lists: Dict[str, Union[str, Path]] = BUNDLED) -> int:
+    """Compiles ``lists`` into a gazetteer file at ``path``; returns the number of forms."""
+    entries = build_entries(lists)
+    write_gazetteer(entries, path)
+    return len(entries)
+
+
+def load_gazetteer(path: Union[str, Path]) -> Gazetteer:
+    """Maps the gazetteer at ``path``, compiling the bundled lists there first if it doesn't exist."""
+    path = Path(path)
+    if not path.exists():
+        count = build_gazetteer(path)
+        logger.info(f"Compiled the bundled gazetteer ({count} forms) to {path}")
+    return Gazetteer(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    for kind in _KINDS:
+        parser.add_argument(f"--{kind.replace('_', '-')}", type=Path, default=BUNDLED[kind])
+    parser.add_argument("--output", type=Path, default=Path(settings.gazetteer_path))
+    args = parser.parse_args()
+
+    count = build_gazetteer(args.output, {kind: getattr(args, kind) for kind in _KINDS})
+    print(f"Wrote {count} forms to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
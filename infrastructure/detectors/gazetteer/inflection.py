@@ -0,0 +1,117 @@
+"""
+Rule-based Polish declension of the gazetteer's names: enough to find a
+name however a sentence inflects it ("z Janem Kowalskim", "w Krakowie"),
+not a full morphological analyser. Names the rules get wrong list their
+forms explicitly in the data files.
+"""
+from typing import Set
+
+# Consonants after which the locative (masculine) and dative/locative
+# (feminine) take -u / -y instead of a softened stem.
+_SOFT = ("sz", "cz", "rz", "ż", "dz", "c", "j", "l")
+_VELAR = ("k", "g", "ch")
+# Stem ending -> its softened form before the -e of the locative.
+_SOFTENED = (
+    ("st", "ście"), ("sł", "śle"), ("zd", "ździe"),
+    ("r", "rze"), ("t", "cie"), ("d", "dzie"), ("n", "nie"), ("m", "mie"),
+    ("w", "wie"), ("b", "bie"), ("p", "pie"), ("f", "fie"), ("s", "sie"),
+    ("z", "zie"), ("ł", "le"),
+)
+# Feminine stems ending in a velar: dative/locative.
+_VELAR_FEMININE = (("k", "ce"), ("g", "dze"), ("ch", "sze"))
+# A final soft consonant spelled with an accent, and its spelling before
+# a vowel: Poznań -> Poznania.
+_ACCENTED = {"ń": "ni", "ś": "si", "ź": "zi", "ć": "ci"}
+
+
+def _soften(stem: str) -> str:
+    for ending, softened in _SOFTENED:
+        if stem.endswith(ending):
+            return stem[: -len(ending)] + softened
+    return stem + "ie"
+
+
+def _masculine_stem(lemma: str) -> str:
+    if lemma.endswith("ek") and len(lemma) > 3:
+        return lemma[:-2] + "k"  # Jacek -> Jacka, Włocławek -> Włocławka
+    if lemma.endswith("eł"):
+        return lemma[:-2] + "ł"  # Paweł -> Pawła
+    if lemma.endswith("ów"):
+        return lemma[:-2] + "ow"  # Kraków -> Krakowa
+    if lemma[-1] in _ACCENTED:
+        return lemma[:-1] + _ACCENTED[lemma[-1]]
+    return lemma
+
+
+def masculine_forms(lemma: str) -> Set[str]:
+    """A masculine noun ending in a consonant: Jan, Nowak, Gdańsk, Kraków."""
+    stem = _masculine_stem(lemma)
+    forms = {lemma, stem + "a", stem + "owi"}
+    forms.add(stem + ("iem" if stem.endswith(("k", "g")) else "em"))
+    if stem.endswith(_VELAR + _SOFT) or stem.endswith("i"):
+        forms.add(stem + "u")
+    else:
+        forms.add(_soften(stem))
+    return forms
+
+
+def feminine_forms(lemma: str) -> Set[str]:
+    """A feminine noun ending in -a: Anna, Agnieszka, Maria, Gdynia, Warszawa."""
+    stem = lemma[:-1]
+    forms = {lemma, stem + "ę", stem + "ą", stem + "o"}
+    if stem.endswith("i"):
+        # Kasia -> Kasi, but Maria -> Marii.
+        forms.add(stem if stem[-2:-1] in ("n", "c", "s", "z") else stem + "i")
+    elif stem.endswith(_SOFT):
+        forms.add(stem + ("i" if stem.endswith(("l", "j")) else "y"))
+    else:
+        forms.add(stem + ("i" if stem.endswith(("k", "g")) else "y"))
+        for ending, dative in _VELAR_FEMININE:
+            if stem.endswith(ending):
+                forms.add(stem[: -len(ending)] + dative)
+                break
+        else:
+            forms.add(_soften(stem))
+    return forms
+
+
+def adjectival_forms(lemma: str) -> Set[str]:
+    """
+    A name declined like an adjective: Kowalski / Kowalska / Kowalscy,
+    Jerzy, Antoni.
+    """
+    if lemma.endswith("ki"):
+        base = lemma[:-1]
+        return {
+            lemma, base + "iego", base + "iemu", base + "im", base + "ich", base + "imi",
+            base + "a", base + "iej", base + "ą",
+            lemma[:-2] + "cy",
+        }
+    base = lemma[:-1] if lemma.endswith("y") else lemma
+    return {lemma, base + "ego", base + "emu", base + ("ym" if lemma.endswith("y") else "m")}
+
+
+def first_name_forms(lemma: str) -> Set[str]:
+    if lemma.endswith("a"):
+        return feminine_forms(lemma)
+    if lemma.endswith(("y", "i")):
+        return adjectival_forms(lemma)
+    return masculine_forms(lemma)
+
+
+def surname_forms(lemma: str) -> Set[str]:
+    if lemma.endswith(("ski", "cki", "dzki")):
+        return adjectival_forms(lemma)
+    if lemma.endswith("a"):
+        return feminine_forms(lemma)
+    stem = _masculine_stem(lemma)
+    # The feminine surname is the lemma itself, undeclined: "pani Nowak".
+    return masculine_forms(lemma) | {stem + suffix for suffix in ("owie", "ów", "om", "ami", "ach")}
+
+
+def place_forms(lemma: str) -> Set[str]:
+    if lemma.endswith("a"):
+        return feminine_forms(lemma) - {lemma[:-1] + "o"}
+    stem = _masculine_stem(lemma)
+    # Place names take -a or -u in the genitive (Gdańska, Sopotu).
+    return masculine_forms(lemma) | {stem + "u"}
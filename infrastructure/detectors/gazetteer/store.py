@@ -0,0 +1,102 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Dict, Union
+
+FIRST_NAME = 1
+SURNAME = 2
+PLACE = 4
+NAME = FIRST_NAME | SURNAME
+
+# Magic, number of entries, most words in one entry.
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"PGZ1"
+
+
+def write_gazetteer(entries: Dict[str, int], path: Union[str, Path]) -> None:
+    """
+    Writes ``entries`` (lowercase form -> flags) as a gazetteer file: the
+    header, a table of ``count + 1`` little-endian uint32 offsets, then the
+    UTF-8 forms in byte order, each followed by its flags byte — so a
+    lookup is a binary search straight over the memory-mapped file.
+
+    Written to a temporary sibling and renamed into place, so workers
+    starting at once never map a half-written file.
+    """
+    path = Path(path)
+    forms = sorted((form.encode("utf-8"), flags) for form, flags in entries.items())
+    max_words = max((form.count(b" ") + 1 for form, _ in forms), default=1)
+    offsets = array("I")
+    position = _HEADER.size + 4 * (len(forms) + 1)
+    blob = bytearray()
+    for form, flags in forms:
+        offsets.append(position + len(blob))
+        blob += form
+        blob.append(flags)
+    offsets.append(position + len(blob))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, staging = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(forms), max_words))
+            f.write(offsets.tobytes())
+            f.write(blob)
+        os.replace(staging, path)
+    except BaseException:
+        os.unlink(staging)
+        raise
+
+
+class Gazetteer:
+    """
+    Read-only view of a gazetteer file, memory-mapped: opening it reads
+    nothing but the header, and every worker process on a host shares the
+    same page-cache pages instead of holding its own copy of the lists.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.entries, self.max_words = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a gazetteer file: {self.path}")
+        table = slice(_HEADER.size, _HEADER.size + 4 * (self.entries + 1))
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._mm)[table].cast("I")
+        else:
+            self._offsets = array("I", self._mm[table])
+            self._offsets.byteswap()
+
+    def __len__(self) -> int:
+        return self.entries
+
+    def flags(self, form: str) -> int:
+        """Flags of ``form`` (case-insensitive), or 0 if it isn't listed."""
+        key = form.lower().encode("utf-8")
+        offsets, data = self._offsets, self._mm
+        lo, hi = 0, self.entries
+        while lo < hi:
+            mid = (lo + hi) // 2
+            end = offsets[mid + 1] - 1
+            entry = data[offsets[mid]:end]
+            if entry < key:
+                lo = mid + 1
+            elif entry > key:
+                hi = mid
+            else:
+                return data[end]
+        return 0
+
+    def close(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._mm.close()
@@ -1,17 +1,37 @@
 import re
-from typing import List
+from typing import List, Optional
 from domain.entities.pii_token import PIIToken
 from domain.enums.pii_type import PIIType
 from domain.interfaces.pii_detector import PIIDetector
 from infrastructure.detectors.validators import is_valid_nip
 from domain.services.token_overlap import remove_overlapping_tokens
 
-_PATTERNS = [
+NIP_PATTERNS = [
     re.compile(r"\b\d{3}-\d{3}-\d{2}-\d{2}\b"),
     re.compile(r"\b\d{3}-\d{2}-\d{2}-\d{3}\b"),
     re.compile(r"\b\d{10}\b"),
 ]
 
+
+def nip_digits(raw_val: str) -> str:
+    """A NIP candidate without its dashes."""
+    return raw_val.replace("-", "")
+
+
+def nip_token(text: str, start: int, end: int) -> Optional[PIIToken]:
+    """The NIP token for a candidate span, or None if its checksum fails."""
+    raw_val = text[start:end]
+    if not is_valid_nip(nip_digits(raw_val)):
+        return None
+
+    return PIIToken(
+        type=PIIType.NIP,
+        original_value=raw_val,
+        token_str="",
+        start=start,
+        end=end,
+    )
+
 class NipDetector(PIIDetector):
     """Detects Polish tax identification numbers (NIP) in text."""
 
@@ -27,21 +47,10 @@ class NipDetector(PIIDetector):
         """
         tokens: List[PIIToken] = []
 
-        for pattern in _PATTERNS:
+        for pattern in NIP_PATTERNS:
             for match in pattern.finditer(text):
-                raw_val = match.group()
-                digits = raw_val.replace("-", "")
-                if not is_valid_nip(digits):
-                    continue
-
-                tokens.append(
-                    PIIToken(
-                        type=PIIType.NIP,
-                        original_value=raw_val,
-                        token_str="",
-                        start=match.start(),
-                        end=match.end(),
-                    )
-                )
+                token = nip_token(text, *match.span())
+                if token is not None:
+                    tokens.append(token)
 
         return remove_overlapping_tokens(tokens)
@@ -1,10 +1,27 @@
 import re
-from typing import List
+from typing import List, Optional
 from domain.entities.pii_token import PIIToken
 from domain.enums.pii_type import PIIType
 from domain.interfaces.pii_detector import PIIDetector
 from infrastructure.detectors.validators import is_valid_pesel
 
+PESEL_PATTERN = re.compile(r'\b\d{11}\b')
+
+
+def pesel_token(text: str, start: int, end: int) -> Optional[PIIToken]:
+    """The PESEL token for a candidate span, or None if its checksum fails."""
+    val = text[start:end]
+    if not is_valid_pesel(val):
+        return None
+    return PIIToken(
+        type=PIIType.PESEL,
+        original_value=val,
+        token_str="",
+        start=start,
+        end=end
+    )
+
+
 class PeselDetector(PIIDetector):
     """Detects Pesel in text."""
 
@@ -20,18 +37,9 @@ class PeselDetector(PIIDetector):
         """
         tokens: List[PIIToken] = []
 
-        pattern = r'\b\d{11}\b'
-        matches = re.finditer(pattern, text)
-        for match in matches:
-            val = match.group()
-            if not is_valid_pesel(val):
-                continue
-            tokens.append(PIIToken(
-                    type=PIIType.PESEL,
-                    original_value=val,
-                    token_str="",
-                    start=match.start(),
-                    end=match.end()
-                ))
+        for match in PESEL_PATTERN.finditer(text):
+            token = pesel_token(text, *match.span())
+            if token is not None:
+                tokens.append(token)
 
         return tokens
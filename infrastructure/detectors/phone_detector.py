@@ -1,34 +1,180 @@
-from typing import List
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import phonenumbers
 from domain.entities.pii_token import PIIToken
 from domain.enums.pii_type import PIIType
 from domain.interfaces.pii_detector import PIIDetector
-import phonenumbers
-import re
 
 PHONE_CANDIDATE_REGEX = re.compile(
     r'\+?\d[\d\s\-()]{6,}\d'
 )
 
+_REGION = "PL"
+_COUNTRY_CODE = "48"
+# Digits of an international number phonenumbers can accept: a 1-3 digit
+# country code and a 2-17 digit national number.
+_MIN_INTERNATIONAL_DIGITS = 1 + 2
+_MAX_INTERNATIONAL_DIGITS = 3 + 17
+_NUMBER_TYPES = (
+    "premium_rate", "toll_free", "shared_cost", "voip", "personal_number",
+    "pager", "uan", "voicemail", "fixed_line", "mobile",
+)
+# Separators phonenumbers reads the same however they're placed, so a
+# candidate made of digits and these is valid exactly when its digits are.
+_PLAIN_SEPARATORS = frozenset(" -()")
+_ASCII_DIGITS = frozenset("0123456789")
+
+
+def _numbering_plan(region: str) -> Dict[int, "re.Pattern[str]"]:
+    """
+    The national number patterns of every number type in ``region``'s
+    numbering plan, by length, as phonenumbers' own metadata has them.
+    """
+    metadata = phonenumbers.PhoneMetadata.metadata_for_region(region)
+    patterns: Dict[int, List[str]] = {}
+    for name in _NUMBER_TYPES:
+        desc = getattr(metadata, name, None)
+        if desc is None or desc.national_number_pattern is None:
+            continue
+        for length in desc.possible_length or metadata.general_desc.possible_length:
+            patterns.setdefault(length, []).append(f"(?:{desc.national_number_pattern})")
+    return {length: re.compile("|".join(alternatives)) for length, alternatives in patterns.items()}
+
+
+_PL_PLAN = _numbering_plan(_REGION)
+
+
+def _fits_plan(national: str) -> bool:
+    pattern = _PL_PLAN.get(len(national))
+    return pattern is not None and pattern.fullmatch(national) is not None
+
+
+def may_be_valid_phone(digits: str, international: bool) -> bool:
+    """
+    Cheap necessary condition for ``phonenumbers`` (region PL) to accept a
+    number with these ASCII digits: a Polish number — national, or after
+    +48/0048, or after a leading 48 phonenumbers would take for the
+    country code — must have a length and prefix one of the numbering
+    plan's number types allows; for other countries only the digit count
+    is checked.
+    """
+    if not international and digits.startswith("00"):
+        digits, international = digits[2:], True
+    if international:
+        if digits.startswith(_COUNTRY_CODE):
+            return _fits_plan(digits[2:])
+        return _MIN_INTERNATIONAL_DIGITS <= len(digits) <= _MAX_INTERNATIONAL_DIGITS
+    return _fits_plan(digits) or (digits.startswith(_COUNTRY_CODE) and _fits_plan(digits[2:]))
+
+
+class PhoneNumberValidator:
+    """
+    Decides whether a phone candidate is a valid number, calling
+    ``phonenumbers`` (slow: a parse and a validation per call) only for
+    candidates :func:`may_be_valid_phone` doesn't rule out — dates, amounts,
+    NIPs and account numbers match the candidate pattern too, and nearly
+    all fail on length or prefix. Verdicts for plainly written candidates
+    are memoised by their normalized number (``+`` and digits), up to
+    ``max_entries``, least recently used evicted first.
+
+    Shared by the phone detectors of a worker; counts candidates seen,
+    ruled out by the prefilter, answered from the memo, parsed and
+    accepted.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._memo: "OrderedDict[str, bool]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._prefiltered = 0
+        self._memo_hits = 0
+        self._parsed = 0
+        self._accepted = 0
+
+    def is_valid(self, raw: str) -> bool:
+        international = raw.startswith("+")
+        key: Optional[str] = None
+        if raw.isascii():
+            digits = "".join(c for c in raw if c in _ASCII_DIGITS)
+            if not may_be_valid_phone(digits, international):
+                with self._lock:
+                    self._seen += 1
+                    self._prefiltered += 1
+                return False
+            if all(c in _ASCII_DIGITS or c in _PLAIN_SEPARATORS for c in raw[1 if international else 0:]):
+                key = "+" + digits if international else digits
+
+        if key is not None:
+            with self._lock:
+                self._seen += 1
+                valid = self._memo.get(key)
+                if valid is not None:
+                    self._memo.move_to_end(key)
+                    self._memo_hits += 1
+                    self._accepted += valid
+                    return valid
+        else:
+            with self._lock:
+                self._seen += 1
+
+        valid = self._parse(raw)
+        with self._lock:
+            self._parsed += 1
+            self._accepted += valid
+            if key is not None and self.max_entries > 0:
+                self._memo[key] = valid
+                if len(self._memo) > self.max_entries:
+                    self._memo.popitem(last=False)
+        return valid
+
+    @staticmethod
+    def _parse(raw: str) -> bool:
+        try:
+            return phonenumbers.is_valid_number(phonenumbers.parse(raw, _REGION))
+        except phonenumbers.NumberParseException:
+            return False
+
+    def token(self, text: str, start: int, end: int) -> Optional[PIIToken]:
+        """The phone token for a candidate span, or None if it isn't a valid number."""
+        raw = text[start:end]
+        if not self.is_valid(raw):
+            return None
+        return PIIToken(
+            type=PIIType.PHONE,
+            original_value=raw,
+            token_str="",
+            start=start,
+            end=end
+        )
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "seen": self._seen,
+                "prefiltered": self._prefiltered,
+                "memo_hits": self._memo_hits,
+                "parsed": self._parsed,
+                "accepted": self._accepted,
+                "yield": self._accepted / self._seen if self._seen else 0.0,
+                "memo_entries": len(self._memo),
+            }
+
+
 class PhoneDetector(PIIDetector):
     """Detects phone numbers using phonenumbers library."""
 
+    def __init__(self, validator: Optional[PhoneNumberValidator] = None) -> None:
+        self.validator = validator or PhoneNumberValidator()
+
     def detect(self, text: str) -> List[PIIToken]:
         tokens: List[PIIToken] = []
         
         for match in PHONE_CANDIDATE_REGEX.finditer(text):
-            raw = match.group()
-
-            try:
-                number = phonenumbers.parse(raw, "PL")
-                if phonenumbers.is_valid_number(number):
-                    tokens.append(PIIToken(
-                        type=PIIType.PHONE,
-                        original_value=raw,
-                        token_str="",
-                        start=match.start(),
-                        end=match.end()
-                    ))
-            except phonenumbers.NumberParseException:
-                continue
+            token = self.validator.token(text, *match.span())
+            if token is not None:
+                tokens.append(token)
         
         return tokens
@@ -0,0 +1,163 @@
+import logging
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+InferBatch = Callable[[List[str]], List[List[Dict]]]
+
+
+@dataclass
+class _Pending:
+    text: str
+    future: Future = field(default_factory=Future)
+
+
+def _length_buckets(batch: List[_Pending]) -> List[List[_Pending]]:
+    """
+    Groups pending texts into buckets whose lengths are within 2x of each
+    other (same ``bit_length`` of the character count), so one short text
+    doesn't get padded out to the length of the longest one in the batch.
+    """
+    buckets: Dict[int, List[_Pending]] = {}
+    for pending in sorted(batch, key=lambda p: len(p.text)):
+        buckets.setdefault(len(pending.text).bit_length(), []).append(pending)
+    return list(buckets.values())
+
+
+class NerBatcher:
+    """
+    Coalesces NER calls arriving concurrently from many threads (one per
+    in-flight ``run_in_executor`` call) into batched forward passes.
+
+    Callers block in :meth:`submit` while a single worker thread collects
+    queued texts until either ``max_batch_size`` is reached or
+    ``max_wait_ms`` has passed since the first one arrived, splits them
+    into length buckets and runs one ``infer_batch`` call per bucket.
+    Each caller gets back exactly the entity list for its own text.
+
+    The queue is bounded by ``max_queue_depth``: once full, :meth:`submit`
+    blocks until the worker catches up, rather than letting an overload
+    pile up unbounded memory.
+
+    Safe to create (and use) before ``os.fork``: the worker thread does
+    not survive the fork, so a forked child that finds it belongs to
+    another pid starts its own, with a fresh queue and lock.
+    """
+
+    def __init__(
+        self,
+        infer_batch: InferBatch,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_queue_depth: int,
+    ) -> None:
+        self._infer_batch = infer_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._max_queue_depth = max(0, max_queue_depth)
+        self._queue: "queue.Queue[_Pending]" = queue.Queue(maxsize=self._max_queue_depth)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_pid: Optional[int] = None
+        self._batch_sizes: Counter = Counter()
+
+    def submit(self, text: str) -> List[Dict]:
+        """
+        Queues ``text`` for the next batch and blocks until its entities
+        are ready.
+
+        Raises:
+            Exception: Whatever ``infer_batch`` raised for the batch this
+                text ended up in.
+        """
+        self._ensure_worker()
+        pending = _Pending(text)
+        self._queue.put(pending)
+        return pending.future.result()
+
+    def submit_many(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Queues all of ``texts`` at once — they land in the same batches
+        (split by length bucket) rather than one batch per caller — and
+        blocks until every one's entities are ready.
+        """
+        self._ensure_worker()
+        pending = [_Pending(text) for text in texts]
+        for item in pending:
+            self._queue.put(item)
+        return [item.future.result() for item in pending]
+
+    def stats(self) -> Dict:
+        """Batch-size distribution achieved so far, and the current queue depth."""
+        with self._lock:
+            distribution = dict(sorted(self._batch_sizes.items()))
+        batches = sum(distribution.values())
+        texts = sum(size * count for size, count in distribution.items())
+        return {
+            "batches": batches,
+            "texts": texts,
+            "mean_batch_size": texts / batches if batches else 0.0,
+            "batch_size_distribution": distribution,
+            "queue_depth": self._queue.qsize(),
+        }
+
+    def _ensure_worker(self) -> None:
+        if self._worker_pid == os.getpid():
+            return
+        if self._worker_pid is not None:
+            # Forked after the worker started: the thread (and possibly a
+            # held lock or half-consumed queue) stayed behind in the parent.
+            self._lock = threading.Lock()
+            self._queue = queue.Queue(maxsize=self._max_queue_depth)
+            self._worker = None
+            self._worker_pid = None
+        with self._lock:
+            if self._worker_pid is None:
+                worker = threading.Thread(target=self._run, name="ner-batcher", daemon=True)
+                worker.start()
+                self._worker = worker
+                self._worker_pid = os.getpid()
+
+    def _collect(self) -> List[_Pending]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            for bucket in _length_buckets(self._collect()):
+                self._dispatch(bucket)
+
+    def _dispatch(self, bucket: List[_Pending]) -> None:
+        try:
+            results = self._infer_batch([p.text for p in bucket])
+            if len(results) != len(bucket):
+                raise RuntimeError(f"NER inference returned {len(results)} result(s) for {len(bucket)} text(s)")
+        except Exception as e:
+            logger.error(f"Batched NER inference failed for {len(bucket)} text(s): {e}")
+            for pending in bucket:
+                pending.future.set_exception(e)
+            return
+
+        with self._lock:
+            self._batch_sizes[len(bucket)] += 1
+        logger.debug("NER batch of %d text(s) dispatched", len(bucket))
+
+        for pending, entities in zip(bucket, results):
+            pending.future.set_result(entities)
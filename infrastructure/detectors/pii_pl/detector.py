@@ -1,14 +1,26 @@
 import logging
+import os
 import re
-from typing import Dict, List
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from domain.entities.pii_token import PIIToken
 from domain.interfaces.pii_detector import PIIDetector
+from .batcher import NerBatcher
 from .mapping import ENTITY_MAPPING
+from .onnx_engine import load_onnx_pipeline
+from .quantization import quantize_pipeline, rescore_windows, uncertain_windows
+from .gating import SEGMENT_CLASSES, ner_regions
+from .segmentation import Span, split_segments, stitch_entities
 from api.config.config import settings
 
 logger = logging.getLogger(__name__)
 
 _THRESHOLD = 0.05
+# Conservative characters per model token for Polish text, to size segments
+# in characters; a segment that still runs over is windowed by the pipeline.
+_CHARS_PER_TOKEN = 3
 
 _MERGE_GAP_PATTERN = re.compile(r"^[\s.\-]{0,3}$")
 _LOCATION_PREFIX_WORDS = {"województwo", "powiat", "gmina", "miasto", "dzielnica", "osiedle"}
@@ -55,35 +67,271 @@ class PiiPlDetector(PIIDetector):
         self.model_name = settings.pl_ner_model_name
         self.chunk_tokens = settings.pl_ner_chunk_tokens
         self.chunk_stride = settings.pl_ner_chunk_stride
+        self.engine = settings.pl_ner_engine.lower()
+        self.quantization = settings.pl_ner_quantization.lower()
+        self.cascade_threshold = settings.pl_ner_int8_cascade_threshold
+        self.cascade_context_chars = settings.pl_ner_int8_cascade_context_chars
         self._pipeline = self._load_pipeline()
+        self._fp32_pipeline = None
+        if self.quantization == "int8":
+            if self.engine != "torch":
+                raise ValueError(f"int8 quantization is only supported with the torch NER engine, not {self.engine}")
+            fp32_pipeline = self._pipeline
+            self._pipeline = quantize_pipeline(fp32_pipeline)
+            if settings.pl_ner_int8_cascade:
+                self._fp32_pipeline = fp32_pipeline
+            logger.info(
+                f"Quantized PII PL model {self.model_name} to int8"
+                f"{' with fp32 rescoring cascade' if self._fp32_pipeline is not None else ''}"
+            )
+        elif self.quantization != "none":
+            raise ValueError(f"Unknown NER quantization mode: {self.quantization}")
+        self.max_batch_size = max(1, settings.pl_ner_max_batch_size)
+        self.segment_min_chars = settings.pl_ner_segment_min_chars if settings.pl_ner_segment_long_texts else None
+        self.segment_chars = self.chunk_tokens * _CHARS_PER_TOKEN
+        self.segment_overlap_chars = self.chunk_stride * _CHARS_PER_TOKEN
+        self.segment_workers = max(1, settings.pl_ner_segment_workers)
+        self._segment_executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(self.segment_workers, thread_name_prefix="ner-segments")
+            if self.segment_min_chars is not None and self.segment_workers > 1
+            else None
+        )
+        self.gate_skip: Optional[frozenset] = None
+        if settings.pl_ner_gating_enabled:
+            unknown = set(settings.pl_ner_gate_skip_classes) - set(SEGMENT_CLASSES)
+            if unknown:
+                raise ValueError(f"Unknown NER gating segment class(es): {', '.join(sorted(unknown))}")
+            self.gate_skip = frozenset(settings.pl_ner_gate_skip_classes)
+        if settings.gazetteer_first_tier:
+            # The gazetteer answers alone for lines capitalized only at
+            # sentence starts: a name opening such a line is found if it's
+            # listed, and NER is spared the line.
+            self.gate_skip = (self.gate_skip or frozenset()) | {"sentence_case"}
+        self._gate_lock = threading.Lock()
+        self._gate_inferred_chars = 0
+        self._gate_skipped_chars: Counter = Counter()
+        self._cascade_lock = threading.Lock()
+        self._cascade_windows = 0
+        self._cascade_chars = 0
+        self._batcher = (
+            NerBatcher(
+                self._infer_batch,
+                max_batch_size=settings.pl_ner_max_batch_size,
+                max_wait_ms=settings.pl_ner_batch_wait_ms,
+                max_queue_depth=settings.pl_ner_max_queue_depth,
+            )
+            if settings.pl_ner_batching_enabled
+            else None
+        )
 
     def _load_pipeline(self):
         try:
-            import torch
-            from transformers import pipeline
-            device = 0 if torch.cuda.is_available() else -1
-            ner_pipeline = pipeline(
-                "ner",
-                model=self.model_name,
-                tokenizer=self.model_name,
-                aggregation_strategy="simple",
-                device=device,
-            )
+            if self.engine == "torch":
+                ner_pipeline, device_name = self._load_torch_pipeline()
+            elif self.engine == "onnx":
+                ner_pipeline = load_onnx_pipeline(self.model_name, settings.pl_ner_onnx_cache_dir)
+                device_name = "onnxruntime"
+            else:
+                raise ValueError(f"Unknown NER engine: {self.engine}")
             ner_pipeline.tokenizer.model_max_length = self.chunk_tokens
-            logger.info(f"Loaded PII PL model {self.model_name} on {'cuda' if device == 0 else 'cpu'}")
+            logger.info(f"Loaded PII PL model {self.model_name} on {device_name}")
             return ner_pipeline
         except Exception as e:
             logger.error(f"Failed to load PII PL model {self.model_name}: {e}")
             raise
 
+    def _load_torch_pipeline(self):
+        import torch
+        from transformers import pipeline
+        device = 0 if torch.cuda.is_available() else -1
+        if device == -1:
+            # Each NER pool thread may run a forward pass at once (documents'
+            # detection queues there too); left at one thread per core
+            # each, they'd oversubscribe.
+            threads = settings.pl_ner_torch_threads or max(1, (os.cpu_count() or 1) // settings.ner_pool_workers)
+            torch.set_num_threads(threads)
+        ner_pipeline = pipeline(
+            "ner",
+            model=self.model_name,
+            tokenizer=self.model_name,
+            aggregation_strategy="simple",
+            device=device,
+        )
+        return ner_pipeline, "cuda" if device == 0 else "cpu"
+
+    def _infer_batch(self, texts: List[str]) -> List[List[Dict]]:
+        """Runs the pipeline over several texts in one padded forward pass."""
+        return self._pipeline(texts, stride=self.chunk_stride, batch_size=len(texts))
+
+    def _infer(self, text: str) -> List[Dict]:
+        if self._batcher is not None:
+            entities = self._batcher.submit(text)
+        else:
+            entities = self._pipeline(text, stride=self.chunk_stride)
+
+        if self._fp32_pipeline is not None:
+            entities = self._rescore_uncertain(text, entities)
+        return entities
+
+    def _infer_many(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Entities of several texts: through the batcher (all queued at once)
+        when it's enabled, else in padded batches of up to
+        ``max_batch_size`` texts, ordered by length so each batch pads to a
+        similar length.
+        """
+        results: List[List[Dict]]
+        if self._batcher is not None:
+            results = self._batcher.submit_many(texts)
+        else:
+            results = [[] for _ in texts]
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            for offset in range(0, len(order), self.max_batch_size):
+                chunk = order[offset:offset + self.max_batch_size]
+                for index, entities in zip(chunk, self._infer_batch([texts[i] for i in chunk])):
+                    results[index] = entities
+
+        if self._fp32_pipeline is not None:
+            results = [self._rescore_uncertain(text, entities) for text, entities in zip(texts, results)]
+        return results
+
+    def _plan(self, text: str) -> List[List[Span]]:
+        """
+        The stretches of ``text`` to run the model on, each as the list of
+        segments it's cut into: with gating, only the regions that may hold
+        a name (the rest counted as skipped, by segment class); with
+        segmentation, long regions cut into overlapping sentence-aligned
+        segments of about ``chunk_tokens``.
+        """
+        if self.gate_skip is None:
+            regions = [(0, len(text))]
+        else:
+            regions, skipped = ner_regions(text, self.gate_skip)
+            with self._gate_lock:
+                self._gate_inferred_chars += sum(end - start for start, end in regions)
+                for start, end, cls in skipped:
+                    self._gate_skipped_chars[cls] += end - start
+
+        if self.segment_min_chars is None:
+            return [[region] for region in regions]
+        return [
+            [(start + s, start + e) for s, e in split_segments(text[start:end], self.segment_chars, self.segment_overlap_chars)]
+            if end - start > self.segment_min_chars else [(start, end)]
+            for start, end in regions
+        ]
+
+    def _infer_planned(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Entities of texts run through :meth:`_plan`. The segments of all
+        texts run as one batch — or, with several segment workers, as that
+        many batches at once — instead of one text's windows one after
+        another; each region's entities are stitched back together at its
+        seams and put back at their offsets in the text.
+        """
+        plans = [self._plan(text) for text in texts]
+        pieces = [text[start:end] for text, plan in zip(texts, plans) for segments in plan for start, end in segments]
+
+        if not pieces:
+            entities: List[List[Dict]] = []
+        elif self._segment_executor is None or len(pieces) < 2:
+            entities = self._infer_many(pieces)
+        else:
+            workers = min(self.segment_workers, len(pieces))
+            groups = [list(range(offset, len(pieces), workers)) for offset in range(workers)]
+            futures = [self._segment_executor.submit(self._infer_many, [pieces[i] for i in group]) for group in groups]
+            entities = [[] for _ in pieces]
+            for group, future in zip(groups, futures):
+                for index, piece_entities in zip(group, future.result()):
+                    entities[index] = piece_entities
+
+        results = []
+        offset = 0
+        for plan in plans:
+            text_entities: List[Dict] = []
+            for segments in plan:
+                text_entities.extend(stitch_entities(segments, entities[offset:offset + len(segments)]))
+                offset += len(segments)
+            results.append(text_entities)
+        return results
+
+    def _rescore_uncertain(self, text: str, entities: List[Dict]) -> List[Dict]:
+        """
+        int8 cascade: spans the quantized model is unsure about are
+        re-detected by the full-precision model, on just the windows
+        around them rather than the whole text.
+        """
+        windows = uncertain_windows(text, entities, self.cascade_threshold, self.cascade_context_chars)
+        if not windows:
+            return entities
+
+        with self._cascade_lock:
+            self._cascade_windows += len(windows)
+            self._cascade_chars += sum(end - start for start, end in windows)
+
+        return rescore_windows(
+            text, entities, windows,
+            lambda window: self._fp32_pipeline(window, stride=self.chunk_stride),
+        )
+
+    def fingerprint(self) -> str:
+        """Settings that change what this detector finds, for detection caching."""
+        cascade = f"{self.cascade_threshold}/{self.cascade_context_chars}" if self._fp32_pipeline is not None else "off"
+        segments = f"{self.segment_min_chars}" if self.segment_min_chars is not None else "off"
+        gate = ",".join(sorted(self.gate_skip)) if self.gate_skip is not None else "off"
+        return (
+            f"{self.model_name};engine={self.engine};quantization={self.quantization};cascade={cascade};"
+            f"chunk={self.chunk_tokens}/{self.chunk_stride};segments={segments};gate={gate}"
+        )
+
+    def stats(self) -> Dict:
+        """Runtime statistics for whichever optional NER features are enabled."""
+        stats: Dict = {}
+        if self._batcher is not None:
+            stats["batching"] = self._batcher.stats()
+        if self._fp32_pipeline is not None:
+            with self._cascade_lock:
+                stats["int8_cascade"] = {
+                    "rescored_windows": self._cascade_windows,
+                    "rescored_chars": self._cascade_chars,
+                }
+        if self.gate_skip is not None:
+            with self._gate_lock:
+                skipped = dict(self._gate_skipped_chars)
+                inferred = self._gate_inferred_chars
+            total = inferred + sum(skipped.values())
+            stats["gating"] = {
+                "inferred_chars": inferred,
+                "skipped_chars": skipped,
+                "skipped_share": 1 - inferred / total if total else 0.0,
+            }
+        return stats
+
     def detect(self, text: str) -> List[PIIToken]:
         """
         Detects PII in the given text using radlab/pii-pl-v1.0.
         """
         if not text:
             return []
+        if self.gate_skip is not None or (self.segment_min_chars is not None and len(text) > self.segment_min_chars):
+            return self._to_tokens(text, self._infer_planned([text])[0])
+        return self._to_tokens(text, self._infer(text))
+
+    def detect_batch(self, texts: List[str]) -> List[List[PIIToken]]:
+        """
+        Detects PII in several texts with batched forward passes instead of
+        one per text.
+        """
+        results: List[List[PIIToken]] = [[] for _ in texts]
+        pending = [index for index, text in enumerate(texts) if text]
+        if not pending:
+            return results
+        infer = self._infer_many if self.gate_skip is None and self.segment_min_chars is None else self._infer_planned
+        for index, entities in zip(pending, infer([texts[i] for i in pending])):
+            results[index] = self._to_tokens(texts[index], entities)
+        return results
 
-        entities = self._pipeline(text, stride=self.chunk_stride)
+    @staticmethod
+    def _to_tokens(text: str, entities: List[Dict]) -> List[PIIToken]:
         entities = _extend_location_prefixes(text, entities)
         entities = _merge_adjacent_entities(text, entities)
 
@@ -0,0 +1,140 @@
+import re
+from typing import Iterable, List, Tuple
+
+from .segmentation import Span
+
+Segment = Tuple[int, int, str]
+
+PROSE = "prose"
+# Classes of segment the NER model can be spared, as text unlikely to hold
+# a person, location or organization name the model would find.
+SEGMENT_CLASSES = ("code", "structured", "blob", "lowercase", "sentence_case")
+
+_FENCE = re.compile(r"^[ \t]*(`{3,}|~{3,})[^\n]*\n.*?^[ \t]*\1[ \t]*$\n?", re.MULTILINE | re.DOTALL)
+_LINE = re.compile(r"[^\n]*\n?")
+# A line of a JSON document, a YAML/markup structure or a Markdown table.
+_STRUCTURED_LINE = re.compile(r'^\s*(?:[{}\[\]|<]|"[^"\n]*"\s*:|[\w.-]+:\s*[\[{]?\s*$)')
+# A URL, or a long run of base64/hex/hash-like characters.
+_BLOB_WORD = re.compile(r"(?:[a-z][a-z0-9+.-]*://\S+|www\.\S+|[A-Za-z0-9+/=_\-]{24,})")
+_WORD = re.compile(r"[^\W\d_]+")
+# Characters between a sentence end (or the line start) and its first word.
+_LEAD = " \t\"'„”«»()[]*-–—•>#"
+_SENTENCE_END = ".!?…"
+# Polish names that are written in lowercase: "województwo małopolskie".
+_LOWERCASE_NAME_WORDS = frozenset({"województwo", "województwa", "województwie", "powiat", "powiatu", "gmina", "gminy", "gminie"})
+# Abbreviations after which a capitalized word continues the sentence, e.g.
+# "ul. Kwiatowa", "dr Nowak": that word is a name, not a sentence start.
+_ABBREVIATIONS = frozenset({"ul", "al", "pl", "os", "dr", "prof", "inż", "mgr", "św", "gen", "płk", "ks", "im", "tzw", "woj", "pow", "gm"})
+
+
+def _is_sentence_start(line: str, position: int) -> bool:
+    before = line[:position].rstrip(_LEAD)
+    if not before:
+        return True
+    if before[-1] not in _SENTENCE_END:
+        return False
+    previous = _WORD.findall(before[-12:])
+    return not (before[-1] == "." and previous and previous[-1].lower() in _ABBREVIATIONS)
+
+
+def _capitals(line: str) -> str:
+    """
+    "none" if no word of the line starts with a capital, "sentence_starts"
+    if only the first words of sentences do, else "names".
+    """
+    found = "none"
+    for match in _WORD.finditer(line):
+        word = match.group()
+        if word.lower() in _LOWERCASE_NAME_WORDS:
+            return "names"
+        if word[0].isupper():
+            if not _is_sentence_start(line, match.start()):
+                return "names"
+            found = "sentence_starts"
+    return found
+
+
+def _is_structured(line: str) -> bool:
+    if _STRUCTURED_LINE.match(line):
+        return True
+    visible = [c for c in line if not c.isspace()]
+    letters = sum(c.isalpha() for c in visible)
+    # Rows of numbers, amounts, timestamps and the like.
+    return len(visible) >= 8 and letters * 4 < len(visible)
+
+
+def _is_blob(line: str) -> bool:
+    words = line.split()
+    return bool(words) and all(_BLOB_WORD.fullmatch(word) for word in words)
+
+
+def classify_line(line: str) -> str:
+    """The class of one line of text outside a code fence."""
+    if _is_blob(line):
+        return "blob"
+    capitals = _capitals(line)
+    if capitals == "names":
+        return PROSE
+    if _is_structured(line):
+        return "structured"
+    return "lowercase" if capitals == "none" else "sentence_case"
+
+
+def classify_segments(text: str) -> List[Segment]:
+    """
+    Cuts ``text`` into consecutive ``(start, end, class)`` segments covering
+    all of it: fenced code blocks are "code", and every other line is
+    "blob" (only URLs or base64/hash-like strings), "prose" (a word other
+    than a sentence's first is capitalized, or a lowercase name such as
+    "województwo ..." appears), "structured" (JSON, markup or table rows,
+    or mostly digits and symbols), "lowercase" (no capitalized word) or
+    "sentence_case" (capitalized only at sentence starts — which may be a
+    name: "Karolina zgłosiła awarię."). Consecutive lines
+    of the same class are one segment; blank lines go with the segment
+    before them.
+    """
+    segments: List[Segment] = []
+
+    def add(start: int, end: int, cls: str) -> None:
+        if segments and segments[-1][2] == cls and segments[-1][1] == start:
+            segments[-1] = (segments[-1][0], end, cls)
+        else:
+            segments.append((start, end, cls))
+
+    def add_lines(start: int, end: int) -> None:
+        for match in _LINE.finditer(text, start, end):
+            if match.start() == match.end():
+                break
+            line = match.group()
+            if not line.strip() and segments and segments[-1][1] == match.start():
+                cls = segments[-1][2]
+            else:
+                cls = classify_line(line)
+            add(match.start(), match.end(), cls)
+
+    position = 0
+    for fence in _FENCE.finditer(text):
+        add_lines(position, fence.start())
+        add(fence.start(), fence.end(), "code")
+        position = fence.end()
+    add_lines(position, len(text))
+    return segments
+
+
+def ner_regions(text: str, skip: Iterable[str]) -> Tuple[List[Span], List[Segment]]:
+    """
+    The stretches of ``text`` the NER model should see — runs of segments
+    whose class isn't in ``skip``, joined so the model keeps the context
+    across their lines — and the segments left out.
+    """
+    skip = frozenset(skip)
+    regions: List[Span] = []
+    skipped: List[Segment] = []
+    for start, end, cls in classify_segments(text):
+        if cls in skip:
+            skipped.append((start, end, cls))
+        elif regions and regions[-1][1] == start:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions, skipped
@@ -0,0 +1,78 @@
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_ONNX_FILE = "model.onnx"
+
+
+def export_dir_for(model_name: str, cache_dir: str) -> Path:
+    """Directory holding the cached ONNX export of ``model_name``."""
+    return Path(cache_dir) / model_name.replace("/", "__")
+
+
+def _export(model_name: str, target: Path) -> None:
+    """
+    Exports the Hugging Face checkpoint to ONNX into ``target``.
+
+    The export is written to a temporary sibling directory first and only
+    then renamed into place, so several workers starting at once never
+    load a half-written model: whichever finishes first wins, the rest
+    discard their own copy.
+    """
+    from optimum.onnxruntime import ORTModelForTokenClassification
+    from transformers import AutoTokenizer
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    try:
+        logger.info(f"Exporting {model_name} to ONNX (one-off, cached at {target})")
+        model = ORTModelForTokenClassification.from_pretrained(model_name, export=True)
+        model.save_pretrained(staging)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(staging)
+        try:
+            os.rename(staging, target)
+        except OSError:
+            if not (target / _ONNX_FILE).exists():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def load_onnx_pipeline(model_name: str, cache_dir: str):
+    """
+    Builds a ``transformers`` NER pipeline backed by onnxruntime instead of
+    PyTorch, exporting the model to ONNX on first use.
+
+    The pipeline object itself is the same ``TokenClassificationPipeline``
+    the PyTorch path uses: only the forward pass is swapped out, so the
+    stride windowing, sub-token aggregation and everything PiiPlDetector
+    does on top of it are shared with the PyTorch engine, not reimplemented.
+    """
+    from onnxruntime import GraphOptimizationLevel, SessionOptions
+    from optimum.onnxruntime import ORTModelForTokenClassification
+    from transformers import AutoTokenizer, pipeline
+
+    export_dir = export_dir_for(model_name, cache_dir)
+    if not (export_dir / _ONNX_FILE).exists():
+        _export(model_name, export_dir)
+
+    session_options = SessionOptions()
+    session_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    model = ORTModelForTokenClassification.from_pretrained(
+        export_dir,
+        session_options=session_options,
+        provider="CPUExecutionProvider",
+    )
+    tokenizer = AutoTokenizer.from_pretrained(export_dir)
+
+    return pipeline(
+        "ner",
+        model=model,
+        tokenizer=tokenizer,
+        aggregation_strategy="simple",
+    )
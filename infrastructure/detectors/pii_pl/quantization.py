@@ -0,0 +1,107 @@
+import copy
+import re
+from typing import Callable, Dict, List, Tuple
+
+_WHITESPACE_PATTERN = re.compile(r"\s")
+
+Window = Tuple[int, int]
+
+
+def quantize_pipeline(ner_pipeline):
+    """
+    Returns a copy of ``ner_pipeline`` whose Linear layers are dynamically
+    quantized to int8 (weights stored as int8, activations quantized on
+    the fly). The original fp32 pipeline is left untouched, so it can
+    still be kept around for the rescoring cascade — or simply dropped to
+    reclaim its memory.
+
+    Dynamic quantization is a CPU-only technique, so the quantized
+    pipeline always runs on CPU. ``quantize_dynamic`` copies a CPU model
+    itself; a model on another device is copied to CPU first (``.to`` would
+    move the fp32 one) and that private copy is quantized in place, so
+    there is only ever one extra copy of the weights.
+    """
+    import torch
+    from transformers import pipeline
+
+    model = ner_pipeline.model
+    on_cpu = model.device.type == "cpu"
+    if not on_cpu:
+        model = copy.deepcopy(model).to("cpu")
+    quantized_model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=not on_cpu
+    )
+    return pipeline(
+        "ner",
+        model=quantized_model,
+        tokenizer=ner_pipeline.tokenizer,
+        aggregation_strategy="simple",
+        device=-1,
+    )
+
+
+def _snap_to_whitespace(text: str, start: int, end: int) -> Window:
+    """Widens [start, end) outwards so it doesn't cut through a word."""
+    while start > 0 and not _WHITESPACE_PATTERN.match(text[start - 1]):
+        start -= 1
+    while end < len(text) and not _WHITESPACE_PATTERN.match(text[end]):
+        end += 1
+    return start, end
+
+
+def _merge_windows(windows: List[Window]) -> List[Window]:
+    merged: List[Window] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def uncertain_windows(text: str, entities: List[Dict], threshold: float, context_chars: int) -> List[Window]:
+    """
+    Text windows around every entity scored below ``threshold``, padded
+    with ``context_chars`` of context on each side and widened to word
+    boundaries. Any other entity that straddles a window's edge is pulled
+    into the window whole, so rescoring never has to splice a span that
+    is half inside and half outside of it.
+    """
+    windows = _merge_windows([
+        _snap_to_whitespace(text, max(0, e["start"] - context_chars), min(len(text), e["end"] + context_chars))
+        for e in entities
+        if e["score"] < threshold
+    ])
+    if not windows:
+        return []
+
+    widened = []
+    for start, end in windows:
+        for e in entities:
+            if e["start"] < end and e["end"] > start:
+                start, end = min(start, e["start"]), max(end, e["end"])
+        widened.append((start, end))
+    return _merge_windows(widened)
+
+
+def rescore_windows(
+    text: str,
+    entities: List[Dict],
+    windows: List[Window],
+    infer: Callable[[str], List[Dict]],
+) -> List[Dict]:
+    """
+    Replaces every entity inside ``windows`` with what ``infer`` (the
+    full-precision pipeline) finds when run on just that window, shifted
+    back to offsets in ``text``. Entities outside all windows are kept
+    as-is.
+    """
+    kept = [
+        e for e in entities
+        if not any(e["start"] < end and e["end"] > start for start, end in windows)
+    ]
+    for start, end in windows:
+        for e in infer(text[start:end]):
+            kept.append({**e, "start": e["start"] + start, "end": e["end"] + start})
+
+    return sorted(kept, key=lambda e: e["start"])
@@ -0,0 +1,78 @@
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Tuple
+
+Span = Tuple[int, int]
+
+# Where a segment may start: after a blank line, a line break or the end
+# of a sentence (including the whitespace that follows).
+_BOUNDARY = re.compile(r"\n\s*|(?<=[.!?…])\s+")
+
+
+def split_segments(text: str, max_chars: int, overlap_chars: int) -> List[Span]:
+    """
+    Splits a long text into segments of at most ``max_chars`` characters
+    that end and start on paragraph or sentence boundaries where possible
+    (else on whitespace, else anywhere), each overlapping the previous one
+    by about ``overlap_chars`` so an entity at a seam is seen whole by at
+    least one segment.
+
+    Returns the ``(start, end)`` of each segment, in order, covering the
+    whole text; a text no longer than ``max_chars`` is one segment.
+    """
+    n = len(text)
+    if n <= max_chars:
+        return [(0, n)]
+    overlap_chars = min(overlap_chars, max_chars // 4)
+    boundaries = [m.end() for m in _BOUNDARY.finditer(text)]
+
+    segments: List[Span] = []
+    start = 0
+    while True:
+        limit = start + max_chars
+        if limit >= n:
+            segments.append((start, n))
+            return segments
+
+        end = _cut_before(text, boundaries, start + max_chars // 2, limit)
+        segments.append((start, end))
+        start = _cut_after(text, boundaries, end - overlap_chars, end)
+
+
+def _cut_before(text: str, boundaries: List[int], lowest: int, limit: int) -> int:
+    """The last boundary in ``(lowest, limit]``, else the last space, else ``limit``."""
+    index = bisect_right(boundaries, limit) - 1
+    if index >= 0 and boundaries[index] > lowest:
+        return boundaries[index]
+    space = text.rfind(" ", lowest, limit)
+    return space + 1 if space != -1 else limit
+
+
+def _cut_after(text: str, boundaries: List[int], earliest: int, end: int) -> int:
+    """The first boundary in ``[earliest, end)``, else the first space, else ``earliest``."""
+    index = bisect_left(boundaries, earliest)
+    if index < len(boundaries) and boundaries[index] < end:
+        return boundaries[index]
+    space = text.find(" ", earliest, end)
+    return space + 1 if space != -1 else earliest
+
+
+def stitch_entities(segments: List[Span], segment_entities: List[List[Dict]]) -> List[Dict]:
+    """
+    Puts the entities found in each segment back into whole-text offsets,
+    keeping each one only from the segment that owns where it starts: the
+    seam between two overlapping segments is the middle of their overlap,
+    so an entity near a segment's cut edge (possibly truncated there) is
+    taken from the neighbour that sees it with context on both sides, and
+    none is reported twice.
+    """
+    seams = [(segments[i][1] + segments[i + 1][0]) // 2 for i in range(len(segments) - 1)]
+    stitched: List[Dict] = []
+    for index, ((offset, _), entities) in enumerate(zip(segments, segment_entities)):
+        lowest = seams[index - 1] if index > 0 else 0
+        for entity in entities:
+            start = entity["start"] + offset
+            if start < lowest or (index < len(seams) and start >= seams[index]):
+                continue
+            stitched.append({**entity, "start": start, "end": entity["end"] + offset})
+    return stitched
@@ -0,0 +1,68 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from domain.entities.pii_token import PIIToken
+from domain.enums.pii_type import PIIType
+from domain.interfaces.pii_detector import PIIDetector
+from domain.services.anonymizer_service import detect_batch
+
+# Detectors built in this (worker) process, by their pickled factory.
+_DETECTORS: Dict[bytes, PIIDetector] = {}
+
+
+def _detect_in_process(factory: bytes, texts: List[str]) -> List[List[Tuple[int, int, PIIType]]]:
+    detector = _DETECTORS.get(factory)
+    if detector is None:
+        detector = _DETECTORS[factory] = pickle.loads(factory)()
+    return [
+        [(token.start, token.end, token.type) for token in tokens]
+        for tokens in detect_batch(detector, texts)
+    ]
+
+
+class ProcessPoolDetector(PIIDetector):
+    """
+    Runs a pure-Python detector in a pool of worker processes, so its
+    regex and checksum work doesn't hold this process's GIL while the NER
+    detector runs alongside it.
+
+    ``factory`` (picklable: a detector class, or a ``functools.partial`` of
+    one) builds the detector once per worker process, on first use (so
+    a worker's first call also pays for starting it). Only the texts go
+    out and only spans come back. Per-process state such as
+    the phone validator's memo and counters stays in the workers, so it
+    isn't reported in this process's metrics.
+
+    A local instance — ``detector`` if given, else one ``factory`` builds —
+    serves :meth:`fingerprint` and callers that need the detector itself
+    (e.g. the hallucination guard, which runs in-process).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], PIIDetector],
+        executor: ProcessPoolExecutor,
+        detector: Optional[PIIDetector] = None,
+    ) -> None:
+        self.executor = executor
+        self.detector = detector if detector is not None else factory()
+        self.name = f"{type(self.detector).__name__}@process"
+        self._factory = pickle.dumps(factory)
+
+    def fingerprint(self) -> str:
+        fingerprint = getattr(self.detector, "fingerprint", None)
+        return fingerprint() if callable(fingerprint) else ""
+
+    def detect(self, text: str) -> List[PIIToken]:
+        return self.detect_batch([text])[0]
+
+    def detect_batch(self, texts: List[str]) -> List[List[PIIToken]]:
+        """Detects in all of ``texts`` with one round trip to a worker process."""
+        spans = self.executor.submit(_detect_in_process, self._factory, texts).result()
+        return [
+            [
+                PIIToken(type=pii_type, original_value=text[start:end], token_str="", start=start, end=end)
+                for start, end, pii_type in text_spans
+            ]
+            for text, text_spans in zip(texts, spans)
+        ]
@@ -1,16 +1,31 @@
 import re
-from typing import List
+from typing import List, Optional
 from domain.entities.pii_token import PIIToken
 from domain.enums.pii_type import PIIType
 from domain.interfaces.pii_detector import PIIDetector
 from infrastructure.detectors.validators import is_valid_regon
 from domain.services.token_overlap import remove_overlapping_tokens
 
-_PATTERNS = [
+REGON_PATTERNS = [
     re.compile(r"\b\d{14}\b"),
     re.compile(r"\b\d{9}\b"),
 ]
 
+
+def regon_token(text: str, start: int, end: int) -> Optional[PIIToken]:
+    """The REGON token for a candidate span, or None if its checksum fails."""
+    val = text[start:end]
+    if not is_valid_regon(val):
+        return None
+
+    return PIIToken(
+        type=PIIType.REGON,
+        original_value=val,
+        token_str="",
+        start=start,
+        end=end,
+    )
+
 class RegonDetector(PIIDetector):
     """Detects Polish business registry numbers (REGON, 9 or 14 digits) in text."""
 
@@ -26,20 +41,10 @@ class RegonDetector(PIIDetector):
         """
         tokens: List[PIIToken] = []
 
-        for pattern in _PATTERNS:
+        for pattern in REGON_PATTERNS:
             for match in pattern.finditer(text):
-                val = match.group()
-                if not is_valid_regon(val):
-                    continue
-
-                tokens.append(
-                    PIIToken(
-                        type=PIIType.REGON,
-                        original_value=val,
-                        token_str="",
-                        start=match.start(),
-                        end=match.end(),
-                    )
-                )
+                token = regon_token(text, *match.span())
+                if token is not None:
+                    tokens.append(token)
 
         return remove_overlapping_tokens(tokens)
@@ -0,0 +1,100 @@
+import json
+import logging
+import socket
+import threading
+from typing import Dict, List
+from domain.entities.pii_token import PIIToken
+from domain.interfaces.pii_detector import PIIDetector
+from infrastructure.ner_server.protocol import (
+    OP_DETECT,
+    OP_STATS,
+    STATUS_OK,
+    NerServerError,
+    decode_spans,
+    encode_texts,
+    recv_frame,
+    send_frame,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteNerDetector(PIIDetector):
+    """
+    Thin client for the host-local NER inference server
+    (``python -m infrastructure.ner_server.server``): sends text over a
+    Unix domain socket and rebuilds the returned spans as PIITokens.
+
+    Never loads the model or imports torch, so a worker using it starts
+    in a fraction of the time and memory of one running PiiPlDetector.
+
+    Each calling thread keeps its own persistent connection (detection runs
+    on executor threads, several at once); a dropped connection is
+    re-established once per call before giving up.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self._local.sock = sock
+        return sock
+
+    def _disconnect(self) -> None:
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+
+    def _request(self, opcode: int, payload: bytes) -> bytes:
+        for attempt in (1, 2):
+            sock = getattr(self._local, "sock", None) or self._connect()
+            try:
+                send_frame(sock, opcode, payload)
+                status, response = recv_frame(sock)
+                break
+            except (ConnectionError, OSError) as e:
+                self._disconnect()
+                if attempt == 2:
+                    raise
+                logger.warning(f"Lost connection to NER server at {self.socket_path}, reconnecting: {e}")
+
+        if status != STATUS_OK:
+            raise NerServerError(response.decode("utf-8", errors="replace"))
+        return response
+
+    def detect(self, text: str) -> List[PIIToken]:
+        """
+        Detects PII in the given text via the NER inference server.
+        """
+        if not text:
+            return []
+        texts = [text]
+        return decode_spans(self._request(OP_DETECT, encode_texts(texts)), texts)[0]
+
+    def detect_batch(self, texts: List[str]) -> List[List[PIIToken]]:
+        """
+        Detects PII in several texts with one round trip; the server's
+        detector gets them as one batch.
+        """
+        results: List[List[PIIToken]] = [[] for _ in texts]
+        pending = [index for index, text in enumerate(texts) if text]
+        if not pending:
+            return results
+        sent = [texts[i] for i in pending]
+        for index, tokens in zip(pending, decode_spans(self._request(OP_DETECT, encode_texts(sent)), sent)):
+            results[index] = tokens
+        return results
+
+    def fingerprint(self) -> str:
+        """Identifies the server this client talks to, for detection caching."""
+        return self.socket_path
+
+    def stats(self) -> Dict:
+        """Runtime statistics reported by the server's own detector."""
+        return {"server": json.loads(self._request(OP_STATS, b""))}
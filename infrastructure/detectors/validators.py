@@ -1,3 +1,7 @@
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
 _PESEL_WEIGHTS = (1, 3, 7, 9, 1, 3, 7, 9, 1, 3)
 _NIP_WEIGHTS = (6, 5, 7, 2, 3, 4, 5, 6, 7)
 _REGON9_WEIGHTS = (8, 9, 2, 3, 4, 5, 6, 7)
@@ -63,3 +67,107 @@ def is_valid_iban_checksum(code: str) -> bool:
         return False
 
     return int(numeric) % 97 == 1
+
+
+# Batch variants: the same checks over many candidates at once, as NumPy
+# digit matrices (one row per candidate). They return a boolean array
+# matching the scalar validator on every candidate; anything that isn't
+# plain ASCII goes through the scalar validator instead.
+
+_ZERO = ord("0")
+
+
+def _digit_matrix(candidates: Sequence[str], length: int) -> np.ndarray:
+    return np.frombuffer("".join(candidates).encode("ascii"), dtype=np.uint8).reshape(-1, length).astype(np.int64) - _ZERO
+
+
+def _batch(candidates: Sequence[str], vectorized: Dict[int, Callable[[np.ndarray], np.ndarray]], scalar: Callable[[str], bool]) -> np.ndarray:
+    """
+    Validates the ASCII-digit candidates of each length in ``vectorized``
+    with its row check, and every other candidate with ``scalar``.
+    """
+    result = np.zeros(len(candidates), dtype=bool)
+    by_length: Dict[int, List[int]] = {}
+    for i, candidate in enumerate(candidates):
+        if len(candidate) in vectorized and candidate.isascii() and candidate.isdigit():
+            by_length.setdefault(len(candidate), []).append(i)
+        else:
+            result[i] = scalar(candidate)
+    for length, indices in by_length.items():
+        result[indices] = vectorized[length](_digit_matrix([candidates[i] for i in indices], length))
+    return result
+
+
+def _mod11_check(digits: np.ndarray, weights: Sequence[int]) -> np.ndarray:
+    checksum = digits[:, :len(weights)] @ np.asarray(weights, dtype=np.int64) % 11
+    checksum[checksum == 10] = 0
+    return checksum == digits[:, len(weights)]
+
+
+def _pesel_rows(d: np.ndarray) -> np.ndarray:
+    checksum = d[:, :10] @ np.asarray(_PESEL_WEIGHTS, dtype=np.int64) % 10
+    month = (d[:, 2] * 10 + d[:, 3]) % 20
+    day = d[:, 4] * 10 + d[:, 5]
+    return ((10 - checksum) % 10 == d[:, 10]) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31)
+
+
+def _nip_rows(d: np.ndarray) -> np.ndarray:
+    checksum = d[:, :9] @ np.asarray(_NIP_WEIGHTS, dtype=np.int64) % 11
+    return (checksum != 10) & (checksum == d[:, 9])
+
+
+def _regon9_rows(d: np.ndarray) -> np.ndarray:
+    return _mod11_check(d, _REGON9_WEIGHTS)
+
+
+def _regon14_rows(d: np.ndarray) -> np.ndarray:
+    return _mod11_check(d, _REGON9_WEIGHTS) & _mod11_check(d, _REGON14_WEIGHTS)
+
+
+def is_valid_pesel_batch(candidates: Sequence[str]) -> np.ndarray:
+    return _batch(candidates, {11: _pesel_rows}, is_valid_pesel)
+
+
+def is_valid_nip_batch(candidates: Sequence[str]) -> np.ndarray:
+    return _batch(candidates, {10: _nip_rows}, is_valid_nip)
+
+
+def is_valid_regon_batch(candidates: Sequence[str]) -> np.ndarray:
+    return _batch(candidates, {9: _regon9_rows, 14: _regon14_rows}, is_valid_regon)
+
+
+_BASE36 = np.full(256, -1, dtype=np.int64)
+_BASE36[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+_BASE36[np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)] = np.arange(10, 36)
+_BASE36[np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)] = np.arange(10, 36)
+
+
+def _iban_rows(codes: np.ndarray) -> np.ndarray:
+    """
+    MOD 97-10 over a matrix of equal-length ASCII codes, column by column
+    in Horner form — a digit shifts the remainder by 10, a letter (two
+    decimal digits, 10-35) by 100 — instead of building one big integer
+    per code.
+    """
+    values = _BASE36[codes]
+    rearranged = np.concatenate([values[:, 4:], values[:, :4]], axis=1)
+    remainder = np.zeros(len(codes), dtype=np.int64)
+    for column in rearranged.T:
+        remainder = (remainder * np.where(column >= 10, 100, 10) + column) % 97
+    head = values[:, :4]
+    well_formed = (head[:, :2] >= 10).all(axis=1) & (head[:, 2:] < 10).all(axis=1) & (values >= 0).all(axis=1)
+    return well_formed & (remainder == 1)
+
+
+def is_valid_iban_checksum_batch(codes: Sequence[str]) -> np.ndarray:
+    result = np.zeros(len(codes), dtype=bool)
+    by_length: Dict[int, List[int]] = {}
+    for i, code in enumerate(codes):
+        if len(code) >= 4 and code.isascii():
+            by_length.setdefault(len(code), []).append(i)
+        else:
+            result[i] = is_valid_iban_checksum(code)
+    for length, indices in by_length.items():
+        matrix = np.frombuffer("".join(codes[i] for i in indices).encode("ascii"), dtype=np.uint8).reshape(-1, length)
+        result[indices] = _iban_rows(matrix)
+    return result
@@ -1,6 +1,6 @@
 import re
 from io import BytesIO
-from typing import Callable, Iterator, Union
+from typing import Iterator, List, Union
 from docx import Document
 from docx.oxml.ns import qn
 from docx.table import Table
@@ -20,8 +20,14 @@ def _iter_block_items(document: Document) -> Iterator[Union[Paragraph, Table]]:
             yield Table(child, document)
 
 
-def _paragraph_to_markdown(paragraph: Paragraph, anonymize_text: Callable[[str], str]) -> str:
-    text = anonymize_text(paragraph.text)
+def _block_texts(block: Union[Paragraph, Table]) -> List[str]:
+    """The texts of a block to anonymize: a paragraph's text, or each cell of a table row by row."""
+    if isinstance(block, Paragraph):
+        return [block.text]
+    return [cell.text for row in block.rows for cell in row.cells]
+
+
+def _paragraph_to_markdown(paragraph: Paragraph, text: str) -> str:
     if not text.strip():
         return ""
 
@@ -39,9 +45,9 @@ def _paragraph_to_markdown(paragraph: Paragraph, anonymize_text: Callable[[str],
     return text
 
 
-def _table_to_markdown(table: Table, anonymize_text: Callable[[str], str]) -> str:
+def _table_to_markdown(table: Table, cell_texts: Iterator[str]) -> str:
     rows = [
-        [anonymize_text(cell.text).replace("\n", " ").replace("|", "\\|") for cell in row.cells]
+        [next(cell_texts).replace("\n", " ").replace("|", "\\|") for _ in row.cells]
         for row in table.rows
     ]
     if not rows:
@@ -57,14 +63,18 @@ class DocxProcessor(DocumentProcessor):
 
     def process(self, file_content: bytes, anonymizer: AnonymizerService) -> str:
         doc = Document(BytesIO(file_content))
-        anonymize_text = anonymizer.scoped()
+        items = list(_iter_block_items(doc))
+
+        # Every paragraph and cell is detected together, numbered in
+        # document order, before the markdown is built.
+        anonymized = iter(anonymizer.scoped_batch()([text for block in items for text in _block_texts(block)]))
 
         blocks = []
-        for block in _iter_block_items(doc):
+        for block in items:
             if isinstance(block, Paragraph):
-                markdown_block = _paragraph_to_markdown(block, anonymize_text)
+                markdown_block = _paragraph_to_markdown(block, next(anonymized))
             else:
-                markdown_block = _table_to_markdown(block, anonymize_text)
+                markdown_block = _table_to_markdown(block, anonymized)
 
             if markdown_block:
                 blocks.append(markdown_block)
@@ -50,15 +50,14 @@ class PdfProcessor(DocumentProcessor):
     """Concrete implementation for PDF processing using pdfplumber."""
 
     def process(self, file_content: bytes, anonymizer: AnonymizerService) -> str:
-        anonymize_text = anonymizer.scoped()
-
-        pages_markdown = []
+        pages = []
         with pdfplumber.open(BytesIO(file_content)) as pdf:
             for page in pdf.pages:
                 raw_text = page.extract_text() or ""
                 text = _reflow_page_text(raw_text)
                 if not text.strip():
                     continue
-                pages_markdown.append(anonymize_text(text))
+                pages.append(text)
 
-        return "\n\n---\n\n".join(pages_markdown)
+        # All pages are detected together, numbered in page order.
+        return "\n\n---\n\n".join(anonymizer.scoped_batch()(pages))
@@ -0,0 +1,46 @@
+import os
+from typing import Optional
+from domain.services.detection_cache import DetectionCache
+from infrastructure.cache.memory_backend import MemoryCacheBackend
+from infrastructure.cache.resp_backend import RespCacheBackend
+from infrastructure.cache.sqlite_backend import SqliteCacheBackend
+from api.config.config import settings
+
+def create_detection_cache() -> Optional[DetectionCache]:
+    """
+    Creates the detection cache with the backend selected in configuration.
+
+    Returns:
+        Optional[DetectionCache]: The cache, or None if caching is disabled.
+
+    Raises:
+        ValueError: If configuration is invalid.
+    """
+    if not settings.detection_cache_enabled:
+        return None
+
+    backend_type = settings.detection_cache_backend.lower()
+
+    if backend_type == "memory":
+        backend = MemoryCacheBackend(settings.detection_cache_max_entries)
+    elif backend_type == "sqlite":
+        backend = SqliteCacheBackend(settings.detection_cache_sqlite_path, settings.detection_cache_max_entries)
+    elif backend_type == "redis":
+        backend = RespCacheBackend(
+            settings.detection_cache_redis_url,
+            timeout=settings.detection_cache_redis_timeout_ms / 1000,
+        )
+    else:
+        raise ValueError(f"Unknown detection cache backend: {backend_type}")
+
+    if settings.detection_cache_key_secret:
+        key_secret = settings.detection_cache_key_secret.encode("utf-8")
+    elif backend_type == "memory":
+        # Nothing outside this process ever sees the keys.
+        key_secret = os.urandom(32)
+    else:
+        raise ValueError(
+            f"DETECTION_CACHE_KEY_SECRET must be set for the shared {backend_type} detection cache backend"
+        )
+
+    return DetectionCache(backend, settings.detection_cache_ttl_seconds, key_secret, backend_type)
@@ -14,12 +14,25 @@ from litellm.exceptions import (
 
 from api.config.config import settings
 from domain.entities.llm_response import LLMResponse, ToolCall
+from domain.entities.placeholder_format import DEFAULT_PLACEHOLDER_FORMAT, PlaceholderFormat
 from domain.entities.stream_delta import StreamDelta, ToolCallDelta
 from domain.entities.usage import Usage
 from domain.exceptions.llm_provider_error import LLMProviderError
 from domain.interfaces.llm_provider import LLMProvider
 
 
+def _cached_tokens(raw_usage) -> int:
+    """
+    Prompt-cache hits, reported as ``prompt_tokens_details.cached_tokens``
+    (OpenAI-style, which litellm normalizes most providers to) or as
+    ``cache_read_input_tokens`` (Anthropic-style).
+    """
+    details = getattr(raw_usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details is not None else None
+    if not cached:
+        cached = getattr(raw_usage, "cache_read_input_tokens", None)
+    return cached or 0
+
 def _map_usage(raw_usage) -> Optional[Usage]:
     if raw_usage is None:
         return None
@@ -27,6 +40,7 @@ def _map_usage(raw_usage) -> Optional[Usage]:
         prompt_tokens=getattr(raw_usage, "prompt_tokens", 0) or 0,
         completion_tokens=getattr(raw_usage, "completion_tokens", 0) or 0,
         total_tokens=getattr(raw_usage, "total_tokens", 0) or 0,
+        cached_tokens=_cached_tokens(raw_usage),
     )
 
 _PROXY_MODEL_PREFIX = "litellm_proxy/"
@@ -63,15 +77,28 @@ class LiteLLMProvider(LLMProvider):
     applies is decided per-request by whatever model string is resolved.
     """
 
-    _SYSTEM_PROMPT = (
+    _SYSTEM_PROMPT_TEMPLATE = (
         "IMPORTANT: You are part of a PII scrubbing system.\n"
-        "User prompts may contain anonymized tokens like <PII_TYPE_AND_ID_NUMBER>.\n"
+        "User prompts may contain anonymized tokens like {example}.\n"
         "YOU MUST PRESERVE THESE TOKENS EXACTLY IN YOUR RESPONSE.\n"
         "DO NOT modify, rename, or obfuscate them."
     )
 
-    def _build_messages(self, messages: list[dict]) -> list[dict]:
-        return [{"role": "system", "content": self._SYSTEM_PROMPT}, *messages]
+    def _build_messages(
+        self, messages: list[dict], placeholder_format: Optional[PlaceholderFormat] = DEFAULT_PLACEHOLDER_FORMAT
+    ) -> list[dict]:
+        """
+        The gateway's system prompt always comes first, as one fixed
+        string per placeholder format, ahead of the client's own messages
+        (system prompt included) in their original order: the prompt
+        prefix is then byte-identical from turn to turn, as provider-side
+        prompt caching requires. Without a format (no placeholders in the
+        request) the messages are sent as they are.
+        """
+        if placeholder_format is None:
+            return list(messages)
+        prompt = self._SYSTEM_PROMPT_TEMPLATE.format(example=placeholder_format.example)
+        return [{"role": "system", "content": prompt}, *messages]
 
     def _build_kwargs(
         self,
@@ -114,11 +141,12 @@ class LiteLLMProvider(LLMProvider):
         tools: Optional[List[dict]] = None,
         tool_choice: Optional[Any] = None,
         response_format: Optional[dict] = None,
+        placeholder_format: Optional[PlaceholderFormat] = DEFAULT_PLACEHOLDER_FORMAT,
     ) -> LLMResponse:
         try:
             response = await litellm.acompletion(
                 model=model,
-                messages=self._build_messages(messages),
+                messages=self._build_messages(messages, placeholder_format),
                 temperature=temperature,
                 max_tokens=max_tokens,
                 num_retries=settings.llm_num_retries,
@@ -161,11 +189,12 @@ class LiteLLMProvider(LLMProvider):
         tools: Optional[List[dict]] = None,
         tool_choice: Optional[Any] = None,
         response_format: Optional[dict] = None,
+        placeholder_format: Optional[PlaceholderFormat] = DEFAULT_PLACEHOLDER_FORMAT,
     ) -> AsyncIterator[StreamDelta]:
         try:
             stream = await litellm.acompletion(
                 model=model,
-                messages=self._build_messages(messages),
+                messages=self._build_messages(messages, placeholder_format),
                 temperature=temperature,
                 max_tokens=max_tokens,
                 num_retries=settings.llm_num_retries,
@@ -2,6 +2,7 @@ import asyncio
 from typing import Any, AsyncIterator, List, Optional
 
 from domain.entities.llm_response import LLMResponse, ToolCall
+from domain.entities.placeholder_format import DEFAULT_PLACEHOLDER_FORMAT, PlaceholderFormat
 from domain.entities.stream_delta import StreamDelta, ToolCallDelta
 from domain.entities.usage import Usage
 from domain.interfaces.llm_provider import LLMProvider
@@ -54,6 +55,7 @@ class MockLLM(LLMProvider):
         tools: Optional[List[dict]] = None,
         tool_choice: Optional[Any] = None,
         response_format: Optional[dict] = None,
+        placeholder_format: Optional[PlaceholderFormat] = DEFAULT_PLACEHOLDER_FORMAT,
     ) -> LLMResponse:
         """
         Returns the last message content as the response, unless it is the
@@ -88,6 +90,7 @@ class MockLLM(LLMProvider):
         tools: Optional[List[dict]] = None,
         tool_choice: Optional[Any] = None,
         response_format: Optional[dict] = None,
+        placeholder_format: Optional[PlaceholderFormat] = DEFAULT_PLACEHOLDER_FORMAT,
     ) -> AsyncIterator[StreamDelta]:
         """
         Streams the last message content word by word with a short delay,
@@ -0,0 +1,114 @@
+"""
+Wire format spoken between :class:`~infrastructure.ner_server.server.NerServer`
+and :class:`~infrastructure.detectors.remote_ner_detector.RemoteNerDetector`.
+
+Every message is one frame: a 5-byte header (``!BI`` — a one-byte opcode
+or status, then the payload length) followed by the payload. All integers
+are big-endian and unsigned.
+
+Requests:
+    OP_DETECT  payload = count:u32, then per text: length:u32 + UTF-8 bytes
+    OP_STATS   empty payload
+
+Responses:
+    STATUS_OK     to OP_DETECT: count:u32, then per text: n:u32, then per
+                  span start:u32 + end:u32 + type:u8 (a ``PIIType`` value);
+                  to OP_STATS: a UTF-8 JSON object
+    STATUS_ERROR  payload = UTF-8 error message
+
+Span offsets are Python ``str`` indices into the text as sent, so the
+client rebuilds each ``PIIToken.original_value`` by slicing its own copy of
+the text — PII values never travel back over the socket.
+"""
+import socket
+import struct
+from typing import List
+
+from domain.entities.pii_token import PIIToken
+from domain.enums.pii_type import PIIType
+
+OP_DETECT = 1
+OP_STATS = 2
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+_HEADER = struct.Struct("!BI")
+_U32 = struct.Struct("!I")
+_SPAN = struct.Struct("!IIB")
+
+
+class NerServerError(Exception):
+    """Raised client-side when the NER server reports a failure."""
+
+
+def send_frame(sock: socket.socket, code: int, payload: bytes = b"") -> None:
+    sock.sendall(_HEADER.pack(code, len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            raise ConnectionError("NER server connection closed mid-frame")
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+def recv_frame(sock: socket.socket) -> tuple[int, bytes]:
+    code, length = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return code, _recv_exact(sock, length) if length else b""
+
+
+def encode_texts(texts: List[str]) -> bytes:
+    parts = [_U32.pack(len(texts))]
+    for text in texts:
+        encoded = text.encode("utf-8")
+        parts.append(_U32.pack(len(encoded)))
+        parts.append(encoded)
+    return b"".join(parts)
+
+
+def decode_texts(payload: bytes) -> List[str]:
+    (count,) = _U32.unpack_from(payload, 0)
+    offset = _U32.size
+    texts = []
+    for _ in range(count):
+        (length,) = _U32.unpack_from(payload, offset)
+        offset += _U32.size
+        texts.append(payload[offset:offset + length].decode("utf-8"))
+        offset += length
+    return texts
+
+
+def encode_spans(results: List[List[PIIToken]]) -> bytes:
+    parts = [_U32.pack(len(results))]
+    for tokens in results:
+        parts.append(_U32.pack(len(tokens)))
+        parts.extend(_SPAN.pack(t.start, t.end, t.type.value) for t in tokens)
+    return b"".join(parts)
+
+
+def decode_spans(payload: bytes, texts: List[str]) -> List[List[PIIToken]]:
+    (count,) = _U32.unpack_from(payload, 0)
+    if count != len(texts):
+        raise NerServerError(f"NER server answered for {count} text(s), expected {len(texts)}")
+
+    offset = _U32.size
+    results = []
+    for text in texts:
+        (n,) = _U32.unpack_from(payload, offset)
+        offset += _U32.size
+        tokens = []
+        for start, end, type_value in _SPAN.iter_unpack(payload[offset:offset + n * _SPAN.size]):
+            tokens.append(PIIToken(
+                type=PIIType(type_value),
+                original_value=text[start:end],
+                token_str="",
+                start=start,
+                end=end,
+            ))
+        offset += n * _SPAN.size
+        results.append(tokens)
+    return results
@@ -0,0 +1,130 @@
+"""
+Standalone NER inference process: owns the one PiiPlDetector (and its
+model) for the whole host, and serves detection to every uvicorn worker
+over a Unix domain socket.
+
+    uv run python -m infrastructure.ner_server.server --socket /run/piast-gate/ner.sock
+
+then start the gateway with ``PL_NER_SERVER_SOCKET`` set to the same path.
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import socketserver
+import stat
+import threading
+
+from api.config.config import settings
+from api.config.logging_config import setup_logging
+from domain.interfaces.pii_detector import PIIDetector
+from domain.services.anonymizer_service import detect_batch
+from infrastructure.ner_server.protocol import (
+    OP_DETECT,
+    OP_STATS,
+    STATUS_ERROR,
+    STATUS_OK,
+    decode_texts,
+    encode_spans,
+    recv_frame,
+    send_frame,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/piast-gate-ner.sock"
+
+_WARMUP_TEXT = "Jan Kowalski mieszka w Warszawie i pracuje w firmie Acme Sp. z o.o."
+
+
+class _ConnectionHandler(socketserver.BaseRequestHandler):
+    """Serves requests from one client connection until it disconnects."""
+
+    def handle(self) -> None:
+        while True:
+            try:
+                opcode, payload = recv_frame(self.request)
+            except (ConnectionError, OSError):
+                return
+
+            try:
+                response = self._dispatch(opcode, payload)
+            except Exception as e:
+                logger.error(f"NER server request failed: {e}", exc_info=True)
+                send_frame(self.request, STATUS_ERROR, str(e).encode("utf-8"))
+                continue
+
+            send_frame(self.request, STATUS_OK, response)
+
+    def _dispatch(self, opcode: int, payload: bytes) -> bytes:
+        detector = self.server.detector
+        if opcode == OP_DETECT:
+            return encode_spans(detect_batch(detector, decode_texts(payload)))
+        if opcode == OP_STATS:
+            stats = detector.stats() if hasattr(detector, "stats") else {}
+            return json.dumps(stats).encode("utf-8")
+        raise ValueError(f"Unknown NER server opcode: {opcode}")
+
+
+class NerServer(socketserver.ThreadingUnixStreamServer):
+    """
+    One thread per client connection; every thread calls into the same
+    detector, so with ``PL_NER_BATCHING_ENABLED`` the requests of all
+    workers on the host are coalesced into shared batches.
+
+    The socket is created owner-only (0600): raw, not-yet-anonymized text
+    travels over it.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, detector: PIIDetector) -> None:
+        if os.path.exists(socket_path):
+            if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                raise ValueError(f"Refusing to replace non-socket file at {socket_path}")
+            os.unlink(socket_path)
+
+        self.socket_path = socket_path
+        self.detector = detector
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _ConnectionHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--socket",
+        default=settings.pl_ner_server_socket or DEFAULT_SOCKET_PATH,
+        help="Unix domain socket path to listen on.",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+
+    from infrastructure.detectors.pii_pl import PiiPlDetector
+
+    detector = PiiPlDetector()
+    detector.detect(_WARMUP_TEXT)
+
+    server = NerServer(args.socket, detector)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    logger.info(f"NER server listening on {args.socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
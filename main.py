@@ -1,3 +1,4 @@
+import argparse
 import sys
 import uvicorn
 from dotenv import load_dotenv
@@ -13,4 +14,22 @@ load_dotenv()
 app = create_app()
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    parser = argparse.ArgumentParser(description="Run the LLM PII Gateway.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="Load the NER model once in the master and fork workers that share it copy-on-write.",
+    )
+    args = parser.parse_args()
+
+    if args.preload:
+        from api.preload import serve_preloaded
+
+        serve_preloaded(app, args.host, args.port, args.workers)
+    elif args.workers > 1:
+        uvicorn.run("main:app", host=args.host, port=args.port, workers=args.workers)
+    else:
+        uvicorn.run("main:app", host=args.host, port=args.port, reload=True)
@@ -0,0 +1,104 @@
+"""
+Compares two NER inference engines (PyTorch vs onnxruntime by default) on
+the eval dataset: the exact (type, start, end) spans each one produces, and
+per-text detection latency.
+
+    uv run python tests/eval/compare_engines.py
+    uv run python tests/eval/compare_engines.py --candidate onnx --repeat 5
+
+Exits non-zero if any text's spans differ between the two engines.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from api.config.config import settings
+from infrastructure.detectors.pii_pl.detector import PiiPlDetector
+
+DEFAULT_DATASET = Path(__file__).parent / "dataset.json"
+
+
+def build_detector(engine: str) -> PiiPlDetector:
+    original = settings.pl_ner_engine
+    settings.pl_ner_engine = engine
+    try:
+        return PiiPlDetector()
+    finally:
+        settings.pl_ner_engine = original
+
+
+def spans(detector: PiiPlDetector, text: str) -> list[tuple[str, int, int]]:
+    return [(t.type.name, t.start, t.end) for t in detector.detect(text)]
+
+
+def time_per_text(detector: PiiPlDetector, texts: list[str], repeat: int) -> list[float]:
+    for text in texts[:3]:
+        detector.detect(text)
+
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            detector.detect(text)
+        latencies.append((time.perf_counter() - start) / repeat)
+    return latencies
+
+
+def compare(reference: PiiPlDetector, candidate: PiiPlDetector, examples: list[dict]) -> list[dict]:
+    mismatches = []
+    for ex in examples:
+        expected, actual = spans(reference, ex["text"]), spans(candidate, ex["text"])
+        if expected != actual:
+            mismatches.append({"id": ex.get("id"), "text": ex["text"], "reference": expected, "candidate": actual})
+    return mismatches
+
+
+def _summary(latencies: list[float]) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"avg {statistics.mean(ordered) * 1000:8.2f} ms  "
+        f"median {statistics.median(ordered) * 1000:8.2f} ms  "
+        f"p95 {p95 * 1000:8.2f} ms"
+    )
+
+
+def main() -> None:
+    if sys.stdout.encoding.lower() != "utf-8":
+        sys.stdout.reconfigure(encoding="utf-8")
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET, help="Path to the eval dataset JSON file.")
+    parser.add_argument("--reference", default="torch", help="Engine treated as ground truth.")
+    parser.add_argument("--candidate", default="onnx", help="Engine being validated.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per text.")
+    args = parser.parse_args()
+
+    examples = json.loads(args.dataset.read_text(encoding="utf-8"))
+    texts = [ex["text"] for ex in examples]
+    reference = build_detector(args.reference)
+    candidate = build_detector(args.candidate)
+
+    mismatches = compare(reference, candidate, examples)
+
+    print(f"{args.reference:<10}{_summary(time_per_text(reference, texts, args.repeat))}")
+    print(f"{args.candidate:<10}{_summary(time_per_text(candidate, texts, args.repeat))}")
+    print(f"\nSpan parity: {len(examples) - len(mismatches)}/{len(examples)} texts identical")
+
+    for m in mismatches:
+        print(f"\n[{m['id']}] {m['text']!r}")
+        print(f"  {args.reference}: {m['reference']}")
+        print(f"  {args.candidate}: {m['candidate']}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Measures what each placeholder format costs in LLM tokens under a given
+tokenizer, to pick ``PLACEHOLDER_FORMAT`` (or a per-model entry in
+``PLACEHOLDER_FORMAT_BY_MODEL``) for the model behind it.
+
+For every format it reports:
+- the tokens of a single placeholder per PII type, in running text and
+  at a few number widths (``--numbers``, e.g. 4 digits for stable numbering);
+- the total tokens of the eval dataset with its labelled entities replaced
+  by placeholders, next to the original texts;
+- the tokens of the gateway system prompt describing the format.
+
+Either a Hugging Face tokenizer or a tiktoken encoding can be used:
+
+    uv run python tests/eval/placeholder_token_cost.py --hf-tokenizer Qwen/Qwen2.5-7B-Instruct
+    uv run python tests/eval/placeholder_token_cost.py --tiktoken o200k_base --numbers 1 12 1234
+
+Offline: only the tokenizer is loaded, no detectors or LLM calls.
+"""
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from domain.entities.placeholder_format import PLACEHOLDER_FORMATS, PlaceholderFormat
+from domain.enums.pii_type import PIIType
+from infrastructure.llm.litellm_provider import LiteLLMProvider
+
+DEFAULT_DATASET = Path(__file__).parent / "dataset.json"
+
+# A placeholder is rarely at the start of a text: measure it after a word
+# and a space, as BPE merges the leading space into the first token.
+_CONTEXT_PREFIX = "Kontakt:"
+
+Counter = Callable[[str], int]
+
+
+def load_counter(hf_tokenizer: str = None, tiktoken_encoding: str = None) -> Counter:
+    if hf_tokenizer:
+        from transformers import AutoTokenizer
+
+        tokenizer = AutoTokenizer.from_pretrained(hf_tokenizer)
+        return lambda text: len(tokenizer.encode(text, add_special_tokens=False))
+
+    import tiktoken
+
+    encoding = tiktoken.get_encoding(tiktoken_encoding)
+    return lambda text: len(encoding.encode(text))
+
+
+def placeholder_tokens(count: Counter, fmt: PlaceholderFormat, type_name: str, number: int) -> int:
+    """Tokens a placeholder adds to running text."""
+    return count(f"{_CONTEXT_PREFIX} {fmt.render(type_name, number)}") - count(_CONTEXT_PREFIX)
+
+
+def anonymize_gold(example: dict, fmt: PlaceholderFormat) -> str:
+    """The example's text with its labelled entities replaced, numbered per type."""
+    text = example["text"]
+    counters: Dict[str, int] = {}
+    seen: Dict[str, str] = {}
+    for entity in sorted(example.get("entities", []), key=lambda e: len(e["value"]), reverse=True):
+        value = entity["value"]
+        if value in seen or value not in text:
+            continue
+        counters[entity["type"]] = counters.get(entity["type"], 0) + 1
+        seen[value] = fmt.render(entity["type"], counters[entity["type"]])
+        text = text.replace(value, seen[value])
+    return text
+
+
+def report(count: Counter, examples: List[dict], numbers: List[int]) -> List[dict]:
+    original_total = sum(count(ex["text"]) for ex in examples)
+    rows = []
+    for fmt in PLACEHOLDER_FORMATS.values():
+        per_type = {
+            pii_type.name: [placeholder_tokens(count, fmt, pii_type.name, n) for n in numbers]
+            for pii_type in PIIType
+        }
+        anonymized_total = sum(count(anonymize_gold(ex, fmt)) for ex in examples)
+        prompt = LiteLLMProvider._SYSTEM_PROMPT_TEMPLATE.format(example=fmt.example)
+        rows.append({
+            "format": fmt.name,
+            "example": fmt.render(PIIType.PERSON.name, numbers[0]),
+            "mean_tokens": statistics.mean(t for costs in per_type.values() for t in costs),
+            "per_type": per_type,
+            "dataset_tokens": anonymized_total,
+            "dataset_vs_original": anonymized_total / original_total if original_total else 0.0,
+            "system_prompt_tokens": count(prompt),
+        })
+    return rows
+
+
+def print_report(rows: List[dict], numbers: List[int], original_total: int) -> None:
+    print(f"Dataset, original text: {original_total} tokens")
+    print(f"{'format':<14} {'example':<12} {'mean/ph':>8} {'dataset':>8} {'vs orig':>8} {'prompt':>7}")
+    for row in sorted(rows, key=lambda r: r["dataset_tokens"]):
+        print(
+            f"{row['format']:<14} {row['example']:<12} {row['mean_tokens']:>8.2f} "
+            f"{row['dataset_tokens']:>8} {row['dataset_vs_original']:>7.1%} {row['system_prompt_tokens']:>7}"
+        )
+
+    print(f"\nTokens per placeholder (numbers {', '.join(map(str, numbers))}):")
+    type_names = [pii_type.name for pii_type in PIIType]
+    print(f"{'format':<14} " + " ".join(f"{name[:12]:>12}" for name in type_names))
+    for row in rows:
+        print(f"{row['format']:<14} " + " ".join(
+            f"{'/'.join(map(str, row['per_type'][name])):>12}" for name in type_names
+        ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--hf-tokenizer", help="Hugging Face tokenizer name or path")
+    source.add_argument("--tiktoken", help="tiktoken encoding name, e.g. o200k_base or cl100k_base")
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET)
+    parser.add_argument("--numbers", type=int, nargs="+", default=[1, 12], help="Placeholder numbers to measure")
+    parser.add_argument("--json", action="store_true", help="Print the raw results as JSON")
+    args = parser.parse_args()
+
+    count = load_counter(args.hf_tokenizer, args.tiktoken)
+    examples = json.loads(args.dataset.read_text(encoding="utf-8"))
+    rows = report(count, examples, args.numbers)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_report(rows, args.numbers, sum(count(ex["text"]) for ex in examples))
+
+
+if __name__ == "__main__":
+    main()
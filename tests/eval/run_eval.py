@@ -1,6 +1,8 @@
 import argparse
 import json
+import statistics
 import sys
+import time
 from collections import defaultdict
 from pathlib import Path
 
@@ -8,6 +10,7 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from api.config.config import settings
 from domain.services.anonymizer_service import AnonymizerService
 from infrastructure.detectors.bank_account_detector import BankAccountDetector
 from infrastructure.detectors.date_detector import DateDetector
@@ -20,6 +23,29 @@ from infrastructure.detectors.pii_pl.detector import PiiPlDetector
 
 DEFAULT_DATASET = Path(__file__).parent / "dataset.json"
 
+NER_MODES = {
+    "fp32": {"pl_ner_quantization": "none", "pl_ner_int8_cascade": False},
+    "int8": {"pl_ner_quantization": "int8", "pl_ner_int8_cascade": False},
+    "int8-cascade": {"pl_ner_quantization": "int8", "pl_ner_int8_cascade": True},
+}
+
+_GATED = ["code", "structured", "blob", "lowercase"]
+NER_GATING = {
+    "off": {"pl_ner_gating_enabled": False},
+    "default": {"pl_ner_gating_enabled": True, "pl_ner_gate_skip_classes": _GATED},
+    "+sentence_case": {"pl_ner_gating_enabled": True, "pl_ner_gate_skip_classes": _GATED + ["sentence_case"]},
+}
+
+
+def apply_ner_mode(mode: str) -> None:
+    for name, value in NER_MODES[mode].items():
+        setattr(settings, name, value)
+
+
+def apply_ner_gating(mode: str) -> None:
+    for name, value in NER_GATING[mode].items():
+        setattr(settings, name, value)
+
 
 def build_service() -> AnonymizerService:
     detectors = [
@@ -42,13 +68,16 @@ def load_dataset(path: Path) -> list[dict]:
 def evaluate(service: AnonymizerService, examples: list[dict], category: str | None):
     per_type = defaultdict(lambda: {"tp": 0, "fp": 0, "fn": 0})
     failures = []
+    latencies = []
 
     for ex in examples:
         if category and ex.get("category") != category:
             continue
 
         gold = {(e["type"], e["value"]) for e in ex["entities"]}
+        started = time.perf_counter()
         _, mapping = service.anonymize(ex["text"])
+        latencies.append(time.perf_counter() - started)
         predicted = {(t.type.name, t.original_value) for t in mapping.values()}
 
         tp, fp, fn = gold & predicted, predicted - gold, gold - predicted
@@ -71,7 +100,7 @@ def evaluate(service: AnonymizerService, examples: list[dict], category: str | N
                 }
             )
 
-    return per_type, failures
+    return per_type, failures, latencies
 
 
 def _prf(tp: int, fp: int, fn: int) -> tuple[float, float, float]:
@@ -81,7 +110,41 @@ def _prf(tp: int, fp: int, fn: int) -> tuple[float, float, float]:
     return p, r, f1
 
 
-def print_report(per_type: dict, failures: list[dict], verbose: bool) -> None:
+def _overall(per_type: dict) -> tuple[float, float, float]:
+    return _prf(
+        sum(s["tp"] for s in per_type.values()),
+        sum(s["fp"] for s in per_type.values()),
+        sum(s["fn"] for s in per_type.values()),
+    )
+
+
+def _latency_summary(latencies: list[float]) -> str:
+    if not latencies:
+        return "n/a"
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"avg {statistics.mean(ordered) * 1000:.1f} ms, "
+        f"median {statistics.median(ordered) * 1000:.1f} ms, "
+        f"p95 {p95 * 1000:.1f} ms"
+    )
+
+
+def print_mode_comparison(results: dict, label: str = "NER MODE") -> None:
+    print(f"{label:<14}{'P':>8}{'R':>8}{'F1':>8}  LATENCY PER TEXT")
+    for mode, (per_type, _, latencies) in results.items():
+        p, r, f1 = _overall(per_type)
+        print(f"{mode:<14}{p:>8.2%}{r:>8.2%}{f1:>8.2%}  {_latency_summary(latencies)}")
+
+
+def _gating_stats(service: AnonymizerService) -> dict:
+    for detector in service.detectors:
+        if isinstance(detector, PiiPlDetector):
+            return detector.stats().get("gating", {})
+    return {}
+
+
+def print_report(per_type: dict, failures: list[dict], verbose: bool, latencies: list[float] = ()) -> None:
     total_tp = total_fp = total_fn = 0
     print(f"{'TYPE':<14}{'P':>8}{'R':>8}{'F1':>8}{'TP':>6}{'FP':>6}{'FN':>6}")
     for t in sorted(per_type):
@@ -96,6 +159,7 @@ def print_report(per_type: dict, failures: list[dict], verbose: bool) -> None:
     p, r, f1 = _prf(total_tp, total_fp, total_fn)
     print("-" * 56)
     print(f"{'OVERALL':<14}{p:>8.2%}{r:>8.2%}{f1:>8.2%}{total_tp:>6}{total_fp:>6}{total_fn:>6}")
+    print(f"\nLatency per text: {_latency_summary(list(latencies))}")
 
     if verbose and failures:
         print("\nFailures:")
@@ -115,12 +179,40 @@ def main() -> None:
     parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET, help="Path to the eval dataset JSON file.")
     parser.add_argument("--category", type=str, default=None, help="Only run examples with this category.")
     parser.add_argument("-v", "--verbose", action="store_true", help="Print per-example misses/false positives.")
+    parser.add_argument("--ner-mode", choices=sorted(NER_MODES), default=None, help="NER precision mode to evaluate (default: as configured).")
+    parser.add_argument("--compare-ner-modes", action="store_true", help="Evaluate every NER precision mode and print them side by side.")
+    parser.add_argument("--compare-ner-gating", action="store_true", help="Evaluate NER without gating and with each set of skipped segment classes, with the share of text skipped.")
     args = parser.parse_args()
 
     examples = load_dataset(args.dataset)
+
+    if args.compare_ner_modes:
+        results = {}
+        for mode in NER_MODES:
+            apply_ner_mode(mode)
+            results[mode] = evaluate(build_service(), examples, args.category)
+        print_mode_comparison(results)
+        return
+
+    if args.compare_ner_gating:
+        results, skipped = {}, {}
+        for mode in NER_GATING:
+            apply_ner_gating(mode)
+            service = build_service()
+            results[mode] = evaluate(service, examples, args.category)
+            skipped[mode] = _gating_stats(service)
+        print_mode_comparison(results, label="NER GATING")
+        print()
+        for mode, stats in skipped.items():
+            if stats:
+                print(f"{mode:<14}skipped {stats['skipped_share']:.1%} of text: {stats['skipped_chars']}")
+        return
+
+    if args.ner_mode:
+        apply_ner_mode(args.ner_mode)
     service = build_service()
-    per_type, failures = evaluate(service, examples, args.category)
-    print_report(per_type, failures, args.verbose)
+    per_type, failures, latencies = evaluate(service, examples, args.category)
+    print_report(per_type, failures, args.verbose, latencies)
 
 
 if __name__ == "__main__":
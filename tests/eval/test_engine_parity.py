@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("optimum.onnxruntime")
+
+from compare_engines import DEFAULT_DATASET, build_detector, compare
+
+
+@pytest.fixture(scope="module")
+def examples():
+    return json.loads(DEFAULT_DATASET.read_text(encoding="utf-8"))
+
+
+def test_onnx_engine_reproduces_torch_spans_on_eval_dataset(examples):
+    """The ONNX export must be a drop-in replacement: identical spans and
+    types for every text, including stride windowing, location-prefix
+    extension and adjacent-entity merging."""
+    mismatches = compare(build_detector("torch"), build_detector("onnx"), examples)
+
+    assert mismatches == []
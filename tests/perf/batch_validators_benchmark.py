@@ -0,0 +1,106 @@
+"""
+Checksum validation time per candidate, one at a time (the scalar
+validators) against the NumPy batch variants, at growing candidate counts
+— where the two lines cross is what ``FAST_DETECTOR_BATCH_THRESHOLD``
+should be. Candidates are random digit strings (about one in ten passes a
+mod-10/11 checksum) and random NRBs as IBANs.
+
+Also times FastDetector end to end on a "table" text — rows of
+identifiers, as when a spreadsheet is pasted in — with batching off and
+on, scanning for the checksummed types only (phone validation would
+dominate otherwise).
+
+Checks both produce the same verdicts / tokens.
+
+    uv run python tests/perf/batch_validators_benchmark.py
+    uv run python tests/perf/batch_validators_benchmark.py --counts 8 32 128 --repeat 50
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from domain.enums.pii_type import PIIType
+from infrastructure.detectors.fast_detector import FastDetector
+from infrastructure.detectors.validators import (
+    is_valid_iban_checksum,
+    is_valid_iban_checksum_batch,
+    is_valid_nip,
+    is_valid_nip_batch,
+    is_valid_pesel,
+    is_valid_pesel_batch,
+    is_valid_regon,
+    is_valid_regon_batch,
+)
+
+VALIDATORS = {
+    "pesel": (is_valid_pesel, is_valid_pesel_batch, lambda rng: _digits(rng, 11)),
+    "nip": (is_valid_nip, is_valid_nip_batch, lambda rng: _digits(rng, 10)),
+    "regon": (is_valid_regon, is_valid_regon_batch, lambda rng: _digits(rng, rng.choice([9, 14]))),
+    "iban": (is_valid_iban_checksum, is_valid_iban_checksum_batch, lambda rng: "PL" + _digits(rng, 26)),
+}
+
+CHECKSUMMED = (PIIType.BANK_ACCOUNT, PIIType.PESEL, PIIType.NIP, PIIType.REGON)
+
+
+def _digits(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice("0123456789") for _ in range(length))
+
+
+def median_ms(run: Callable[[], object], repeat: int) -> float:
+    run()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def table_text(rng: random.Random, rows: int) -> str:
+    lines: List[str] = []
+    for i in range(rows):
+        lines.append(f"{i + 1}. {_digits(rng, 11)} {_digits(rng, 10)} {_digits(rng, 9)} {' '.join(_digits(rng, 4) for _ in range(6))}{_digits(rng, 2)}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[4, 16, 32, 64, 256, 1024, 10_000])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'check':<6} {'count':>7} {'scalar ms':>10} {'batch ms':>9} {'speedup':>8}")
+    for name, (scalar, batch, make) in VALIDATORS.items():
+        for count in args.counts:
+            candidates = [make(rng) for _ in range(count)]
+            if list(batch(candidates)) != [scalar(c) for c in candidates]:
+                sys.exit(f"Batch verdicts differ from the scalar validator ({name}, {count} candidates)")
+            scalar_ms = median_ms(lambda: [scalar(c) for c in candidates], args.repeat)
+            batch_ms = median_ms(lambda: batch(candidates), args.repeat)
+            print(f"{name:<6} {count:>7} {scalar_ms:>10.3f} {batch_ms:>9.3f} {scalar_ms / batch_ms:>7.1f}x")
+
+    per_candidate = FastDetector(CHECKSUMMED, batch_threshold=sys.maxsize)
+    batched = FastDetector(CHECKSUMMED, batch_threshold=1)
+    print(f"\n{'rows':>6} {'chars':>8} {'per-candidate ms':>17} {'batched ms':>11} {'speedup':>8}")
+    for rows in args.rows:
+        text = table_text(rng, rows)
+        key = lambda tokens: [(t.type, t.start, t.end) for t in tokens]
+        if key(per_candidate.detect(text)) != key(batched.detect(text)):
+            sys.exit(f"Batched FastDetector output differs ({rows} rows)")
+        single_ms = median_ms(lambda: per_candidate.detect(text), args.repeat)
+        batch_ms = median_ms(lambda: batched.detect(text), args.repeat)
+        print(f"{rows:>6} {len(text):>8} {single_ms:>17.2f} {batch_ms:>11.2f} {single_ms / batch_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
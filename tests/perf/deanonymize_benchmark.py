@@ -0,0 +1,115 @@
+"""
+Time to restore placeholders in a response with AnonymizerService.deanonymize
+(one scan of the text for placeholder-shaped spans, resolved by dict lookup)
+against the previous approach (a regex alternation of every mapping key,
+compiled per call, then a second scan stripping unresolved placeholders),
+at several mapping sizes and response lengths.
+
+The response mentions a fixed number of placeholders drawn from the
+mapping, as an answer about a long document refers to a few of its
+entities; the mapping grows as the document does. The per-call time of
+the single scan should stay flat as the mapping grows.
+
+    uv run python tests/perf/deanonymize_benchmark.py
+    uv run python tests/perf/deanonymize_benchmark.py --entries 10 1000 50000 --sizes 2000 --repeat 20
+"""
+import argparse
+import logging
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from application.dtos.chat_request import MAX_CONTENT_LENGTH
+from domain.entities.pii_token import PIIToken
+from domain.enums.pii_type import PIIType
+from domain.services.anonymizer_service import AnonymizerService
+
+FILLER = "Na podstawie dokumentu można stwierdzić, że strony zawarły umowę w podanym terminie. "
+TYPES = [PIIType.PERSON, PIIType.LOCATION, PIIType.ORGANIZATION, PIIType.EMAIL, PIIType.PHONE]
+
+
+def build_mapping(entries: int) -> Dict[str, PIIToken]:
+    mapping = {}
+    for index in range(entries):
+        pii_type = TYPES[index % len(TYPES)]
+        token_str = f"<{pii_type.name}{index // len(TYPES) + 1}>"
+        mapping[token_str] = PIIToken(pii_type, f"wartość {index}", token_str, 0, 0)
+    return mapping
+
+
+def build_response(mapping: Dict[str, PIIToken], size: int, placeholders: int, rng: random.Random) -> str:
+    keys = list(mapping)
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        parts.append(FILLER)
+        length += len(FILLER)
+    text = "".join(parts)[:size]
+    # Spread the placeholders evenly; one of every ten is hallucinated.
+    step = max(1, len(text) // (placeholders + 1))
+    pieces, previous = [], 0
+    for index in range(1, placeholders + 1):
+        cut = index * step
+        tag = "<PERSON999999>" if index % 10 == 0 else rng.choice(keys)
+        pieces.append(text[previous:cut] + " " + tag + " ")
+        previous = cut
+    pieces.append(text[previous:])
+    return "".join(pieces)
+
+
+def alternation_deanonymize(service: AnonymizerService) -> Callable[[str, Dict[str, PIIToken]], str]:
+    """The previous implementation, kept here as the baseline."""
+    def deanonymize(text: str, mapping: Dict[str, PIIToken]) -> str:
+        if mapping:
+            pattern = re.compile("|".join(map(re.escape, sorted(mapping.keys(), key=len, reverse=True))))
+            text = pattern.sub(lambda match: mapping[match.group(0)].original_value, text)
+        return service.placeholder_format.shape_re.sub("", text)
+    return deanonymize
+
+
+def median_ms(restore: Callable[[str, Dict[str, PIIToken]], str], text: str, mapping: Dict[str, PIIToken], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        # re caches compiled patterns; purge so every call pays for its own
+        # compile, as a new mapping does on every request.
+        re.purge()
+        started = time.perf_counter()
+        restore(text, mapping)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, nargs="+", default=[10, 1_000, 50_000])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2_000, MAX_CONTENT_LENGTH])
+    parser.add_argument("--placeholders", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # Every hallucinated placeholder logs a warning when stripped.
+    logging.disable(logging.WARNING)
+    rng = random.Random(0)
+    service = AnonymizerService([])
+    baseline = alternation_deanonymize(service)
+    print(f"{'entries':>8} {'chars':>7} {'alternation ms':>15} {'single pass ms':>15} {'speedup':>8}")
+    for entries in args.entries:
+        mapping = build_mapping(entries)
+        for size in args.sizes:
+            text = build_response(mapping, size, args.placeholders, rng)
+            assert service.deanonymize(text, mapping) == baseline(text, mapping)
+            before = median_ms(baseline, text, mapping, args.repeat)
+            after = median_ms(service.deanonymize, text, mapping, args.repeat)
+            print(f"{entries:>8} {size:>7} {before:>15.2f} {after:>15.3f} {before / after:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compiles a synthetic customer registry (client names, company names and
+internal IDs) into a deny-list automaton and reports the build time, file
+size and detection time on texts built from the eval dataset up to the
+maximum message length, with a few registry terms mixed in.
+
+Detection time should stay flat as the registry grows: the automaton walks
+each word of the text once, whatever the number of terms.
+
+    uv run python tests/perf/deny_list_benchmark.py
+    uv run python tests/perf/deny_list_benchmark.py --terms 10000 100000 1000000
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from application.dtos.chat_request import MAX_CONTENT_LENGTH
+from infrastructure.detectors.deny_list import DenyListDetector
+from infrastructure.detectors.deny_list.automaton import FOLD_CASE, FOLD_DIACRITICS, write_automaton
+
+DEFAULT_DATASET = Path(__file__).resolve().parents[1] / "eval" / "dataset.json"
+
+_SYLLABLES = ["ka", "ro", "wi", "ski", "mal", "bor", "zek", "ła", "czy", "dą", "nek", "ta", "ger", "ów", "ś", "lin"]
+_COMPANY_SUFFIXES = ["Sp. z o.o.", "S.A.", "Sp. j.", "Holding", "Group"]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+
+
+def registry(count: int, seed: int = 0) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    entries = []
+    for index in range(count):
+        kind = index % 3
+        if kind == 0:
+            entries.append(("PERSON", f"{_word(rng)} {_word(rng)}"))
+        elif kind == 1:
+            entries.append(("ORGANIZATION", f"{_word(rng)} {rng.choice(_COMPANY_SUFFIXES)}"))
+        else:
+            entries.append(("IDENTIFIER", f"CL-{rng.randint(2000, 2030)}-{index:07d}"))
+    return entries
+
+
+def build_text(examples: List[dict], entries: List[Tuple[str, str]], size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    sentences = [ex["text"] for ex in examples]
+    parts, length = [], 0
+    while length < size:
+        sentence = rng.choice(sentences)
+        if rng.random() < 0.2:
+            sentence += f" Dotyczy: {rng.choice(entries)[1]}."
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)[:size]
+
+
+def median_ms(detector: DenyListDetector, text: str, repeat: int) -> float:
+    detector.detect(text)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        detector.detect(text)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET)
+    parser.add_argument("--terms", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, MAX_CONTENT_LENGTH])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    examples = json.loads(args.dataset.read_text(encoding="utf-8"))
+    print(f"{'terms':>9} {'build s':>8} {'file MB':>8} {'chars':>7} {'found':>6} {'detect ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.terms:
+            entries = registry(count)
+            path = Path(tmp) / f"deny-{count}.bin"
+            started = time.perf_counter()
+            write_automaton(entries, path, FOLD_CASE | FOLD_DIACRITICS)
+            build_seconds = time.perf_counter() - started
+            detector = DenyListDetector(str(path))
+            for size in args.sizes:
+                text = build_text(examples, entries, size)
+                print(
+                    f"{count:>9} {build_seconds:>8.1f} {path.stat().st_size / 1e6:>8.1f} {size:>7} "
+                    f"{len(detector.detect(text)):>6} {median_ms(detector, text, args.repeat):>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Scan time of the regex/checksum detectors run one after another (as wired
+before FastDetector) against FastDetector's single scan, on texts built
+from the eval dataset up to the maximum message length:
+
+- "dataset": the eval texts as they are, PII in nearly every sentence, so
+  validating candidates (phone numbers above all) weighs as much as
+  scanning;
+- "prose": the same texts with digits and "@" removed — no candidates, so
+  this is the scanning alone, as in most of a long message.
+
+Also checks both produce identical tokens on every text. Both phone
+detectors memoise verdicts per number, so timings after the first run
+are with a warm memo, as for a conversation resent every turn.
+
+With ``--adversarial``, times both instead on inputs built to make the
+digit patterns work hardest (long digit runs, digits and spaces, near-miss
+account numbers, dash chains) at doubling sizes: time per character
+staying flat as the size doubles shows the scan is linear.
+
+    uv run python tests/perf/fast_detector_benchmark.py
+    uv run python tests/perf/fast_detector_benchmark.py --sizes 1000 80000 --repeat 20
+    uv run python tests/perf/fast_detector_benchmark.py --adversarial
+"""
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from application.dtos.chat_request import MAX_CONTENT_LENGTH
+from infrastructure.detectors.bank_account_detector import BankAccountDetector
+from infrastructure.detectors.date_detector import DateDetector
+from infrastructure.detectors.email_detector import EmailDetector
+from infrastructure.detectors.fast_detector import FastDetector
+from infrastructure.detectors.nip_detector import NipDetector
+from infrastructure.detectors.pesel_detector import PeselDetector
+from infrastructure.detectors.phone_detector import PhoneDetector
+from infrastructure.detectors.regon_detector import RegonDetector
+
+DEFAULT_DATASET = Path(__file__).resolve().parents[1] / "eval" / "dataset.json"
+
+SEPARATE = [
+    EmailDetector(),
+    BankAccountDetector(),
+    PeselDetector(),
+    PhoneDetector(),
+    DateDetector(),
+    NipDetector(),
+    RegonDetector(),
+]
+
+
+def run_separate(text: str) -> list:
+    return [token for detector in SEPARATE for token in detector.detect(text)]
+
+
+def build_text(examples: List[dict], size: int, prose: bool = False) -> str:
+    corpus = "\n".join(ex["text"] for ex in examples)
+    if prose:
+        corpus = re.sub(r"[\d@]", "", corpus)
+    return (corpus * (size // len(corpus) + 1))[:size]
+
+
+# Repeating units of the adversarial inputs.
+ADVERSARIAL = {
+    "digits": "7",
+    "digits+spaces": "1 ",
+    "digits+tabs": "12\t 3 \t",
+    "near-miss NRB": "1 " * 25 + "x ",
+    "dash chains": "123-45-678-9-",
+    "short groups": "12 345 6 78 9012 ",
+}
+ADVERSARIAL_SIZES = [10_000, 20_000, 40_000, MAX_CONTENT_LENGTH]
+
+
+def median_ms(detect: Callable[[str], list], text: str, repeat: int) -> float:
+    detect(text)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        detect(text)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _key(tokens: list) -> list:
+    return [(t.type, t.start, t.end, t.original_value) for t in tokens]
+
+
+def run_adversarial(fast: FastDetector, repeat: int) -> None:
+    print(f"{'input':<14} {'chars':>8} {'separate ms':>12} {'µs/char':>8} {'fast ms':>9} {'µs/char':>8}")
+    for name, unit in ADVERSARIAL.items():
+        for size in ADVERSARIAL_SIZES:
+            text = (unit * (size // len(unit) + 1))[:size]
+            if _key(fast.detect(text)) != _key(run_separate(text)):
+                sys.exit(f"FastDetector output differs from the separate detectors ({name}, {size} chars)")
+
+            separate_ms = median_ms(run_separate, text, repeat)
+            fast_ms = median_ms(fast.detect, text, repeat)
+            print(
+                f"{name:<14} {size:>8} {separate_ms:>12.2f} {separate_ms * 1000 / size:>8.3f} "
+                f"{fast_ms:>9.2f} {fast_ms * 1000 / size:>8.3f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, MAX_CONTENT_LENGTH])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--adversarial", action="store_true", help="Time worst-case inputs at doubling sizes")
+    args = parser.parse_args()
+
+    fast = FastDetector()
+    if args.adversarial:
+        run_adversarial(fast, args.repeat)
+        return
+
+    examples = json.loads(args.dataset.read_text(encoding="utf-8"))
+
+    print(f"{'text':<8} {'chars':>8} {'tokens':>7} {'separate ms':>12} {'fast ms':>9} {'speedup':>8}")
+    for corpus in ("dataset", "prose"):
+        for size in args.sizes:
+            text = build_text(examples, size, prose=corpus == "prose")
+            expected = run_separate(text)
+            if _key(fast.detect(text)) != _key(expected):
+                sys.exit(f"FastDetector output differs from the separate detectors ({corpus}, {size} chars)")
+
+            separate_ms = median_ms(run_separate, text, args.repeat)
+            fast_ms = median_ms(fast.detect, text, args.repeat)
+            print(
+                f"{corpus:<8} {size:>8} {len(expected):>7} {separate_ms:>12.2f} {fast_ms:>9.2f} "
+                f"{separate_ms / fast_ms:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
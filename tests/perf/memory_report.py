@@ -0,0 +1,123 @@
+"""
+Per-worker memory with and without fork-after-load preloading.
+
+Starts the gateway twice — ``main.py --workers N`` (every worker loads its
+own model) and ``main.py --preload --workers N`` (the master loads it once
+and forks) — waits until it is serving, and reports RSS and PSS for every
+worker process read from ``/proc/<pid>/smaps_rollup``. PSS splits shared
+pages between the processes mapping them, so its sum is the real footprint.
+
+Linux only. Run from the repo root:
+    uv run python tests/perf/memory_report.py --workers 4
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def read_memory_kb(pid: int) -> Dict[str, int]:
+    """RSS, PSS and shared/private totals (kB) from ``smaps_rollup``."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 3 and parts[-1] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def descendants(pid: int) -> List[int]:
+    found = []
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        children = (task / "children").read_text().split()
+        for child in map(int, children):
+            found.append(child)
+            found.extend(descendants(child))
+    return found
+
+
+def _cmdline(pid: int) -> str:
+    return Path(f"/proc/{pid}/cmdline").read_bytes().replace(b"\0", b" ").decode(errors="replace")
+
+
+def wait_until_serving(port: int, expected_workers: int, master: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if master.poll() is not None:
+            raise RuntimeError(f"Gateway exited with code {master.returncode} before serving")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+            if len(worker_pids(master.pid)) >= expected_workers:
+                return
+        except OSError:
+            pass
+        time.sleep(1)
+    raise TimeoutError(f"Gateway not serving on port {port} after {timeout:.0f}s")
+
+
+def worker_pids(master_pid: int) -> List[int]:
+    return [pid for pid in descendants(master_pid) if "resource_tracker" not in _cmdline(pid)]
+
+
+def measure(preload: bool, workers: int, port: int, timeout: float) -> List[Dict[str, int]]:
+    command = [sys.executable, "main.py", "--port", str(port), "--workers", str(workers)]
+    if preload:
+        command.append("--preload")
+    master = subprocess.Popen(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_serving(port, workers, master, timeout)
+        # Let lazily-initialized state in every worker settle.
+        time.sleep(2)
+        rows = [{"pid": pid, **read_memory_kb(pid)} for pid in worker_pids(master.pid)]
+        rows.append({"pid": master.pid, "master": 1, **read_memory_kb(master.pid)})
+        return rows
+    finally:
+        master.send_signal(signal.SIGTERM)
+        try:
+            master.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            master.kill()
+
+
+def print_report(label: str, rows: List[Dict[str, int]]) -> None:
+    print(f"\n{label}")
+    print(f"  {'process':<16}{'RSS MiB':>10}{'PSS MiB':>10}{'shared MiB':>12}{'private MiB':>13}")
+    for row in rows:
+        name = f"master {row['pid']}" if row.get("master") else f"worker {row['pid']}"
+        print(
+            f"  {name:<16}{row['rss'] / 1024:>10.1f}{row['pss'] / 1024:>10.1f}"
+            f"{row['shared'] / 1024:>12.1f}{row['private'] / 1024:>13.1f}"
+        )
+    total_pss = sum(row["pss"] for row in rows) / 1024
+    print(f"  {'total PSS':<16}{'':>10}{total_pss:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds to wait for the model to load.")
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("memory_report.py needs Linux /proc/<pid>/smaps_rollup")
+
+    print_report(f"Without preloading ({args.workers} workers)", measure(False, args.workers, args.port, args.timeout))
+    print_report(f"With --preload ({args.workers} workers)", measure(True, args.workers, args.port, args.timeout))
+
+
+if __name__ == "__main__":
+    main()
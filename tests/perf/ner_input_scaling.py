@@ -0,0 +1,97 @@
+"""
+Offline counterpart of ``test_input_scaling.js``: NER latency against the
+length of a single text, up to the maximum message length, for
+
+- "whole": the text through the pipeline in one call, its windows one
+  after another (PL_NER_SEGMENT_LONG_TEXTS off);
+- "segments": cut into sentence-aligned segments run as one batch;
+- "segments xN": the same segments across N threads
+  (PL_NER_SEGMENT_WORKERS).
+
+Also reports how many entity spans of the segmented runs differ from the
+whole-text run (segments see less context at their edges).
+
+    uv run python tests/perf/ner_input_scaling.py
+    uv run python tests/perf/ner_input_scaling.py --sizes 2000 20000 80000 --workers 4 --repeat 3
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from api.config.config import settings
+from application.dtos.chat_request import MAX_CONTENT_LENGTH
+from infrastructure.detectors.pii_pl.detector import PiiPlDetector
+
+DEFAULT_DATASET = Path(__file__).resolve().parents[1] / "eval" / "dataset.json"
+
+
+def build_detector(segment: bool, workers: int) -> PiiPlDetector:
+    overrides = {
+        "pl_ner_segment_long_texts": segment,
+        "pl_ner_segment_min_chars": 0,
+        "pl_ner_segment_workers": workers,
+    }
+    originals = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    try:
+        return PiiPlDetector()
+    finally:
+        for name, value in originals.items():
+            setattr(settings, name, value)
+
+
+def build_text(examples: List[dict], size: int) -> str:
+    corpus = " ".join(ex["text"] for ex in examples)
+    return (corpus * (size // len(corpus) + 1))[:size]
+
+
+def median_ms(detector: PiiPlDetector, text: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        detector.detect(text)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", type=Path, default=DEFAULT_DATASET)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 5_000, 10_000, 20_000, 40_000, MAX_CONTENT_LENGTH])
+    parser.add_argument("--workers", type=int, default=4, help="Threads for the 'segments xN' run")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    examples = json.loads(args.dataset.read_text(encoding="utf-8"))
+    detectors: Dict[str, PiiPlDetector] = {
+        "whole": build_detector(False, 1),
+        "segments": build_detector(True, 1),
+        f"segments x{args.workers}": build_detector(True, args.workers),
+    }
+    for detector in detectors.values():
+        detector.detect(build_text(examples, 2_000))
+
+    names = list(detectors)
+    print(f"{'chars':>8} " + " ".join(f"{name + ' ms':>16}" for name in names) + f" {'spans':>6} {'differ':>7}")
+    for size in args.sizes:
+        text = build_text(examples, size)
+        whole = {(t.type, t.start, t.end) for t in detectors["whole"].detect(text)}
+        segmented = {(t.type, t.start, t.end) for t in detectors["segments"].detect(text)}
+        timings = [median_ms(detector, text, args.repeat) for detector in detectors.values()]
+        print(
+            f"{size:>8} " + " ".join(f"{ms:>16.1f}" for ms in timings)
+            + f" {len(whole):>6} {len(whole ^ segmented):>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
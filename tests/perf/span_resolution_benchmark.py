@@ -0,0 +1,94 @@
+"""
+Time to merge several detectors' spans of one long text, resolve their
+overlaps and drop those touching a placeholder (as ``redact`` does), as
+token objects — ``remove_overlapping_tokens`` plus a check of every token
+against every placeholder — against :class:`SpanSet` columns, at growing
+numbers of candidate spans.
+
+The spans mimic three detectors over a document: most stand alone, some
+detectors agree on the same span or nest one in another, and one text
+position in fifty is inside a placeholder.
+
+    uv run python tests/perf/span_resolution_benchmark.py
+    uv run python tests/perf/span_resolution_benchmark.py --spans 1000 100000 --repeat 5
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from domain.entities.pii_token import PIIToken
+from domain.entities.span_set import SpanSet
+from domain.enums.pii_type import PIIType
+from domain.services.token_overlap import remove_overlapping_tokens
+
+TYPES = [PIIType.PERSON, PIIType.LOCATION, PIIType.PHONE, PIIType.DATE]
+
+
+def build(count: int, rng: random.Random) -> Tuple[str, List[List[PIIToken]], List[Tuple[int, int]]]:
+    per_detector: List[List[PIIToken]] = [[], [], []]
+    position = 0
+    for _ in range(count):
+        position += rng.randrange(5, 60)
+        length = rng.randrange(3, 25)
+        detector = rng.randrange(3)
+        per_detector[detector].append(PIIToken(rng.choice(TYPES), "", "", position, position + length))
+        if rng.random() < 0.1:
+            other = (detector + 1) % 3
+            shift = rng.randrange(0, length)
+            per_detector[other].append(PIIToken(rng.choice(TYPES), "", "", position + shift, position + length + 3))
+    text = "x" * (position + 100)
+    for tokens in per_detector:
+        for token in tokens:
+            token.original_value = text[token.start:token.end]
+    protected = [(start, start + 9) for start in range(0, len(text) - 9, 500)]
+    return text, per_detector, protected
+
+
+def with_tokens(text: str, per_detector: List[List[PIIToken]], protected: List[Tuple[int, int]]) -> List[PIIToken]:
+    tokens = remove_overlapping_tokens([t for tokens in per_detector for t in tokens])
+    return [t for t in tokens if not any(t.start < end and t.end > start for start, end in protected)]
+
+
+def with_columns(text: str, per_detector: List[List[PIIToken]], protected: List[Tuple[int, int]]) -> List[PIIToken]:
+    spans = SpanSet.concat([SpanSet.from_tokens(tokens) for tokens in per_detector])
+    return spans.resolve_overlaps().outside(protected).to_tokens(text)
+
+
+def median_ms(resolve: Callable, *args, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        resolve(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spans", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'spans':>7} {'placeholders':>12} {'kept':>6} {'tokens ms':>10} {'columns ms':>11}")
+    for count in args.spans:
+        text, per_detector, protected = build(count, rng)
+        kept = with_columns(text, per_detector, protected)
+        assert kept == with_tokens(text, per_detector, protected)
+        print(
+            f"{count:>7} {len(protected):>12} {len(kept):>6} "
+            f"{median_ms(with_tokens, text, per_detector, protected, repeat=args.repeat):>10.1f} "
+            f"{median_ms(with_columns, text, per_detector, protected, repeat=args.repeat):>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -242,3 +242,102 @@ async def test_redact_async():
 
     assert redacted == "[REDACTED:EMAIL] to wymyślony adres."
     assert found == tokens
+
+
+class BatchRecordingDetector(MockDetector):
+    def __init__(self, tokens_to_return: List[PIIToken]):
+        super().__init__(tokens_to_return)
+        self.batches: List[List[str]] = []
+
+    def detect_batch(self, texts: List[str]) -> List[List[PIIToken]]:
+        self.batches.append(list(texts))
+        return [[t for t in self.tokens_to_return if text[t.start:t.end] == t.original_value] for text in texts]
+
+
+def test_anonymize_batch_detects_once_and_numbers_like_sequential_calls():
+    texts = ["Jan i Ewa", "Ewa", "Ola i Jan"]
+    tokens = [PIIToken(PIIType.PERSON, "Jan", "", 0, 3), PIIToken(PIIType.PERSON, "Ewa", "", 6, 9),
+              PIIToken(PIIType.PERSON, "Ewa", "", 0, 3), PIIToken(PIIType.PERSON, "Ola", "", 0, 3),
+              PIIToken(PIIType.PERSON, "Jan", "", 6, 9)]
+    detector = BatchRecordingDetector(tokens)
+
+    anonymized, mapping = AnonymizerService([detector]).anonymize_batch(texts)
+
+    assert detector.batches == [texts]
+    assert anonymized == ["<PERSON1> i <PERSON2>", "<PERSON2>", "<PERSON3> i <PERSON1>"]
+    assert mapping["<PERSON3>"].original_value == "Ola"
+
+
+def test_scoped_batch_skips_blank_texts_and_keeps_numbering_across_calls():
+    detector = BatchRecordingDetector([PIIToken(PIIType.PERSON, "Jan", "", 0, 3), PIIToken(PIIType.PERSON, "Ewa", "", 0, 3)])
+    anonymize_texts = AnonymizerService([detector]).scoped_batch()
+
+    assert anonymize_texts(["Jan", "  ", ""]) == ["<PERSON1>", "  ", ""]
+    assert anonymize_texts(["Ewa", "Jan"]) == ["<PERSON2>", "<PERSON1>"]
+    assert detector.batches == [["Jan"], ["Ewa", "Jan"]]
+
+
+def test_deanonymize_does_not_rescan_restored_values():
+    """Placeholders are resolved in one pass: a restored value that itself
+    looks like a placeholder is user text and must come back verbatim."""
+    mapping = {"<ORGANIZATION1>": PIIToken(PIIType.ORGANIZATION, "Firma <PERSON2>", "<ORGANIZATION1>", 0, 15)}
+    service = AnonymizerService([])
+
+    restored = service.deanonymize("Umowa z <ORGANIZATION1> i <PERSON2>", mapping)
+
+    assert restored == "Umowa z Firma <PERSON2> i "
+
+
+class WordDetector:
+    """Finds fixed words as PERSON and records the texts it scanned."""
+
+    def __init__(self, *words: str):
+        self.words = words
+        self.scanned: List[str] = []
+
+    def detect(self, text: str) -> List[PIIToken]:
+        self.scanned.append(text)
+        tokens = []
+        for word in self.words:
+            start = text.find(word)
+            while start != -1:
+                tokens.append(PIIToken(PIIType.PERSON, word, "", start, start + len(word)))
+                start = text.find(word, start + 1)
+        return tokens
+
+
+def test_finalize_response_matches_redact_then_deanonymize():
+    service = AnonymizerService([WordDetector("Marek", "PERSON1")])
+    mapping = {"<PERSON1>": PIIToken(PIIType.PERSON, "Jan Kowalski", "<PERSON1>", 0, 12)}
+    text = "<PERSON1> zna Marka. Marek mieszka z <PERSON7>."
+
+    redacted, found = service.redact(text)
+    expected = service.deanonymize(redacted, mapping)
+
+    assert service.finalize_response(text, mapping) == (expected, "<PERSON1> zna Marka. [REDACTED:PERSON] mieszka z .", found)
+    assert expected == "Jan Kowalski zna Marka. [REDACTED:PERSON] mieszka z ."
+
+
+def test_finalize_response_skips_sentences_echoed_from_the_prompt():
+    detector = WordDetector("Marek")
+    service = AnonymizerService([detector])
+    mapping = {"<PERSON1>": PIIToken(PIIType.PERSON, "Jan Kowalski", "<PERSON1>", 0, 12)}
+    prompt = "Streść to:\n<PERSON1> podpisał umowę. Termin minął wczoraj."
+    response = "Termin minął wczoraj.\n<PERSON1> podpisał umowę. Marek to potwierdził. Koniec."
+
+    final, _, found = service.finalize_response(response, mapping, [prompt])
+
+    assert final == "Termin minął wczoraj.\nJan Kowalski podpisał umowę. [REDACTED:PERSON] to potwierdził. Koniec."
+    assert [t.type for t in found] == [PIIType.PERSON]
+    assert detector.scanned == ["Marek to potwierdził. Koniec."]
+
+
+@pytest.mark.asyncio
+async def test_finalize_response_async_with_a_fully_echoed_response_runs_no_detection():
+    detector = WordDetector("Marek")
+    service = AnonymizerService([detector])
+
+    final, _, found = await service.finalize_response_async("Ala ma kota.", {}, ["Ala ma kota. Kot ma Alę."])
+
+    assert (final, found) == ("Ala ma kota.", [])
+    assert detector.scanned == []
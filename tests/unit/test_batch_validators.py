@@ -0,0 +1,74 @@
+import random
+from typing import List
+import pytest
+from infrastructure.detectors.validators import (
+    is_valid_iban_checksum,
+    is_valid_iban_checksum_batch,
+    is_valid_nip,
+    is_valid_nip_batch,
+    is_valid_pesel,
+    is_valid_pesel_batch,
+    is_valid_regon,
+    is_valid_regon_batch,
+)
+
+_VALID = {
+    "pesel": ["44051401359"],
+    "nip": ["1234563218", "5260250995"],
+    "regon": ["123456785", "12345678512347"],
+    "iban": ["PL61109010140000071219812874", "DE89370400440532013000", "GB82WEST12345698765432"],
+}
+
+
+def _random_digits(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice("0123456789") for _ in range(length))
+
+
+def _candidates(rng: random.Random, lengths: List[int], valid: List[str]) -> List[str]:
+    out = list(valid)
+    for _ in range(3000):
+        out.append(_random_digits(rng, rng.choice(lengths)))
+    # Unicode digits, non-digits and wrong lengths go the scalar way.
+    out += ["٤٤٠٥١٤٠١٣٥٩", "4405140135x", "", "1" * 12, "１２３４５６３２１８"]
+    return out
+
+
+@pytest.mark.parametrize("batch, scalar, lengths, kind", [
+    (is_valid_pesel_batch, is_valid_pesel, [11], "pesel"),
+    (is_valid_nip_batch, is_valid_nip, [10], "nip"),
+    (is_valid_regon_batch, is_valid_regon, [9, 14], "regon"),
+])
+def test_digit_batches_match_scalar_validators(batch, scalar, lengths, kind):
+    candidates = _candidates(random.Random(kind), lengths, _VALID[kind])
+    result = batch(candidates)
+    assert list(result) == [scalar(c) for c in candidates]
+    assert result[:len(_VALID[kind])].all()
+    # Random digits pass the checksum often enough to exercise both outcomes.
+    assert 0 < result.sum() < len(candidates)
+
+
+def test_iban_batch_matches_scalar_validator():
+    rng = random.Random(97)
+    codes = list(_VALID["iban"])
+    for _ in range(3000):
+        length = rng.choice([4, 15, 22, 28])
+        country = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(2))
+        body = "".join(rng.choice("0123456789ABCZ") for _ in range(length - 4))
+        codes.append(country + _random_digits(rng, 2) + body)
+    # A valid code with its check digits recomputed for a random body.
+    for _ in range(200):
+        body = _random_digits(rng, 24)
+        check = 98 - int(body + "252100") % 97
+        codes.append(f"PL{check:02d}{body}")
+    codes += ["pl61109010140000071219812874", "PL6110901014000007121981287!", "P161109010", "PL", "PLżż0000", "12PL3456"]
+
+    result = is_valid_iban_checksum_batch(codes)
+    assert list(result) == [is_valid_iban_checksum(c) for c in codes]
+    assert result[:len(_VALID["iban"])].all()
+    assert result.sum() >= 200
+
+
+def test_empty_batches():
+    assert len(is_valid_pesel_batch([])) == 0
+    assert len(is_valid_regon_batch([])) == 0
+    assert len(is_valid_iban_checksum_batch([])) == 0
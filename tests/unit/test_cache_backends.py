@@ -0,0 +1,235 @@
+import socketserver
+import threading
+import time
+
+import pytest
+
+from api.config.config import settings
+from domain.entities.span_set import SpanSet
+from domain.enums.pii_type import PIIType
+from infrastructure.cache.memory_backend import MemoryCacheBackend
+from infrastructure.cache.resp_backend import RespCacheBackend, RespError, encode_command
+from infrastructure.cache.sqlite_backend import SqliteCacheBackend
+from infrastructure.factories.cache_factory import create_detection_cache
+
+
+class _RespStandIn(socketserver.ThreadingTCPServer):
+    """Minimal Redis stand-in: GET, SET [PX], AUTH, SELECT, PING."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password=None):
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.password = password
+        self.data = {}
+        self.commands = []
+        self.lock = threading.Lock()
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def _read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        server = self.server
+        authenticated = server.password is None
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            name = args[0].upper()
+            with server.lock:
+                server.commands.append(name)
+            if name == b"AUTH":
+                authenticated = args[-1].decode() == server.password
+                self.wfile.write(b"+OK\r\n" if authenticated else b"-WRONGPASS invalid password\r\n")
+            elif not authenticated:
+                self.wfile.write(b"-NOAUTH Authentication required.\r\n")
+            elif name in (b"PING", b"SELECT"):
+                self.wfile.write(b"+OK\r\n")
+            elif name == b"SET":
+                expires = time.monotonic() + int(args[4]) / 1000 if len(args) > 3 else None
+                with server.lock:
+                    server.data[args[1]] = (args[2], expires)
+                self.wfile.write(b"+OK\r\n")
+            elif name == b"GET":
+                with server.lock:
+                    value, expires = server.data.get(args[1], (None, None))
+                if value is None or (expires is not None and time.monotonic() >= expires):
+                    self.wfile.write(b"$-1\r\n")
+                else:
+                    self.wfile.write(b"$%d\r\n%s\r\n" % (len(value), value))
+            else:
+                self.wfile.write(b"-ERR unknown command\r\n")
+
+
+@pytest.fixture
+def resp_server():
+    servers = []
+
+    def start(password=None):
+        server = _RespStandIn(password)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _url(server, password=None, db=0):
+    host, port = server.server_address
+    auth = f":{password}@" if password else ""
+    return f"redis://{auth}{host}:{port}/{db}"
+
+
+class TestMemoryCacheBackend:
+    def test_roundtrip_and_lru_eviction(self):
+        backend = MemoryCacheBackend(max_entries=1)
+        backend.set(b"a", b"1", 60)
+        backend.set(b"b", b"2", 60)
+
+        assert backend.get(b"a") is None
+        assert backend.get(b"b") == b"2"
+
+
+class TestSqliteCacheBackend:
+    def test_roundtrip_is_visible_to_another_instance(self, tmp_path):
+        path = str(tmp_path / "detections.sqlite3")
+        SqliteCacheBackend(path, max_entries=10).set(b"key", b"\x00\x01", 60)
+
+        assert SqliteCacheBackend(path, max_entries=10).get(b"key") == b"\x00\x01"
+
+    def test_expired_rows_are_not_returned(self, tmp_path):
+        now = [1000.0]
+        backend = SqliteCacheBackend(str(tmp_path / "c.sqlite3"), max_entries=10, clock=lambda: now[0])
+        backend.set(b"key", b"value", 60)
+
+        now[0] += 61
+        assert backend.get(b"key") is None
+
+    def test_prune_trims_to_max_entries_keeping_freshest(self, tmp_path):
+        now = [1000.0]
+        backend = SqliteCacheBackend(
+            str(tmp_path / "c.sqlite3"), max_entries=2, prune_every=100, clock=lambda: now[0]
+        )
+        for i in range(4):
+            now[0] += 1
+            backend.set(b"k%d" % i, b"v", 60)
+
+        backend.prune()
+
+        assert backend.stats()["entries"] == 2
+        assert backend.get(b"k0") is None
+        assert backend.get(b"k3") == b"v"
+
+    def test_usable_from_several_threads(self, tmp_path):
+        backend = SqliteCacheBackend(str(tmp_path / "c.sqlite3"), max_entries=100)
+
+        def write(i):
+            backend.set(b"k%d" % i, b"v%d" % i, 60)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(backend.get(b"k%d" % i) == b"v%d" % i for i in range(8))
+
+
+class TestRespCacheBackend:
+    def test_encode_command(self):
+        assert encode_command("GET", b"k\r\n", 5) == b"*3\r\n$3\r\nGET\r\n$3\r\nk\r\n\r\n$1\r\n5\r\n"
+
+    def test_roundtrip_with_binary_value(self, resp_server):
+        backend = RespCacheBackend(_url(resp_server()))
+        value = bytes(range(256))
+
+        backend.set(b"\x00key", value, 60)
+
+        assert backend.get(b"\x00key") == value
+        assert backend.get(b"missing") is None
+
+    def test_keys_are_prefixed(self, resp_server):
+        server = resp_server()
+        RespCacheBackend(_url(server)).set(b"k", b"v", 1.5)
+
+        assert list(server.data) == [b"piast-gate:det:k"]
+
+    def test_authenticates_and_selects_db(self, resp_server):
+        server = resp_server(password="tajne")
+        backend = RespCacheBackend(_url(server, password="tajne", db=3))
+
+        backend.set(b"k", b"v", 60)
+
+        assert server.commands[:2] == [b"AUTH", b"SELECT"]
+        assert backend.get(b"k") == b"v"
+
+    def test_server_error_reply_is_raised(self, resp_server):
+        backend = RespCacheBackend(_url(resp_server(password="tajne")))
+
+        with pytest.raises(RespError, match="NOAUTH"):
+            backend.get(b"k")
+
+    def test_reconnects_after_dropped_connection(self, resp_server):
+        backend = RespCacheBackend(_url(resp_server()))
+        backend.set(b"k", b"v", 60)
+        backend._local.conn[0].close()
+
+        assert backend.get(b"k") == b"v"
+
+    def test_rejects_non_redis_url(self):
+        with pytest.raises(ValueError, match="scheme"):
+            RespCacheBackend("http://localhost:6379")
+
+
+class TestCacheFactory:
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "detection_cache_enabled", False)
+
+        assert create_detection_cache() is None
+
+    def test_memory_backend_needs_no_secret(self, monkeypatch):
+        monkeypatch.setattr(settings, "detection_cache_enabled", True)
+        monkeypatch.setattr(settings, "detection_cache_backend", "memory")
+        monkeypatch.setattr(settings, "detection_cache_key_secret", None)
+
+        assert isinstance(create_detection_cache().backend, MemoryCacheBackend)
+
+    def test_shared_backend_requires_secret(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "detection_cache_enabled", True)
+        monkeypatch.setattr(settings, "detection_cache_backend", "sqlite")
+        monkeypatch.setattr(settings, "detection_cache_sqlite_path", str(tmp_path / "c.sqlite3"))
+        monkeypatch.setattr(settings, "detection_cache_key_secret", None)
+
+        with pytest.raises(ValueError, match="DETECTION_CACHE_KEY_SECRET"):
+            create_detection_cache()
+
+    def test_unknown_backend(self, monkeypatch):
+        monkeypatch.setattr(settings, "detection_cache_enabled", True)
+        monkeypatch.setattr(settings, "detection_cache_backend", "memcached")
+
+        with pytest.raises(ValueError, match="Unknown detection cache backend"):
+            create_detection_cache()
+
+    def test_two_workers_share_results_through_redis(self, monkeypatch, resp_server):
+        monkeypatch.setattr(settings, "detection_cache_enabled", True)
+        monkeypatch.setattr(settings, "detection_cache_backend", "redis")
+        monkeypatch.setattr(settings, "detection_cache_redis_url", _url(resp_server()))
+        monkeypatch.setattr(settings, "detection_cache_key_secret", "shared")
+        worker_a, worker_b = create_detection_cache(), create_detection_cache()
+
+        worker_a.put(worker_a.key("fp", "Jan"), SpanSet.from_spans([(0, 3, PIIType.PERSON)]))
+
+        assert worker_b.get(worker_b.key("fp", "Jan")).spans() == [(0, 3, PIIType.PERSON)]
@@ -0,0 +1,242 @@
+import pytest
+from typing import List
+from application.dtos.chat_request import ChatMessage, ChatRequest
+from application.services.conversation_session_store import ConversationSessionStore
+from application.services.message_anonymizer import anonymize_messages
+from application.use_cases.chat_use_case import ChatUseCase
+from application.use_cases.stream_chat_use_case import StreamChatUseCase
+from domain.entities.llm_response import LLMResponse
+from domain.entities.pii_token import PIIToken
+from domain.entities.stream_delta import StreamDelta
+from domain.enums.pii_type import PIIType
+from domain.services.anonymizer_service import AnonymizerService
+
+
+class NameDetector:
+    def __init__(self, names=("Jan Kowalski", "Anna Nowak", "Kraków")):
+        self.names = names
+        self.calls: List[str] = []
+
+    def detect(self, text: str) -> List[PIIToken]:
+        self.calls.append(text)
+        tokens = []
+        for name in self.names:
+            start = text.find(name)
+            while start != -1:
+                pii_type = PIIType.LOCATION if name == "Kraków" else PIIType.PERSON
+                tokens.append(PIIToken(pii_type, name, "", start, start + len(name)))
+                start = text.find(name, start + 1)
+        return tokens
+
+
+class EchoLLM:
+    """Answers with a fixed template and records the messages it was sent."""
+
+    def __init__(self, reply="Dzień dobry <PERSON1>!"):
+        self.reply = reply
+        self.received = []
+
+    async def chat(self, messages, model, **kwargs):
+        self.received.append(messages)
+        return LLMResponse(content=self.reply)
+
+
+class StreamingLLM:
+    """Streams a fixed reply in the given chunks and records the messages it was sent."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.received = []
+
+    async def chat_stream(self, messages, model, **kwargs):
+        self.received.append(messages)
+        for chunk in self.chunks:
+            yield StreamDelta(content=chunk)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _user(text):
+    return ChatMessage(role="user", content=text)
+
+
+class TestConversationSessionStore:
+    def test_same_client_and_id_resume_the_session(self):
+        store = ConversationSessionStore(ttl_seconds=60, max_sessions=10)
+
+        first = store.get_or_create("client-a", "conv-1")
+
+        assert store.get_or_create("client-a", "conv-1") is first
+        assert store.stats()["resumed"] == 1
+
+    def test_other_client_cannot_resume_the_session(self):
+        store = ConversationSessionStore(ttl_seconds=60, max_sessions=10)
+
+        assert store.get_or_create("client-a", "conv-1") is not store.get_or_create("client-b", "conv-1")
+
+    def test_idle_session_expires(self):
+        clock = FakeClock()
+        store = ConversationSessionStore(ttl_seconds=60, max_sessions=10, clock=clock)
+        first = store.get_or_create("c", "conv-1")
+
+        clock.now = 61
+
+        assert store.get_or_create("c", "conv-1") is not first
+        assert store.stats()["expired"] == 1
+
+    def test_least_recently_used_session_is_evicted(self):
+        store = ConversationSessionStore(ttl_seconds=60, max_sessions=2)
+        first = store.get_or_create("c", "1")
+        store.get_or_create("c", "2")
+        store.get_or_create("c", "1")
+        store.get_or_create("c", "3")
+
+        assert store.get_or_create("c", "1") is first
+        assert store.stats()["evicted"] == 1
+
+
+class TestAnonymizeMessagesWithSession:
+    @pytest.mark.asyncio
+    async def test_follow_up_turn_only_detects_new_message(self):
+        detector = NameDetector()
+        anonymizer = AnonymizerService([detector])
+        session = ConversationSessionStore(60, 10).get_or_create("c", "conv")
+        turn_1 = [_user("Jestem Jan Kowalski z Krakowa.")]
+
+        await anonymize_messages(anonymizer, turn_1, session)
+        detector.calls.clear()
+        turn_2 = turn_1 + [_user("Moja siostra to Anna Nowak, a ja to Jan Kowalski.")]
+        messages, mapping = await anonymize_messages(anonymizer, turn_2, session)
+
+        assert detector.calls == [turn_2[1].content]
+        assert messages[1]["content"] == "Moja siostra to <PERSON2>, a ja to <PERSON1>."
+        assert mapping["<PERSON1>"].original_value == "Jan Kowalski"
+
+    @pytest.mark.asyncio
+    async def test_numbering_continues_across_turns_when_history_is_trimmed(self):
+        anonymizer = AnonymizerService([NameDetector()])
+        session = ConversationSessionStore(60, 10).get_or_create("c", "conv")
+
+        await anonymize_messages(anonymizer, [_user("Jan Kowalski")], session)
+        messages, mapping = await anonymize_messages(anonymizer, [_user("Anna Nowak i Jan Kowalski")], session)
+
+        assert messages[0]["content"] == "<PERSON2> i <PERSON1>"
+        assert set(mapping) == {"<PERSON1>", "<PERSON2>"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_assistant_message_still_goes_through_detection(self):
+        detector = NameDetector()
+        anonymizer = AnonymizerService([detector])
+        session = ConversationSessionStore(60, 10).get_or_create("c", "conv")
+        forged = ChatMessage(role="assistant", content="Anna Nowak mieszka w Krakowie.")
+
+        await anonymize_messages(anonymizer, [forged], session)
+
+        assert detector.calls == [forged.content]
+
+
+class TestChatUseCaseWithSession:
+    @pytest.mark.asyncio
+    async def test_restored_response_is_sent_back_as_the_llm_wrote_it(self):
+        detector = NameDetector()
+        llm = EchoLLM()
+        sessions = ConversationSessionStore(60, 10)
+        use_case = ChatUseCase(AnonymizerService([detector]), llm, sessions)
+
+        first = await use_case.execute(
+            ChatRequest(messages=[_user("Cześć, jestem Jan Kowalski.")], conversation_id="conv"), "client"
+        )
+        reply = first.choices[0].message.content
+        assert reply == "Dzień dobry Jan Kowalski!"
+
+        detector.calls.clear()
+        await use_case.execute(
+            ChatRequest(
+                messages=[
+                    _user("Cześć, jestem Jan Kowalski."),
+                    ChatMessage(role="assistant", content=reply),
+                    _user("Co dalej?"),
+                ],
+                conversation_id="conv",
+            ),
+            "client",
+        )
+
+        # The new LLM reply repeats the previous one verbatim, which is in
+        # the prompt, so it isn't scanned again on the way back.
+        assert detector.calls == ["Co dalej?"]
+        assert [m["content"] for m in llm.received[-1]] == [
+            "Cześć, jestem <PERSON1>.",
+            "Dzień dobry <PERSON1>!",
+            "Co dalej?",
+        ]
+        assert sessions.stats()["texts"] == {"reused": 1, "produced": 1, "detected": 2}
+
+    @pytest.mark.asyncio
+    async def test_inflected_placeholder_in_restored_response_does_not_leak(self):
+        llm = EchoLLM("Przekaż to <PERSON1>emu.")
+        use_case = ChatUseCase(AnonymizerService([NameDetector()]), llm, ConversationSessionStore(60, 10))
+
+        first = await use_case.execute(
+            ChatRequest(messages=[_user("Jan Kowalski")], conversation_id="conv"), "client"
+        )
+        reply = first.choices[0].message.content
+        assert reply == "Przekaż to Jan Kowalskiemu."
+
+        await use_case.execute(
+            ChatRequest(
+                messages=[_user("Jan Kowalski"), ChatMessage(role="assistant", content=reply), _user("Dzięki.")],
+                conversation_id="conv",
+            ),
+            "client",
+        )
+
+        assert llm.received[-1][1]["content"] == "Przekaż to <PERSON1>emu."
+
+    @pytest.mark.asyncio
+    async def test_streamed_response_is_sent_back_as_the_llm_wrote_it(self):
+        detector = NameDetector()
+        llm = StreamingLLM(["Przekaż to <PER", "SON1>emu", "."])
+        anonymizer = AnonymizerService([detector])
+        use_case = StreamChatUseCase(anonymizer, llm, AnonymizerService([]), ConversationSessionStore(60, 10))
+
+        chunks = [
+            chunk
+            async for chunk in use_case.execute(
+                ChatRequest(messages=[_user("Jan Kowalski")], conversation_id="conv", stream=True), "client"
+            )
+        ]
+        reply = "".join(chunk.choices[0].delta.content or "" for chunk in chunks if chunk.choices)
+        assert reply == "Przekaż to Jan Kowalskiemu."
+
+        detector.calls.clear()
+        async for _ in use_case.execute(
+            ChatRequest(
+                messages=[_user("Jan Kowalski"), ChatMessage(role="assistant", content=reply), _user("Dzięki.")],
+                conversation_id="conv",
+                stream=True,
+            ),
+            "client",
+        ):
+            pass
+
+        assert detector.calls == ["Dzięki."]
+        assert llm.received[-1][1]["content"] == "Przekaż to <PERSON1>emu."
+
+    @pytest.mark.asyncio
+    async def test_without_conversation_id_every_turn_is_detected_in_full(self):
+        detector = NameDetector()
+        llm = EchoLLM()
+        use_case = ChatUseCase(AnonymizerService([detector]), llm, ConversationSessionStore(60, 10))
+        request = ChatRequest(messages=[_user("Jan Kowalski")])
+
+        await use_case.execute(request, "client")
+        await use_case.execute(request, "client")
+
+        assert detector.calls == ["Jan Kowalski", llm.reply] * 2
@@ -0,0 +1,132 @@
+import os
+
+import pytest
+
+from domain.enums.pii_type import PIIType
+from infrastructure.detectors.deny_list import DenyListDetector
+from infrastructure.detectors.deny_list.automaton import FOLD_CASE, FOLD_DIACRITICS, DenyListAutomaton, write_automaton
+from infrastructure.detectors.deny_list.build import read_terms
+
+ENTRIES = [
+    ("ORGANIZATION", "ACME Sp. z o.o."),
+    ("ORGANIZATION", "Maria Rokita Holding"),
+    ("PERSON", "Zażółć Gęślą"),
+    ("PERSON", "Jan Maria Rokita"),
+    ("PERSON", "Rokita"),
+    ("IDENTIFIER", "CL-2023-0042"),
+]
+
+
+def _compile(tmp_path, entries=ENTRIES, options=FOLD_CASE | FOLD_DIACRITICS, name="deny.bin"):
+    path = tmp_path / name
+    write_automaton(entries, path, options)
+    return path
+
+
+def _found(detector, text):
+    return [(t.type, t.original_value) for t in detector.detect(text)]
+
+
+def test_matches_whole_terms_with_folding(tmp_path):
+    detector = DenyListDetector(str(_compile(tmp_path)))
+
+    text = "Umowa z acme sp. z o.o., klient ZAZOLC GESLA, id cl 2023 0042."
+
+    assert _found(detector, text) == [
+        (PIIType.ORGANIZATION, "acme sp. z o.o"),
+        (PIIType.PERSON, "ZAZOLC GESLA"),
+        (PIIType.IDENTIFIER, "cl 2023 0042"),
+    ]
+
+
+def test_prefers_leftmost_then_longest_term(tmp_path):
+    detector = DenyListDetector(str(_compile(tmp_path)))
+
+    assert _found(detector, "Jan Maria Rokita Holding") == [(PIIType.PERSON, "Jan Maria Rokita")]
+    assert _found(detector, "Maria Rokita Holding") == [(PIIType.ORGANIZATION, "Maria Rokita Holding")]
+    # A term inside a longer, unfinished one is still found (failure links).
+    assert _found(detector, "Jan Maria Rokitowa, pan Rokita") == [(PIIType.PERSON, "Rokita")]
+
+
+def test_only_whole_words_match(tmp_path):
+    detector = DenyListDetector(str(_compile(tmp_path)))
+
+    assert detector.detect("Rokitański i ACMEcorp") == []
+
+
+def test_without_folding_matches_exactly(tmp_path):
+    detector = DenyListDetector(str(_compile(tmp_path, options=0)))
+
+    assert detector.detect("zażółć gęślą, Zazolc Gesla") == []
+    assert _found(detector, "Zażółć Gęślą") == [(PIIType.PERSON, "Zażółć Gęślą")]
+
+
+def test_matches_agree_with_naive_search_on_overlapping_terms(tmp_path):
+    words = ["a", "b", "c", "d"]
+    terms = [" ".join(words[i:j]) for i in range(4) for j in range(i + 1, 5) if (i + j) % 3]
+    automaton = DenyListAutomaton(_compile(tmp_path, [("PERSON", t) for t in terms]))
+    text = "a b c d c b a b c a d d b c"
+    tokens = text.split()
+
+    expected = []
+    position = 0
+    while position < len(tokens):
+        for length in range(len(tokens) - position, 0, -1):
+            if " ".join(tokens[position:position + length]) in terms:
+                expected.append(" ".join(tokens[position:position + length]))
+                position += length
+                break
+        else:
+            position += 1
+
+    assert [text[start:end] for start, end, _ in automaton.find(text)] == expected
+
+
+def test_reports_nothing_without_a_file(tmp_path):
+    assert DenyListDetector(str(tmp_path / "missing.bin")).detect("Rokita") == []
+    assert DenyListDetector(None).detect("Rokita") == []
+
+
+def test_hot_swaps_a_rebuilt_list(tmp_path):
+    path = _compile(tmp_path)
+    detector = DenyListDetector(str(path), reload_seconds=0)
+    before = detector.fingerprint()
+    assert _found(detector, "Nowak i Rokita") == [(PIIType.PERSON, "Rokita")]
+
+    write_automaton([("PERSON", "Nowak")], path, FOLD_CASE)
+    os.utime(path, ns=(1, 1))
+
+    assert _found(detector, "Nowak i Rokita") == [(PIIType.PERSON, "Nowak")]
+    assert detector.fingerprint() != before
+    assert detector.stats()["reloads"] == 2
+
+
+def test_keeps_previous_list_when_the_new_one_is_broken(tmp_path):
+    path = _compile(tmp_path)
+    detector = DenyListDetector(str(path), reload_seconds=0)
+
+    broken = tmp_path / "broken.bin"
+    broken.write_bytes(b"garbage" * 10)
+    os.replace(broken, path)
+
+    assert _found(detector, "pan Rokita") == [(PIIType.PERSON, "Rokita")]
+    assert detector.stats()["failed_reloads"] == 1
+
+
+def test_read_terms_uses_line_types_and_default(tmp_path):
+    registry = tmp_path / "registry.txt"
+    registry.write_text("ORGANIZATION\tACME S.A.\nJan Nowak\n\nIDENTIFIER\tK-001\n", encoding="utf-8")
+
+    assert list(read_terms([registry], "PERSON")) == [
+        ("ORGANIZATION", "ACME S.A."),
+        ("PERSON", "Jan Nowak"),
+        ("IDENTIFIER", "K-001"),
+    ]
+
+
+def test_read_terms_rejects_unknown_types(tmp_path):
+    registry = tmp_path / "registry.txt"
+    registry.write_text("CLIENT\tJan Nowak\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="CLIENT"):
+        list(read_terms([registry], "PERSON"))
@@ -0,0 +1,207 @@
+import struct
+import pytest
+from typing import List
+from domain.entities.pii_token import PIIToken
+from domain.entities.span_set import SpanSet
+from domain.enums.pii_type import PIIType
+from domain.services.anonymizer_service import AnonymizerService, detector_fingerprint
+from domain.services.detection_cache import DetectionCache
+from infrastructure.cache.memory_backend import MemoryCacheBackend
+
+
+class NameDetector:
+    """Finds fixed names and counts how many texts it was run on."""
+
+    def __init__(self, names=("Jan", "Anna")):
+        self.names = names
+        self.calls: List[str] = []
+
+    def detect(self, text: str) -> List[PIIToken]:
+        self.calls.append(text)
+        tokens = []
+        for name in self.names:
+            start = text.find(name)
+            while start != -1:
+                tokens.append(PIIToken(PIIType.PERSON, name, "", start, start + len(name)))
+                start = text.find(name, start + 1)
+        return tokens
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _spans(*spans):
+    return SpanSet.from_spans((start, end, PIIType.PERSON) for start, end in spans)
+
+
+def _cache(max_entries=10, ttl_seconds=60, clock=None):
+    backend = MemoryCacheBackend(max_entries, clock=clock) if clock else MemoryCacheBackend(max_entries)
+    return DetectionCache(backend, ttl_seconds, key_secret=b"secret")
+
+
+class FailingBackend:
+    def get(self, key):
+        raise ConnectionError("cache server down")
+
+    def set(self, key, value, ttl_seconds):
+        raise ConnectionError("cache server down")
+
+    def stats(self):
+        return {}
+
+
+class TestDetectionCache:
+    def test_miss_then_hit(self):
+        cache = _cache()
+        key = cache.key("fp", "Jan")
+
+        assert cache.get(key) is None
+        cache.put(key, _spans((0, 3)))
+
+        assert cache.get(key).spans() == [(0, 3, PIIType.PERSON)]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_only_spans_are_stored(self):
+        backend = MemoryCacheBackend(10)
+        cache = DetectionCache(backend, 60, key_secret=b"secret")
+        key = cache.key("fp", "Jan Kowalski")
+        cache.put(key, SpanSet.from_tokens([PIIToken(PIIType.PERSON, "Jan Kowalski", "<PERSON1>", 0, 12)]))
+
+        assert b"Jan" not in backend.get(key)
+        assert b"Jan" not in key
+
+    def test_key_depends_on_fingerprint_text_and_secret(self):
+        cache = _cache()
+        other_secret = DetectionCache(MemoryCacheBackend(10), 60, key_secret=b"other")
+
+        assert cache.key("a", "Jan") != cache.key("b", "Jan")
+        assert cache.key("a", "Jan") != cache.key("a", "Jan ")
+        assert cache.key("a", "Jan") != other_secret.key("a", "Jan")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = _cache(max_entries=2)
+        first, second, third = (cache.key("fp", t) for t in ("1", "2", "3"))
+        cache.put(first, _spans())
+        cache.put(second, _spans())
+        cache.get(first)
+        cache.put(third, _spans())
+
+        assert cache.get(second) is None
+        assert len(cache.get(first)) == 0
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        clock = FakeClock()
+        cache = _cache(ttl_seconds=60, clock=clock)
+        key = cache.key("fp", "Jan")
+        cache.put(key, _spans((0, 3)))
+
+        clock.now = 61
+        assert cache.get(key) is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["entries"] == 0
+
+    def test_backend_failure_is_a_miss(self):
+        cache = DetectionCache(FailingBackend(), 60, key_secret=b"secret")
+        key = cache.key("fp", "Jan")
+
+        cache.put(key, _spans((0, 3)))
+
+        assert cache.get(key) is None
+        assert cache.stats()["errors"] == 2
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            b"not a record",
+            struct.pack("!IIB", 0, 3, 200),
+            struct.pack("!IIB", 3, 0, PIIType.PERSON.value),
+        ],
+    )
+    def test_undecodable_entry_is_an_error_and_a_miss(self, value):
+        backend = MemoryCacheBackend(10)
+        cache = DetectionCache(backend, 60, key_secret=b"secret")
+        key = cache.key("fp", "Jan")
+        backend.set(key, value, 60)
+
+        assert cache.get(key) is None
+        assert cache.stats()["errors"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_stats_report_lookup_and_detection_latency(self):
+        cache = _cache()
+        key = cache.key("fp", "Jan")
+        cache.get(key)
+        cache.put(key, _spans(), detect_seconds=0.25)
+
+        latency = cache.stats()["latency"]
+        assert latency["get"]["count"] == 1
+        assert latency["set"]["count"] == 1
+        assert latency["detect"]["p50_ms"] == 250.0
+
+
+class TestAnonymizerServiceWithCache:
+    def test_repeated_text_skips_detectors(self):
+        detector = NameDetector()
+        service = AnonymizerService([detector], _cache())
+
+        first = service.anonymize("Jan i Anna")
+        second = service.anonymize("Jan i Anna")
+
+        assert detector.calls == ["Jan i Anna"]
+        assert first[0] == second[0] == "<PERSON1> i <PERSON2>"
+        assert second[1]["<PERSON1>"].original_value == "Jan"
+
+    def test_cached_tokens_are_not_shared_between_calls(self):
+        service = AnonymizerService([NameDetector()], _cache())
+        _, first_mapping = service.anonymize("Anna")
+        _, second_mapping = service.anonymize("Anna", {"PERSON": 4}, {})
+
+        assert first_mapping["<PERSON1>"].token_str == "<PERSON1>"
+        assert second_mapping["<PERSON5>"].token_str == "<PERSON5>"
+
+    @pytest.mark.asyncio
+    async def test_multi_turn_detects_only_new_message_and_numbers_identically(self):
+        detector = NameDetector()
+        cached = AnonymizerService([detector], _cache())
+        uncached = AnonymizerService([NameDetector()])
+        turn_1 = ["Jestem Jan.", "Cześć Jan!"]
+        turn_2 = turn_1 + ["Poznaj Annę, Anna to moja siostra. Jan"]
+
+        await cached.anonymize_texts_async(turn_1)
+        detector.calls.clear()
+        texts, mapping = await cached.anonymize_texts_async(turn_2)
+
+        assert detector.calls == [turn_2[-1]]
+        expected_texts, expected_mapping = await uncached.anonymize_texts_async(turn_2)
+        assert texts == expected_texts
+        assert {k: v.original_value for k, v in mapping.items()} == {
+            k: v.original_value for k, v in expected_mapping.items()
+        }
+
+    def test_different_detector_sets_do_not_share_entries(self):
+        cache = _cache()
+        jan_only = AnonymizerService([NameDetector(names=("Jan",))], cache)
+        both = AnonymizerService([NameDetector(), NameDetector(names=("Jan",))], cache)
+
+        jan_only.anonymize("Jan i Anna")
+        anonymized, _ = both.anonymize("Jan i Anna")
+
+        assert anonymized == "<PERSON1> i <PERSON2>"
+
+    def test_fingerprint_includes_detector_settings(self):
+        class Configured(NameDetector):
+            def __init__(self, model):
+                super().__init__()
+                self.model = model
+
+            def fingerprint(self):
+                return self.model
+
+        assert detector_fingerprint([Configured("a")]) != detector_fingerprint([Configured("b")])
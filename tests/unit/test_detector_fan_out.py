@@ -0,0 +1,101 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List
+from domain.entities.pii_token import PIIToken
+from domain.enums.pii_type import PIIType
+from domain.services.anonymizer_service import AnonymizerService
+from domain.services.detector_timings import DetectorTimings
+from infrastructure.detectors.email_detector import EmailDetector
+from infrastructure.detectors.process_pool_detector import ProcessPoolDetector
+
+TEXT = "Jan Kowalski, jan@example.com"
+
+
+class WaitingDetector:
+    """Only finishes once ``released`` is set, i.e. if something runs alongside it."""
+
+    def __init__(self, released: threading.Event):
+        self.released = released
+
+    def detect(self, text: str) -> List[PIIToken]:
+        assert self.released.wait(timeout=5), "the other detectors didn't run concurrently"
+        return [PIIToken(PIIType.PERSON, "Jan Kowalski", "", 0, 12)]
+
+
+class ReleasingDetector:
+    def __init__(self, released: threading.Event, tokens: List[PIIToken]):
+        self.released = released
+        self.tokens = tokens
+
+    def detect(self, text: str) -> List[PIIToken]:
+        self.released.set()
+        return self.tokens
+
+
+def test_detectors_run_concurrently_and_merge_in_detector_order():
+    released = threading.Event()
+    # Same span from two detectors: the earlier detector wins the tie.
+    overlapping = [PIIToken(PIIType.LOCATION, "Jan Kowalski", "", 0, 12), PIIToken(PIIType.EMAIL, "jan@example.com", "", 14, 29)]
+    timings = DetectorTimings()
+    with ThreadPoolExecutor(2) as executor:
+        service = AnonymizerService(
+            [WaitingDetector(released), ReleasingDetector(released, overlapping)],
+            executor=executor,
+            timings=timings,
+        )
+        anonymized, _ = service.anonymize(TEXT)
+
+    assert anonymized == "<PERSON1>, <EMAIL1>"
+    stats = timings.stats()
+    assert set(stats) == {"WaitingDetector", "ReleasingDetector"}
+    assert stats["WaitingDetector"]["count"] == 1
+
+
+def test_serial_without_executor_records_timings_too():
+    timings = DetectorTimings()
+    service = AnonymizerService([EmailDetector()], timings=timings)
+
+    anonymized, _ = service.anonymize(TEXT)
+
+    assert anonymized == "Jan Kowalski, <EMAIL1>"
+    assert timings.stats()["EmailDetector"]["count"] == 1
+
+
+def test_process_pool_detector_matches_in_process_detection():
+    with ProcessPoolExecutor(1) as pool:
+        detector = ProcessPoolDetector(EmailDetector, pool)
+        tokens = detector.detect(TEXT)
+
+    expected = EmailDetector().detect(TEXT)
+    assert [(t.type, t.start, t.end, t.original_value) for t in tokens] == [
+        (t.type, t.start, t.end, t.original_value) for t in expected
+    ]
+    assert detector.name == "EmailDetector@process"
+
+
+def _unbuildable_detector():
+    raise AssertionError("the local detector was rebuilt")
+
+
+def test_process_pool_detector_keeps_given_local_detector():
+    local = EmailDetector()
+    with ProcessPoolExecutor(1) as pool:
+        detector = ProcessPoolDetector(_unbuildable_detector, pool, local)
+
+    assert detector.detector is local
+
+
+def test_process_factory_keeps_phone_memo_size():
+    from api.di.chat_container import _process_factory
+    from infrastructure.detectors.fast_detector import FastDetector
+    from infrastructure.detectors.phone_detector import PhoneDetector, PhoneNumberValidator
+
+    fast = FastDetector(batch_threshold=8, phone_validator=PhoneNumberValidator(17))
+    phone = PhoneDetector(PhoneNumberValidator(23))
+
+    rebuilt_fast = _process_factory(fast)()
+    rebuilt_phone = _process_factory(phone)()
+
+    assert (rebuilt_fast.types, rebuilt_fast.batch_threshold) == (fast.types, 8)
+    assert rebuilt_fast.phone_validator.max_entries == 17
+    assert rebuilt_phone.validator.max_entries == 23
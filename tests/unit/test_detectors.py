@@ -9,6 +9,7 @@ from infrastructure.detectors.date_detector import DateDetector
 from infrastructure.detectors.nip_detector import NipDetector
 from infrastructure.detectors.regon_detector import RegonDetector
 from infrastructure.detectors.pii_pl.detector import PiiPlDetector
+from api.config.config import settings
 
 
 class TestEmailDetector:
@@ -435,3 +436,30 @@ class TestPiiPlDetector:
     def test_no_entities_returns_empty_list(self, monkeypatch):
         detector = _make_detector(monkeypatch, [])
         assert detector.detect("zwykły tekst bez PII") == []
+
+
+class TestPiiPlDetectorEngine:
+    def test_onnx_engine_loads_onnxruntime_pipeline(self, monkeypatch):
+        loaded = []
+        pipeline = _FakePipeline([_entity("PERSON", 0, 3)])
+        pipeline.tokenizer = type("Tokenizer", (), {"model_max_length": 512})()
+
+        def fake_load(model_name, cache_dir):
+            loaded.append((model_name, cache_dir))
+            return pipeline
+
+        monkeypatch.setattr("infrastructure.detectors.pii_pl.detector.load_onnx_pipeline", fake_load)
+        monkeypatch.setattr(settings, "pl_ner_engine", "onnx")
+        monkeypatch.setattr(settings, "pl_ner_onnx_cache_dir", "/tmp/onnx-cache")
+
+        detector = PiiPlDetector()
+
+        assert loaded == [(settings.pl_ner_model_name, "/tmp/onnx-cache")]
+        assert pipeline.tokenizer.model_max_length == settings.pl_ner_chunk_tokens
+        assert detector.detect("Jan")[0].type == PIIType.PERSON
+
+    def test_unknown_engine_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(settings, "pl_ner_engine", "tensorrt")
+
+        with pytest.raises(ValueError, match="Unknown NER engine"):
+            PiiPlDetector()
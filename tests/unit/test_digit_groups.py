@@ -0,0 +1,52 @@
+import random
+import re
+import pytest
+from infrastructure.detectors.digit_groups import DigitGroups
+
+# The patterns each DigitGroups method stands in for.
+_PLAIN = {length: re.compile(rf"\b\d{{{length}}}\b") for length in (9, 10, 11, 14)}
+_DASHED = {
+    (3, 3, 2, 2): re.compile(r"\b\d{3}-\d{3}-\d{2}-\d{2}\b"),
+    (3, 2, 2, 3): re.compile(r"\b\d{3}-\d{2}-\d{2}-\d{3}\b"),
+}
+_SPACED = re.compile(r"\b(?:\d[ \t]*){26}\b")
+
+
+def _fuzz_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(1, 40)):
+        parts.append("".join(rng.choice("0123456789") for _ in range(rng.choice([1, 2, 3, 4, 9, 10, 11, 14, 26]))))
+        parts.append(rng.choice(["", " ", "  ", "\t", " \t ", "-", "--", "\n", "a", "_", ".", "x ", " ż", "٣"]))
+    return "".join(parts)
+
+
+def _regex_spans(pattern, text):
+    return [m.span() for m in pattern.finditer(text)]
+
+
+def test_matches_the_patterns_on_fuzzed_digit_runs():
+    rng = random.Random(7)
+    for _ in range(3000):
+        text = _fuzz_text(rng)
+        groups = DigitGroups(text)
+        for length, pattern in _PLAIN.items():
+            assert list(groups.plain(length)) == _regex_spans(pattern, text), text
+        for lengths, pattern in _DASHED.items():
+            assert list(groups.dashed(lengths)) == _regex_spans(pattern, text), text
+        assert list(groups.spaced(26)) == _regex_spans(_SPACED, text), text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1 " * 26 + "x", [(0, 52)]),
+    ("1 " * 26 + ".", [(0, 51)]),
+    ("1" * 26 + "x", []),
+    ("a" + "1" * 26, []),
+    ("1 " * 52, [(0, 52), (52, 103)]),
+])
+def test_spaced_trailing_spacing_follows_the_final_word_boundary(text, expected):
+    assert list(DigitGroups(text).spaced(26)) == expected
+
+
+def test_only_the_given_range_is_indexed():
+    text = "12345678901 i 98765432109"
+    assert list(DigitGroups(text, 11, len(text)).plain(11)) == [(14, 25)]
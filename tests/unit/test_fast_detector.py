@@ -0,0 +1,115 @@
+import ast
+import random
+from pathlib import Path
+from typing import List
+import pytest
+from domain.enums.pii_type import PIIType
+from infrastructure.detectors.bank_account_detector import BankAccountDetector
+from infrastructure.detectors.date_detector import DateDetector
+from infrastructure.detectors.email_detector import EmailDetector
+from infrastructure.detectors.fast_detector import FastDetector
+from infrastructure.detectors.nip_detector import NipDetector
+from infrastructure.detectors.pesel_detector import PeselDetector
+from infrastructure.detectors.phone_detector import PhoneDetector
+from infrastructure.detectors.regon_detector import RegonDetector
+
+SEPARATE = [
+    EmailDetector(),
+    BankAccountDetector(),
+    PeselDetector(),
+    PhoneDetector(),
+    DateDetector(),
+    NipDetector(),
+    RegonDetector(),
+]
+
+
+def _spans(tokens) -> List[tuple]:
+    return [(t.type, t.start, t.end, t.original_value) for t in tokens]
+
+
+def _separate(text: str, detectors=SEPARATE) -> List[tuple]:
+    return _spans([token for detector in detectors for token in detector.detect(text)])
+
+
+def _fixture_texts() -> List[str]:
+    """Every string literal in the separate detectors' own tests."""
+    source = (Path(__file__).parent / "test_detectors.py").read_text(encoding="utf-8")
+    return sorted({
+        node.value for node in ast.walk(ast.parse(source))
+        if isinstance(node, ast.Constant) and isinstance(node.value, str)
+    })
+
+
+# Valid and near-miss identifiers, plus the characters around them that
+# decide word boundaries and candidate extents.
+_PIECES = [
+    "44051401359", "44051401358", "1234563218", "123-456-32-18", "123-45-63-218",
+    "123456785", "12345678512347", "61109010140000071219812874", "PL61109010140000071219812874",
+    "PL 61 1090 1014 0000 0712 1981 2874", "DE89370400440532013000", "DE89 3704 0044 0532 0130 00",
+    "500 123 456", "+48 500 123 456", "(22) 628-12-34", "2024-01-15", "15.01.2024", "1/2/2024",
+    "5 maja 2020", "12 października 2023 roku", "31\tgrudnia\n1999", "jan.kowalski@example.com",
+    "a@b.co", "x@y.z", "@", "AB", "PL", "12", "7", "roku", "maja", "stycznia",
+]
+_GLUE = [" ", "  ", "\t", "\n", "-", ".", "/", "(", ")", "+", ",", ":", "a", "Z", "_", "ą", "|", "%", ""]
+
+
+def _fuzz_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(1, 12)):
+        if rng.random() < 0.6:
+            parts.append(rng.choice(_PIECES))
+        else:
+            parts.append("".join(rng.choice("0123456789") for _ in range(rng.randint(1, 30))))
+        parts.append("".join(rng.choice(_GLUE) for _ in range(rng.randint(0, 3))))
+    return "".join(parts)
+
+
+@pytest.mark.parametrize("text", _fixture_texts())
+def test_matches_separate_detectors_on_their_fixtures(text):
+    assert _spans(FastDetector().detect(text)) == _separate(text)
+
+
+def test_matches_separate_detectors_on_fuzzed_text():
+    rng = random.Random(1234)
+    detector = FastDetector()
+    for _ in range(3000):
+        text = _fuzz_text(rng)
+        assert _spans(detector.detect(text)) == _separate(text), text
+
+
+def test_subset_matches_the_same_detectors():
+    rng = random.Random(99)
+    guard = FastDetector().without(PIIType.DATE)
+    without_dates = [d for d in SEPARATE if not isinstance(d, DateDetector)]
+
+    assert PIIType.DATE not in guard.types
+    for _ in range(500):
+        text = _fuzz_text(rng)
+        assert _spans(guard.detect(text)) == _separate(text, without_dates), text
+
+
+def test_rejects_types_it_cannot_detect():
+    with pytest.raises(ValueError):
+        FastDetector([PIIType.PERSON])
+
+
+def test_batch_validation_matches_separate_detectors():
+    rng = random.Random(4321)
+    detector = FastDetector(batch_threshold=1)
+    for _ in range(1000):
+        text = _fuzz_text(rng)
+        assert _spans(detector.detect(text)) == _separate(text), text
+
+
+def test_subset_keeps_the_batch_threshold():
+    assert FastDetector(batch_threshold=5).without(PIIType.DATE).batch_threshold == 5
+
+
+def test_batch_matches_detecting_each_text():
+    rng = random.Random(777)
+    detector = FastDetector()
+    for _ in range(300):
+        texts = [_fuzz_text(rng) for _ in range(rng.randint(0, 6))] + ["", "a\x00500 123 456"]
+        rng.shuffle(texts)
+        assert [_spans(tokens) for tokens in detector.detect_batch(texts)] == [_spans(detector.detect(t)) for t in texts]
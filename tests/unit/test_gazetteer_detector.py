@@ -0,0 +1,124 @@
+import pytest
+
+from application.services.hallucination_scrubber import HallucinationScrubber
+from domain.enums.pii_type import PIIType
+from domain.services.anonymizer_service import AnonymizerService
+from infrastructure.detectors.gazetteer import GazetteerDetector
+from infrastructure.detectors.gazetteer.build import build_entries, build_gazetteer, load_gazetteer
+from infrastructure.detectors.gazetteer.inflection import first_name_forms, place_forms, surname_forms
+from infrastructure.detectors.gazetteer.store import FIRST_NAME, PLACE, SURNAME, Gazetteer, write_gazetteer
+
+
+@pytest.fixture(scope="module")
+def detector(tmp_path_factory):
+    path = tmp_path_factory.mktemp("gazetteer") / "gazetteer.bin"
+    build_gazetteer(path)
+    return GazetteerDetector(Gazetteer(path))
+
+
+def _found(detector, text):
+    return [(t.type, t.original_value) for t in detector.detect(text)]
+
+
+@pytest.mark.parametrize(
+    "forms, expected",
+    [
+        (first_name_forms("Paweł"), {"Pawła", "Pawłowi", "Pawłem", "Pawle"}),
+        (first_name_forms("Agnieszka"), {"Agnieszki", "Agnieszce", "Agnieszkę", "Agnieszką"}),
+        (first_name_forms("Maria"), {"Marii", "Marię", "Marią"}),
+        (surname_forms("Kowalski"), {"Kowalskiego", "Kowalskim", "Kowalska", "Kowalskiej", "Kowalską", "Kowalscy"}),
+        (surname_forms("Nowak"), {"Nowaka", "Nowakiem", "Nowakowie"}),
+        (place_forms("Kraków"), {"Krakowa", "Krakowie", "Krakowem"}),
+        (place_forms("Poznań"), {"Poznania", "Poznaniu"}),
+        (place_forms("Warszawa"), {"Warszawy", "Warszawie", "Warszawę"}),
+    ],
+)
+def test_inflected_forms(forms, expected):
+    assert expected <= forms
+
+
+def test_store_round_trip(tmp_path):
+    path = tmp_path / "g.bin"
+    write_gazetteer({"jan": FIRST_NAME, "zielona góra": PLACE, "łódź": PLACE, "nowak": SURNAME | FIRST_NAME}, path)
+    gazetteer = Gazetteer(path)
+
+    assert len(gazetteer) == 4
+    assert gazetteer.max_words == 2
+    assert gazetteer.flags("Jan") == FIRST_NAME
+    assert gazetteer.flags("ŁÓDŹ") == PLACE
+    assert gazetteer.flags("Zielona Góra") == PLACE
+    assert gazetteer.flags("Nowak") == SURNAME | FIRST_NAME
+    assert gazetteer.flags("Janek") == 0
+    assert gazetteer.flags("") == 0
+    gazetteer.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-gazetteer.bin"
+    path.write_bytes(b"\x00" * 64)
+
+    with pytest.raises(ValueError, match="Not a gazetteer"):
+        Gazetteer(path)
+
+
+def test_explicit_forms_replace_generated_ones(tmp_path):
+    places = tmp_path / "places.txt"
+    places.write_text("# comment\nŁódź: Łodzi, Łodzią\nGdańsk\n", encoding="utf-8")
+
+    entries = build_entries({"places": places})
+
+    assert {"łódź", "łodzi", "łodzią", "gdańsk", "gdańska", "gdańsku"} <= set(entries)
+    assert "łódźa" not in entries
+
+
+def test_load_compiles_bundled_lists_when_missing(tmp_path):
+    path = tmp_path / "nested" / "gazetteer.bin"
+
+    gazetteer = load_gazetteer(path)
+
+    assert path.exists()
+    assert gazetteer.flags("Kowalskiego") == SURNAME
+
+
+def test_detects_people_and_places_in_inflected_forms(detector):
+    text = "Wczoraj Jan Kowalski pojechał do Zielonej Góry, a potem do Krakowa z Anną Nowak."
+
+    assert _found(detector, text) == [
+        (PIIType.PERSON, "Jan Kowalski"),
+        (PIIType.LOCATION, "Zielonej Góry"),
+        (PIIType.LOCATION, "Krakowa"),
+        (PIIType.PERSON, "Anną Nowak"),
+    ]
+
+
+def test_offsets_match_text(detector):
+    text = "Spotkanie z panią Kowalską w Gdańsku-Oliwie i w Gdańsku."
+
+    for token in detector.detect(text):
+        assert text[token.start:token.end] == token.original_value
+    assert _found(detector, text) == [(PIIType.PERSON, "Kowalską"), (PIIType.LOCATION, "Gdańsku")]
+
+
+def test_ignores_lowercase_words_and_unknown_names(detector):
+    assert detector.detect("pojechał do warszawy z janem") == []
+    assert detector.detect("Spotkanie z Bartłomiejem Zdziebłowskim.") == []
+
+
+@pytest.mark.parametrize(
+    "text", ["Tych danych nie mamy.", "Dudek usiadł na płocie.", "Mazurek jest w piekarniku.", "Kołodziej naprawił koło."]
+)
+def test_ignores_common_words_at_sentence_start(detector, text):
+    assert detector.detect(text) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_guard_scrubs_hallucinated_names(detector):
+    async def stream():
+        for chunk in ("Skontaktuj się z ", "Piotrem Nowakiem ", "z Krakowa."):
+            yield chunk
+
+    scrubber = HallucinationScrubber(AnonymizerService([detector]))
+
+    result = "".join([chunk async for chunk in scrubber.process(stream())])
+
+    assert result == "Skontaktuj się z [REDACTED:PERSON] [REDACTED:PERSON] z [REDACTED:LOCATION]."
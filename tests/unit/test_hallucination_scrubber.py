@@ -1,7 +1,9 @@
 import pytest
 from typing import AsyncIterator
 from application.services.hallucination_scrubber import HallucinationScrubber
+from domain.exceptions.workload_overloaded_error import WorkloadOverloadedError
 from domain.services.anonymizer_service import AnonymizerService
+from domain.services.workload_pool import WorkloadPool
 from infrastructure.detectors.pesel_detector import PeselDetector
 from infrastructure.detectors.email_detector import EmailDetector
 
@@ -54,3 +56,31 @@ async def test_redacts_final_unterminated_word(scrubber: HallucinationScrubber):
     stream = mock_stream("Kontakt: fake@example.com")
     results = [chunk async for chunk in scrubber.process(stream)]
     assert "".join(results) == "Kontakt: [REDACTED:EMAIL]"
+
+
+@pytest.mark.asyncio
+async def test_scans_each_chunk_as_one_task_on_the_guard_pool():
+    pool = WorkloadPool("fast", 1, 8, 5.0)
+    scrubber = HallucinationScrubber(AnonymizerService([PeselDetector()], pool=pool))
+
+    results = [chunk async for chunk in scrubber.process(mock_stream("Twój PESEL to ", "90010112349 i tyle."))]
+
+    assert "".join(results) == "Twój PESEL to [REDACTED:PESEL] i tyle."
+    assert pool.stats()["completed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_only_the_first_scan_is_subject_to_admission():
+    pool = WorkloadPool("fast", 1, 8, 5.0)
+    scrubber = HallucinationScrubber(AnonymizerService([PeselDetector()], pool=pool))
+    stream = scrubber.process(mock_stream("Pierwsze słowo ", "drugie słowo ", "trzecie."))
+
+    await anext(stream)
+    pool.max_queue = 0
+    rest = [chunk async for chunk in stream]
+
+    assert rest == ["drugie słowo ", "trzecie."]
+    assert pool.stats()["rejected"] == 0
+
+    with pytest.raises(WorkloadOverloadedError):
+        await anext(HallucinationScrubber(AnonymizerService([], pool=pool)).process(mock_stream("słowo ")))
@@ -6,6 +6,7 @@ from litellm.exceptions import AuthenticationError
 
 from api.config.config import settings
 from infrastructure.llm.litellm_provider import LiteLLMProvider
+from domain.entities.placeholder_format import DEFAULT_PLACEHOLDER_FORMAT
 from domain.exceptions.llm_provider_error import LLMProviderError
 
 
@@ -85,6 +86,38 @@ async def test_chat_maps_usage(monkeypatch, provider: LiteLLMProvider):
     assert result.usage.prompt_tokens == 12
     assert result.usage.completion_tokens == 7
     assert result.usage.total_tokens == 19
+    assert result.usage.cached_tokens == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_fields", [
+    {"prompt_tokens_details": SimpleNamespace(cached_tokens=1024)},
+    {"prompt_tokens_details": None, "cache_read_input_tokens": 1024},
+])
+async def test_chat_maps_cached_prompt_tokens(monkeypatch, provider: LiteLLMProvider, cache_fields):
+    usage = _usage(prompt_tokens=2000, completion_tokens=10, total_tokens=2010)
+    for name, value in cache_fields.items():
+        setattr(usage, name, value)
+
+    async def fake_acompletion(**kwargs):
+        return _model_response(content="ok", usage=usage)
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+
+    result = await provider.chat(messages=[{"role": "user", "content": "hej"}], model="gemini/gemini-2.5-flash")
+
+    assert result.usage.cached_tokens == 1024
+
+
+def test_prompt_prefix_is_identical_across_turns(provider: LiteLLMProvider):
+    turn_1 = [{"role": "system", "content": "Jesteś asystentem."}, {"role": "user", "content": "Cześć <PERSON1>"}]
+    turn_2 = turn_1 + [{"role": "assistant", "content": "Hej"}, {"role": "user", "content": "Co dalej?"}]
+
+    first, second = provider._build_messages(turn_1), provider._build_messages(turn_2)
+
+    assert second[:len(first)] == first
+    system_prompt = LiteLLMProvider._SYSTEM_PROMPT_TEMPLATE.format(example=DEFAULT_PLACEHOLDER_FORMAT.example)
+    assert first[0] == {"role": "system", "content": system_prompt}
 
 
 @pytest.mark.asyncio
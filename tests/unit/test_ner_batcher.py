@@ -0,0 +1,188 @@
+import os
+import threading
+from typing import Dict, List
+
+import pytest
+
+from api.config.config import settings
+from infrastructure.detectors.pii_pl.batcher import NerBatcher
+from infrastructure.detectors.pii_pl.detector import PiiPlDetector
+
+
+class _RecordingInfer:
+    """Fake batched pipeline: echoes each text's length back as one entity
+    and records the texts that were dispatched together."""
+
+    def __init__(self, release: threading.Event = None):
+        self.batches: List[List[str]] = []
+        self._release = release
+
+    def __call__(self, texts: List[str]) -> List[List[Dict]]:
+        if self._release is not None:
+            self._release.wait(timeout=5)
+        self.batches.append(list(texts))
+        return [[{"entity_group": "PERSON", "score": 0.99, "start": 0, "end": len(t)}] for t in texts]
+
+
+def _submit_concurrently(batcher: NerBatcher, texts: List[str]) -> Dict[str, List[Dict]]:
+    results: Dict[str, List[Dict]] = {}
+
+    def run(text):
+        results[text] = batcher.submit(text)
+
+    threads = [threading.Thread(target=run, args=(t,)) for t in texts]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+    return results
+
+
+def test_each_caller_gets_its_own_entities():
+    infer = _RecordingInfer()
+    batcher = NerBatcher(infer, max_batch_size=8, max_wait_ms=50, max_queue_depth=64)
+    texts = ["a" * n for n in range(1, 9)]
+
+    results = _submit_concurrently(batcher, texts)
+
+    for text in texts:
+        assert results[text][0]["end"] == len(text)
+
+
+def test_concurrent_calls_are_coalesced_into_batches():
+    infer = _RecordingInfer()
+    batcher = NerBatcher(infer, max_batch_size=16, max_wait_ms=200, max_queue_depth=64)
+    texts = [f"Tekst numer {i:02d}" for i in range(10)]
+
+    _submit_concurrently(batcher, texts)
+
+    assert sum(len(b) for b in infer.batches) == 10
+    assert len(infer.batches) < 10
+    assert batcher.stats()["texts"] == 10
+
+
+def test_batch_never_exceeds_max_batch_size():
+    infer = _RecordingInfer()
+    batcher = NerBatcher(infer, max_batch_size=3, max_wait_ms=100, max_queue_depth=64)
+
+    _submit_concurrently(batcher, [f"tekst {i:02d}" for i in range(10)])
+
+    assert all(len(b) <= 3 for b in infer.batches)
+
+
+def test_texts_of_very_different_length_are_not_padded_together():
+    release = threading.Event()
+    infer = _RecordingInfer(release)
+    batcher = NerBatcher(infer, max_batch_size=16, max_wait_ms=100, max_queue_depth=64)
+    texts = ["krótki", "x" * 5000]
+
+    worker = threading.Thread(target=_submit_concurrently, args=(batcher, texts))
+    worker.start()
+    release.set()
+    worker.join(timeout=5)
+
+    assert all(len({len(t).bit_length() for t in batch}) == 1 for batch in infer.batches)
+
+
+def test_inference_error_is_raised_in_every_caller():
+    def failing(texts):
+        raise RuntimeError("model crashed")
+
+    batcher = NerBatcher(failing, max_batch_size=4, max_wait_ms=1, max_queue_depth=4)
+
+    with pytest.raises(RuntimeError, match="model crashed"):
+        batcher.submit("Jan Kowalski")
+
+
+def test_short_result_list_fails_every_caller():
+    batcher = NerBatcher(lambda texts: [[]], max_batch_size=4, max_wait_ms=50, max_queue_depth=4)
+
+    with pytest.raises(RuntimeError, match="1 result"):
+        batcher.submit_many(["Jan Kowalski", "Anna Nowak"])
+
+
+def test_stats_report_batch_size_distribution():
+    infer = _RecordingInfer()
+    batcher = NerBatcher(infer, max_batch_size=1, max_wait_ms=0, max_queue_depth=4)
+
+    batcher.submit("jeden")
+    batcher.submit("dwa")
+
+    stats = batcher.stats()
+    assert stats["batch_size_distribution"] == {1: 2}
+    assert stats["batches"] == 2
+    assert stats["mean_batch_size"] == 1.0
+    assert stats["queue_depth"] == 0
+
+
+class _FakeBatchPipeline:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, **kwargs):
+        self.calls.append((texts, kwargs))
+        return [[{"entity_group": "PERSON", "score": 0.99, "start": 0, "end": 3}] for _ in texts]
+
+
+def test_detector_routes_through_batcher_when_enabled(monkeypatch):
+    pipeline = _FakeBatchPipeline()
+    monkeypatch.setattr(PiiPlDetector, "_load_pipeline", lambda self: pipeline)
+    monkeypatch.setattr(settings, "pl_ner_batching_enabled", True)
+    monkeypatch.setattr(settings, "pl_ner_batch_wait_ms", 1)
+    detector = PiiPlDetector()
+
+    tokens = detector.detect("Jan mieszka tutaj.")
+
+    assert [t.original_value for t in tokens] == ["Jan"]
+    texts, kwargs = pipeline.calls[0]
+    assert texts == ["Jan mieszka tutaj."]
+    assert kwargs["batch_size"] == 1
+    assert detector.stats()["batching"]["batches"] == 1
+
+
+def test_detector_stats_empty_when_batching_disabled(monkeypatch):
+    monkeypatch.setattr(PiiPlDetector, "_load_pipeline", lambda self: _FakeBatchPipeline())
+    monkeypatch.setattr(settings, "pl_ner_batching_enabled", False)
+
+    assert PiiPlDetector().stats() == {}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_batcher_keeps_working_in_forked_child():
+    infer = _RecordingInfer()
+    batcher = NerBatcher(infer, max_batch_size=4, max_wait_ms=1, max_queue_depth=4)
+    batcher.submit("przed forkiem")
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            ok = batcher.submit("po forku")[0]["end"] == len("po forku")
+        except BaseException:
+            ok = False
+        os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert batcher.submit("znowu w rodzicu")[0]["end"] == len("znowu w rodzicu")
+
+
+def test_submit_many_returns_each_texts_entities_in_order():
+    infer = _RecordingInfer()
+    batcher = NerBatcher(infer, max_batch_size=8, max_wait_ms=1, max_queue_depth=16)
+
+    results = batcher.submit_many(["abc", "a", "abcdefgh"])
+
+    assert [r[0]["end"] for r in results] == [3, 1, 8]
+
+
+def test_detect_batch_runs_length_sorted_padded_batches(monkeypatch):
+    pipeline = _FakeBatchPipeline()
+    monkeypatch.setattr(PiiPlDetector, "_load_pipeline", lambda self: pipeline)
+    monkeypatch.setattr(settings, "pl_ner_batching_enabled", False)
+    monkeypatch.setattr(settings, "pl_ner_max_batch_size", 2)
+    detector = PiiPlDetector()
+
+    results = detector.detect_batch(["Jan 3333", "", "Ala 1", "Ewa 22"])
+
+    assert [[t.original_value for t in tokens] for tokens in results] == [["Jan"], [], ["Ala"], ["Ewa"]]
+    assert [texts for texts, _ in pipeline.calls] == [["Ala 1", "Ewa 22"], ["Jan 3333"]]
@@ -0,0 +1,142 @@
+import re
+from typing import Dict, List
+
+import pytest
+
+from api.config.config import settings
+from infrastructure.detectors.pii_pl.detector import PiiPlDetector
+from infrastructure.detectors.pii_pl.gating import classify_line, classify_segments, ner_regions
+
+MIXED = (
+    "Cześć, mam problem z kodem.\n"
+    "```python\n"
+    "def f(): return 'Jan Kowalski'\n"
+    "```\n"
+    "{\"id\": 5,\n"
+    " \"status\": \"ok\"}\n"
+    "https://example.com/a/b aGVsbG8gd29ybGQgaGVsbG8gd29ybGQ=\n"
+    "\n"
+    "wszystko działa, ale nie wiem co dalej.\n"
+    "Mieszkam przy Kwiatowej u pana Nowaka.\n"
+)
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("https://example.com/x?q=1 www.example.org\n", "blob"),
+        ("aGVsbG8gd29ybGQgaGVsbG8gd29ybGQ=\n", "blob"),
+        ('  "count": 3,\n', "structured"),
+        ("| 12 | 34,50 | 2024-01-01 |\n", "structured"),
+        ("12.03.2024 14:00 123,45 zł\n", "structured"),
+        ('  "name": "Jan Kowalski",\n', "prose"),
+        ("| Jan Kowalski | 34 |\n", "prose"),
+        ("hej, drukarka znowu nie działa\n", "lowercase"),
+        ("Drukarka nie działa. Serwer też nie.\n", "sentence_case"),
+        ("Karolina zgłosiła awarię.\n", "sentence_case"),
+        ("Spotkanie z Karoliną.\n", "prose"),
+        ("Mieszkam przy ul. Kwiatowej.\n", "prose"),
+        ("Oddział obejmuje województwo małopolskie.\n", "prose"),
+    ],
+)
+def test_classify_line(line, expected):
+    assert classify_line(line) == expected
+
+
+def test_segments_cover_text_and_keep_fenced_code_whole():
+    segments = classify_segments(MIXED)
+
+    assert segments[0][0] == 0 and segments[-1][1] == len(MIXED)
+    assert all(a[1] == b[0] for a, b in zip(segments, segments[1:]))
+    code = [MIXED[start:end] for start, end, cls in segments if cls == "code"]
+    assert code == ["```python\ndef f(): return 'Jan Kowalski'\n```\n"]
+    assert [cls for _, _, cls in segments] == ["sentence_case", "code", "structured", "blob", "lowercase", "prose"]
+
+
+def test_regions_leave_out_only_skipped_classes():
+    regions, skipped = ner_regions(MIXED, ["code", "blob"])
+
+    assert {cls for _, _, cls in skipped} == {"code", "blob"}
+    assert MIXED[regions[1][0]:regions[1][1]].startswith("{\"id\"")
+    assert sum(end - start for start, end in regions) + sum(end - start for start, end, _ in skipped) == len(MIXED)
+
+
+class _CapitalizedPipeline:
+    """Fake pipeline: tags every capitalized word after the first of its line."""
+
+    def __init__(self):
+        self.texts: List[str] = []
+
+    def __call__(self, texts, **kwargs):
+        batch = texts if isinstance(texts, list) else [texts]
+        self.texts.extend(batch)
+        results: List[List[Dict]] = [
+            [{"entity_group": "PERSON", "score": 0.99, "start": m.start(), "end": m.end()} for m in re.finditer(r"(?<=[a-ząćęłńóśźż] )[A-ZŁŚŻ]\w+", t)]
+            for t in batch
+        ]
+        return results if isinstance(texts, list) else results[0]
+
+
+@pytest.fixture
+def gated(monkeypatch):
+    pipeline = _CapitalizedPipeline()
+    monkeypatch.setattr(PiiPlDetector, "_load_pipeline", lambda self: pipeline)
+    monkeypatch.setattr(settings, "pl_ner_batching_enabled", False)
+    monkeypatch.setattr(settings, "pl_ner_gating_enabled", True)
+    monkeypatch.setattr(settings, "pl_ner_gate_skip_classes", ["code", "structured", "blob", "lowercase", "sentence_case"])
+    return pipeline
+
+
+def test_gated_detection_maps_offsets_back_and_skips_the_rest(gated):
+    detector = PiiPlDetector()
+
+    tokens = detector.detect(MIXED)
+
+    assert [(MIXED[t.start:t.end], t.original_value) for t in tokens] == [("Kwiatowej", "Kwiatowej"), ("Nowaka", "Nowaka")]
+    assert gated.texts == ["Mieszkam przy Kwiatowej u pana Nowaka.\n"]
+    gating = detector.stats()["gating"]
+    assert gating["inferred_chars"] == len(gated.texts[0])
+    assert gating["inferred_chars"] + sum(gating["skipped_chars"].values()) == len(MIXED)
+    assert set(gating["skipped_chars"]) == {"sentence_case", "code", "structured", "blob", "lowercase"}
+
+
+def test_text_with_nothing_to_infer_never_reaches_the_model(gated):
+    results = PiiPlDetector().detect_batch(["hej, wszystko ok\n", "https://example.com/abc"])
+
+    assert results == [[], []]
+    assert gated.texts == []
+
+
+def test_unknown_segment_class_is_rejected(gated, monkeypatch):
+    monkeypatch.setattr(settings, "pl_ner_gate_skip_classes", ["code", "poetry"])
+
+    with pytest.raises(ValueError, match="poetry"):
+        PiiPlDetector()
+
+
+def test_gazetteer_first_tier_spares_sentence_case_lines(gated, monkeypatch):
+    monkeypatch.setattr(settings, "pl_ner_gating_enabled", False)
+    monkeypatch.setattr(settings, "gazetteer_first_tier", True)
+    text = "Karolina zgłosiła awarię.\nMieszkam przy Kwiatowej u pana Nowaka.\n"
+
+    detector = PiiPlDetector()
+    tokens = detector.detect(text)
+
+    assert detector.gate_skip == {"sentence_case"}
+    assert [t.original_value for t in tokens] == ["Kwiatowej", "Nowaka"]
+    assert gated.texts == ["Mieszkam przy Kwiatowej u pana Nowaka.\n"]
+
+
+def test_gating_combines_with_segmentation(gated, monkeypatch):
+    monkeypatch.setattr(settings, "pl_ner_chunk_tokens", 100)
+    monkeypatch.setattr(settings, "pl_ner_chunk_stride", 20)
+    monkeypatch.setattr(settings, "pl_ner_segment_long_texts", True)
+    monkeypatch.setattr(settings, "pl_ner_segment_min_chars", 300)
+    prose = "Spotkałem się wczoraj z panem Nowakiem w biurze. " * 20
+    text = "```\nprint('x')\n```\n" + prose
+
+    tokens = PiiPlDetector().detect(text)
+
+    assert [t.start for t in tokens] == [m.start() for m in re.finditer("Nowakiem", text)]
+    assert all(len(piece) <= 300 for piece in gated.texts)
+    assert not any("print" in piece for piece in gated.texts)
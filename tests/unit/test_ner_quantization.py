@@ -0,0 +1,126 @@
+from api.config.config import settings
+from domain.enums.pii_type import PIIType
+from infrastructure.detectors.pii_pl.detector import PiiPlDetector
+from infrastructure.detectors.pii_pl.quantization import rescore_windows, uncertain_windows
+
+
+def _entity(entity_group, start, end, score=0.99):
+    return {"entity_group": entity_group, "score": score, "start": start, "end": end}
+
+
+class _FakePipeline:
+    def __init__(self, entities_by_text):
+        self.entities_by_text = entities_by_text
+        self.calls = []
+
+    def __call__(self, text, **kwargs):
+        self.calls.append(text)
+        return [dict(e) for e in self.entities_by_text.get(text, [])]
+
+
+class TestUncertainWindows:
+    def test_no_window_when_all_entities_are_confident(self):
+        text = "Jan Kowalski mieszka w Warszawie."
+        entities = [_entity("PERSON", 0, 12), _entity("LOCATION", 23, 32)]
+
+        assert uncertain_windows(text, entities, threshold=0.9, context_chars=5) == []
+
+    def test_window_is_padded_and_snapped_to_word_boundaries(self):
+        text = "Wczoraj Jan Kowalski mieszkał w Warszawie."
+        entities = [_entity("PERSON", 8, 20, score=0.6)]
+
+        windows = uncertain_windows(text, entities, threshold=0.9, context_chars=3)
+
+        assert windows == [(0, 29)]
+
+    def test_overlapping_windows_are_merged(self):
+        text = "Anna i Piotr"
+        entities = [_entity("PERSON", 0, 4, score=0.5), _entity("PERSON", 7, 12, score=0.5)]
+
+        assert uncertain_windows(text, entities, threshold=0.9, context_chars=3) == [(0, 12)]
+
+    def test_window_is_widened_to_cover_straddling_entity(self):
+        text = "ul. Długa 5 w mieście Nowy Sącz, obok sklepu."
+        entities = [
+            _entity("LOCATION", 22, 31),
+            _entity("PERSON", 4, 9, score=0.4),
+        ]
+
+        windows = uncertain_windows(text, entities, threshold=0.9, context_chars=14)
+
+        assert windows == [(0, 31)]
+
+
+class TestRescoreWindows:
+    def test_replaces_entities_inside_window_with_fp32_result(self):
+        text = "Jan Kowalski mieszka w Warszawie."
+        int8_entities = [_entity("ORGANIZATION", 0, 12, score=0.5), _entity("LOCATION", 23, 32)]
+        fp32 = _FakePipeline({"Jan Kowalski mieszka": [_entity("PERSON", 0, 12)]})
+
+        rescored = rescore_windows(text, int8_entities, [(0, 20)], fp32)
+
+        assert [(e["entity_group"], e["start"], e["end"]) for e in rescored] == [
+            ("PERSON", 0, 12),
+            ("LOCATION", 23, 32),
+        ]
+
+    def test_fp32_offsets_are_shifted_back_into_full_text(self):
+        text = "Dzień dobry, tu Anna Nowak."
+        fp32 = _FakePipeline({"Anna Nowak.": [_entity("PERSON", 0, 10)]})
+
+        rescored = rescore_windows(text, [_entity("PERSON", 16, 20, score=0.3)], [(16, 27)], fp32)
+
+        assert text[rescored[0]["start"]:rescored[0]["end"]] == "Anna Nowak"
+
+
+class TestPiiPlDetectorInt8:
+    def _make_detector(self, monkeypatch, int8, fp32, cascade):
+        monkeypatch.setattr(PiiPlDetector, "_load_pipeline", lambda self: fp32)
+        monkeypatch.setattr(
+            "infrastructure.detectors.pii_pl.detector.quantize_pipeline", lambda pipeline: int8
+        )
+        monkeypatch.setattr(settings, "pl_ner_quantization", "int8")
+        monkeypatch.setattr(settings, "pl_ner_int8_cascade", cascade)
+        monkeypatch.setattr(settings, "pl_ner_int8_cascade_threshold", 0.9)
+        monkeypatch.setattr(settings, "pl_ner_int8_cascade_context_chars", 0)
+        return PiiPlDetector()
+
+    def test_int8_mode_uses_quantized_pipeline_only(self, monkeypatch):
+        text = "Jan mieszka tu."
+        int8 = _FakePipeline({text: [_entity("PERSON", 0, 3, score=0.5)]})
+        fp32 = _FakePipeline({})
+        detector = self._make_detector(monkeypatch, int8, fp32, cascade=False)
+
+        tokens = detector.detect(text)
+
+        assert [t.original_value for t in tokens] == ["Jan"]
+        assert fp32.calls == []
+        assert detector.stats() == {}
+
+    def test_cascade_rescores_only_uncertain_window(self, monkeypatch):
+        text = "Jan mieszka w Krakowie."
+        int8 = _FakePipeline({text: [
+            _entity("ORGANIZATION", 0, 3, score=0.4),
+            _entity("LOCATION", 14, 22),
+        ]})
+        fp32 = _FakePipeline({"Jan": [_entity("PERSON", 0, 3)]})
+        detector = self._make_detector(monkeypatch, int8, fp32, cascade=True)
+
+        tokens = detector.detect(text)
+
+        assert [(t.type, t.original_value) for t in tokens] == [
+            (PIIType.PERSON, "Jan"),
+            (PIIType.LOCATION, "Krakowie"),
+        ]
+        assert fp32.calls == ["Jan"]
+        assert detector.stats()["int8_cascade"] == {"rescored_windows": 1, "rescored_chars": 3}
+
+    def test_cascade_skips_fp32_when_int8_is_confident(self, monkeypatch):
+        text = "Anna Nowak"
+        int8 = _FakePipeline({text: [_entity("PERSON", 0, 10, score=0.97)]})
+        fp32 = _FakePipeline({})
+        detector = self._make_detector(monkeypatch, int8, fp32, cascade=True)
+
+        detector.detect(text)
+
+        assert fp32.calls == []
@@ -0,0 +1,130 @@
+import re
+from typing import Dict, List
+
+import pytest
+
+from api.config.config import settings
+from infrastructure.detectors.pii_pl.detector import PiiPlDetector
+from infrastructure.detectors.pii_pl.segmentation import split_segments, stitch_entities
+
+SENTENCE = "Jan Kowalski mieszka w Warszawie przy ul. Kwiatowej. "
+
+
+def _long_text(sentences: int = 60) -> str:
+    return "".join(f"{SENTENCE}\n" if i % 5 == 4 else SENTENCE for i in range(sentences))
+
+
+def test_short_text_is_one_segment():
+    assert split_segments("Krótki tekst.", max_chars=100, overlap_chars=20) == [(0, 13)]
+
+
+def test_segments_cover_text_within_size_and_overlap():
+    text = _long_text()
+
+    segments = split_segments(text, max_chars=300, overlap_chars=60)
+
+    assert segments[0][0] == 0 and segments[-1][1] == len(text)
+    assert all(end - start <= 300 for start, end in segments)
+    for (_, previous_end), (start, _) in zip(segments, segments[1:]):
+        assert start < previous_end
+
+
+def test_segments_are_cut_at_sentence_boundaries():
+    text = _long_text()
+
+    segments = split_segments(text, max_chars=300, overlap_chars=60)
+
+    for start, end in segments[:-1]:
+        assert text[:end].rstrip().endswith(".")
+    for start, _ in segments[1:]:
+        assert text[start:].startswith("Jan")
+
+
+def test_text_without_boundaries_is_cut_on_whitespace_then_anywhere():
+    words = "słowo " * 100
+    assert all(words[end - 1] == " " for _, end in split_segments(words, 100, 20)[:-1])
+
+    blob = "x" * 1000
+    segments = split_segments(blob, 100, 20)
+    assert segments[0] == (0, 100)
+    assert segments[-1][1] == 1000
+
+
+def test_stitch_keeps_each_entity_once_from_the_segment_owning_its_start():
+    segments = [(0, 100), (80, 180)]
+    # The same entity at 85-95 is seen by both segments; one at 95-99 is
+    # cut off at the first segment's edge and seen whole by the second.
+    first = [{"entity_group": "PERSON", "start": 10, "end": 20}, {"entity_group": "CITY", "start": 85, "end": 95}, {"entity_group": "CITY", "start": 95, "end": 100}]
+    second = [{"entity_group": "CITY", "start": 5, "end": 15}, {"entity_group": "CITY", "start": 15, "end": 25}]
+
+    stitched = stitch_entities(segments, [first, second])
+
+    assert [(e["start"], e["end"]) for e in stitched] == [(10, 20), (85, 95), (95, 105)]
+
+
+class _SurnamePipeline:
+    """Fake pipeline: tags every "Kowalski" in each text, recording batches."""
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    def __call__(self, texts, **kwargs):
+        batch = texts if isinstance(texts, list) else [texts]
+        self.calls.append(list(batch))
+        results: List[List[Dict]] = [
+            [{"entity_group": "PERSON", "score": 0.99, "start": m.start(), "end": m.end()} for m in re.finditer("Kowalski", t)]
+            for t in batch
+        ]
+        return results if isinstance(texts, list) else results[0]
+
+
+@pytest.fixture
+def segmenting(monkeypatch):
+    pipeline = _SurnamePipeline()
+    monkeypatch.setattr(PiiPlDetector, "_load_pipeline", lambda self: pipeline)
+    monkeypatch.setattr(settings, "pl_ner_batching_enabled", False)
+    monkeypatch.setattr(settings, "pl_ner_chunk_tokens", 100)
+    monkeypatch.setattr(settings, "pl_ner_chunk_stride", 20)
+    monkeypatch.setattr(settings, "pl_ner_segment_long_texts", True)
+    monkeypatch.setattr(settings, "pl_ner_segment_min_chars", 500)
+    return pipeline
+
+
+def _spans(tokens):
+    return [(t.start, t.end, t.original_value) for t in tokens]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_segmented_detection_matches_whole_text(segmenting, monkeypatch, workers):
+    monkeypatch.setattr(settings, "pl_ner_segment_workers", workers)
+    text = _long_text()
+    expected = [(m.start(), m.end(), "Kowalski") for m in re.finditer("Kowalski", text)]
+
+    tokens = PiiPlDetector().detect(text)
+
+    assert sorted(_spans(tokens)) == expected
+    assert len(segmenting.calls) == workers
+    assert max(len(piece) for batch in segmenting.calls for piece in batch) <= 300
+
+
+def test_short_texts_are_not_segmented(segmenting):
+    PiiPlDetector().detect(SENTENCE)
+
+    assert segmenting.calls == [[SENTENCE]]
+
+
+def test_detect_batch_segments_long_texts_alongside_short_ones(segmenting):
+    long_text = _long_text()
+
+    short, long_ = PiiPlDetector().detect_batch([SENTENCE, long_text])
+
+    assert _spans(short) == [(4, 12, "Kowalski")]
+    assert len(long_) == long_text.count("Kowalski")
+    assert len(segmenting.calls) == 1
+
+
+def test_fingerprint_changes_with_segmentation(segmenting, monkeypatch):
+    segmented = PiiPlDetector().fingerprint()
+    monkeypatch.setattr(settings, "pl_ner_segment_long_texts", False)
+
+    assert PiiPlDetector().fingerprint() != segmented
@@ -0,0 +1,147 @@
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+from domain.entities.pii_token import PIIToken
+from domain.enums.pii_type import PIIType
+from infrastructure.detectors.remote_ner_detector import RemoteNerDetector
+from infrastructure.ner_server.protocol import (
+    NerServerError,
+    decode_spans,
+    decode_texts,
+    encode_spans,
+    encode_texts,
+)
+from infrastructure.ner_server.server import NerServer
+
+
+class _FakeDetector:
+    """Finds every occurrence of a fixed name, like a tiny NER model."""
+
+    def __init__(self, name="Jan Kowalski"):
+        self.name = name
+        self.calls = []
+
+    def detect(self, text):
+        self.calls.append(text)
+        if text == "boom":
+            raise RuntimeError("model exploded")
+        tokens = []
+        start = text.find(self.name)
+        while start != -1:
+            tokens.append(PIIToken(PIIType.PERSON, self.name, "", start, start + len(self.name)))
+            start = text.find(self.name, start + 1)
+        return tokens
+
+    def stats(self):
+        return {"batching": {"batches": len(self.calls)}}
+
+
+@pytest.fixture
+def server():
+    directory = tempfile.mkdtemp(prefix="ner-")
+    srv = NerServer(os.path.join(directory, "ner.sock"), _FakeDetector())
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestProtocol:
+    def test_texts_roundtrip_including_non_ascii(self):
+        texts = ["Zażółć gęślą jaźń", "", "Jan"]
+        assert decode_texts(encode_texts(texts)) == texts
+
+    def test_spans_roundtrip_rebuilds_values_from_client_text(self):
+        text = "Łukasz Żółw mieszka w Łodzi."
+        tokens = [
+            PIIToken(PIIType.PERSON, "Łukasz Żółw", "", 0, 11),
+            PIIToken(PIIType.LOCATION, "Łodzi", "", 22, 27),
+        ]
+
+        decoded = decode_spans(encode_spans([tokens]), [text])
+
+        assert decoded == [tokens]
+
+    def test_span_count_mismatch_is_rejected(self):
+        with pytest.raises(NerServerError):
+            decode_spans(encode_spans([[], []]), ["jeden"])
+
+
+class TestRemoteNerDetector:
+    def test_detects_via_server(self, server):
+        client = RemoteNerDetector(server.socket_path)
+        text = "Dzień dobry, tu Jan Kowalski z Krakowa."
+
+        tokens = client.detect(text)
+
+        assert [(t.type, t.original_value, t.start, t.end) for t in tokens] == [
+            (PIIType.PERSON, "Jan Kowalski", 16, 28),
+        ]
+
+    def test_empty_text_skips_round_trip(self, server):
+        client = RemoteNerDetector(server.socket_path)
+
+        assert client.detect("") == []
+        assert server.detector.calls == []
+
+    def test_batch_keeps_order_and_skips_empty_texts(self, server):
+        client = RemoteNerDetector(server.socket_path)
+
+        results = client.detect_batch(["Jan Kowalski", "", "nic"])
+
+        assert [[t.original_value for t in tokens] for tokens in results] == [["Jan Kowalski"], [], []]
+        assert server.detector.calls == ["Jan Kowalski", "nic"]
+
+    def test_reuses_connection_across_calls(self, server):
+        client = RemoteNerDetector(server.socket_path)
+
+        client.detect("Jan Kowalski")
+        first = client._local.sock
+        client.detect("Jan Kowalski")
+
+        assert client._local.sock is first
+
+    def test_concurrent_threads_get_their_own_results(self, server):
+        client = RemoteNerDetector(server.socket_path)
+        results = {}
+
+        def run(i):
+            results[i] = client.detect(f"{'x' * i}Jan Kowalski")
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert {i: tokens[0].start for i, tokens in results.items()} == {i: i for i in range(8)}
+
+    def test_server_error_is_raised_and_connection_stays_usable(self, server):
+        client = RemoteNerDetector(server.socket_path)
+
+        with pytest.raises(NerServerError, match="model exploded"):
+            client.detect("boom")
+        assert client.detect("Jan Kowalski")[0].original_value == "Jan Kowalski"
+
+    def test_reconnects_after_dropped_connection(self, server):
+        client = RemoteNerDetector(server.socket_path)
+        client.detect("Jan Kowalski")
+        client._local.sock.close()
+        client._local.sock = None
+
+        assert len(client.detect("Jan Kowalski")) == 1
+
+    def test_stats_are_fetched_from_server(self, server):
+        client = RemoteNerDetector(server.socket_path)
+        client.detect("Jan Kowalski")
+
+        assert client.stats() == {"server": {"batching": {"batches": 1}}}
+
+    def test_socket_is_owner_only(self, server):
+        assert os.stat(server.socket_path).st_mode & 0o077 == 0
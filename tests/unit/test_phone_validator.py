@@ -0,0 +1,77 @@
+import random
+import phonenumbers
+import pytest
+from infrastructure.detectors.phone_detector import PHONE_CANDIDATE_REGEX, PhoneNumberValidator, may_be_valid_phone
+
+
+def _parse(raw: str) -> bool:
+    try:
+        return phonenumbers.is_valid_number(phonenumbers.parse(raw, "PL"))
+    except phonenumbers.NumberParseException:
+        return False
+
+
+_PREFIXES = ["", "+", "+48", "48", "0048", "00", "+1", "+49", "0", "800", "64", "30", "50", "(22)", "22"]
+_SEPARATORS = [" ", "-", "(", ")", "  ", "\t", "\n", " ", "", " - "]
+
+
+def _fuzz_candidates(rng: random.Random):
+    text = rng.choice(_PREFIXES)
+    for _ in range(rng.randint(1, 6)):
+        if rng.random() < 0.5:
+            text += rng.choice(_SEPARATORS)
+        text += "".join(rng.choice("0123456789") for _ in range(rng.randint(1, 5)))
+    return [m.group() for m in PHONE_CANDIDATE_REGEX.finditer(text)]
+
+
+def test_agrees_with_phonenumbers_on_fuzzed_candidates():
+    rng = random.Random(48)
+    validator = PhoneNumberValidator(max_entries=1000)
+    candidates = [raw for _ in range(3000) for raw in _fuzz_candidates(rng)]
+    expected = [_parse(raw) for raw in candidates]
+    # Twice, the second time largely from the memo.
+    for _ in range(2):
+        for raw, valid in zip(candidates, expected):
+            assert validator.is_valid(raw) == valid, raw
+    stats = validator.stats()
+    assert stats["prefiltered"] > 0 and stats["memo_hits"] > 0
+    assert stats["seen"] == stats["prefiltered"] + stats["memo_hits"] + stats["parsed"]
+
+
+@pytest.mark.parametrize("digits, international", [
+    ("500123456", False), ("48500123456", False), ("0048500123456", False),
+    ("48500123456", True), ("221234567", False), ("8001234567", False), ("641234", False),
+])
+def test_prefilter_keeps_valid_polish_numbers(digits, international):
+    assert may_be_valid_phone(digits, international)
+
+
+@pytest.mark.parametrize("digits, international", [
+    ("2024011512", False),   # a date's digits
+    ("1234563218", False),   # a NIP
+    ("012345678", False),    # no Polish number starts with 0
+    ("4812345678901", True),
+    ("123456789012345678901", True),
+])
+def test_prefilter_rejects_what_cannot_be_a_number(digits, international):
+    assert not may_be_valid_phone(digits, international)
+
+
+def test_memo_is_keyed_on_the_normalized_number_and_bounded():
+    validator = PhoneNumberValidator(max_entries=2)
+    assert validator.is_valid("500 123 456")
+    assert validator.is_valid("500-123-456")
+    assert validator.stats()["memo_hits"] == 1
+
+    validator.is_valid("+48 600 123 456")
+    validator.is_valid("221234567")
+    stats = validator.stats()
+    assert stats["memo_entries"] == 2
+    assert stats["accepted"] == 4 and stats["parsed"] == 3
+
+
+def test_irregular_separators_are_not_memoised():
+    validator = PhoneNumberValidator()
+    assert not validator.is_valid("500\t123\t456")
+    assert validator.is_valid("500 123 456")
+    assert validator.stats()["memo_hits"] == 0
@@ -0,0 +1,117 @@
+import pytest
+from typing import AsyncIterator, List
+from application.services import model_resolver
+from application.services.message_anonymizer import anonymize_messages
+from application.services.stream_deanonymizer import StreamDeanonymizer
+from application.dtos.chat_request import ChatMessage
+from domain.entities.conversation_session import ConversationSession
+from domain.entities.pii_token import PIIToken
+from domain.entities.placeholder_format import DEFAULT_PLACEHOLDER_FORMAT, PLACEHOLDER_FORMATS, get_placeholder_format
+from domain.enums.pii_type import PIIType
+from domain.services.anonymizer_service import AnonymizerService
+from domain.services.placeholder_numbering import StableNumbering
+from infrastructure.llm.litellm_provider import LiteLLMProvider
+
+SQUARE_SHORT = PLACEHOLDER_FORMATS["square_short"]
+
+
+class NameDetector:
+    def detect(self, text: str) -> List[PIIToken]:
+        start = text.find("Jan Kowalski")
+        if start == -1:
+            return []
+        return [PIIToken(PIIType.PERSON, "Jan Kowalski", "", start, start + len("Jan Kowalski"))]
+
+
+async def _stream(*chunks: str) -> AsyncIterator[str]:
+    for chunk in chunks:
+        yield chunk
+
+
+def test_default_format_keeps_the_original_syntax():
+    assert DEFAULT_PLACEHOLDER_FORMAT.render("PERSON", 1) == "<PERSON1>"
+    assert DEFAULT_PLACEHOLDER_FORMAT.shape_re.fullmatch("<ANYTHING_ELSE7>")
+    assert LiteLLMProvider._SYSTEM_PROMPT_TEMPLATE.format(example=DEFAULT_PLACEHOLDER_FORMAT.example).count("<PII_TYPE_AND_ID_NUMBER>") == 1
+
+
+def test_short_format_renders_and_recognises_its_own_codes_only():
+    assert SQUARE_SHORT.render("ORGANIZATION", 3) == "[ORG3]"
+    assert SQUARE_SHORT.type_name("ORG") == "ORGANIZATION"
+    assert SQUARE_SHORT.shape_re.fullmatch("[ACCT12]")
+    assert not SQUARE_SHORT.shape_re.search("see cell [A1] and [1]")
+
+
+def test_unknown_format_is_a_configuration_error():
+    with pytest.raises(ValueError):
+        get_placeholder_format("curly")
+
+
+@pytest.mark.asyncio
+async def test_anonymizer_round_trip_in_another_format():
+    service = AnonymizerService([NameDetector()]).with_format(SQUARE_SHORT)
+    (anonymized,), mapping = await service.anonymize_texts_async(["Jan Kowalski, tabela [A1]"])
+
+    assert anonymized == "[PER1], tabela [A1]"
+    assert service.deanonymize("[PER1] [PER2] [A1] <PERSON1>", mapping) == "Jan Kowalski  [A1] <PERSON1>"
+
+
+def test_with_format_shares_detectors_and_numbering():
+    numbering = StableNumbering(b"k", 2)
+    service = AnonymizerService([NameDetector()], numbering=numbering)
+    scoped = service.with_format(SQUARE_SHORT)
+
+    assert service.with_format(DEFAULT_PLACEHOLDER_FORMAT) is service
+    assert scoped.detectors is service.detectors and scoped.numbering is numbering
+    assert scoped.anonymize("Jan Kowalski")[0][1:-1] == service.anonymize("Jan Kowalski")[0][1:-1].replace("PERSON", "PER")
+
+
+@pytest.mark.asyncio
+async def test_stream_deanonymizer_follows_the_format_delimiters():
+    mapping = {"[PER1]": PIIToken(PIIType.PERSON, "Jan Kowalski", "[PER1]", 0, 12)}
+    deanonymizer = StreamDeanonymizer(mapping, SQUARE_SHORT)
+
+    chunks = [c async for c in deanonymizer.process(_stream("Hej [PE", "R1], [LOC2] i [x] <b>"))]
+
+    assert "".join(chunks) == "Hej Jan Kowalski, [REDACTED:LOCATION] i [x] <b>"
+
+
+def test_system_prompt_describes_the_format_or_is_omitted():
+    provider = LiteLLMProvider()
+    messages = [{"role": "user", "content": "Cześć [PER1]"}]
+
+    with_prompt = provider._build_messages(messages, SQUARE_SHORT)
+    assert "[PII_TYPE_AND_ID_NUMBER]" in with_prompt[0]["content"]
+    assert provider._build_messages(messages, None) == messages
+
+
+def test_prompt_format_is_omitted_only_without_placeholders(monkeypatch):
+    monkeypatch.setattr(model_resolver.settings, "omit_system_prompt_without_placeholders", True)
+    assert model_resolver.prompt_placeholder_format(SQUARE_SHORT, has_placeholders=True) is SQUARE_SHORT
+    assert model_resolver.prompt_placeholder_format(SQUARE_SHORT, has_placeholders=False) is None
+
+    monkeypatch.setattr(model_resolver.settings, "omit_system_prompt_without_placeholders", False)
+    assert model_resolver.prompt_placeholder_format(SQUARE_SHORT, has_placeholders=False) is SQUARE_SHORT
+
+
+def test_placeholder_format_can_be_chosen_per_model(monkeypatch):
+    monkeypatch.setattr(model_resolver.settings, "placeholder_format", "angle")
+    monkeypatch.setattr(model_resolver.settings, "placeholder_format_by_model", {"openai/gpt-4o": "square_short"})
+
+    assert model_resolver.resolve_placeholder_format("openai/gpt-4o") is SQUARE_SHORT
+    assert model_resolver.resolve_placeholder_format("gemini/gemini-2.5-flash") is DEFAULT_PLACEHOLDER_FORMAT
+
+
+@pytest.mark.asyncio
+async def test_session_starts_over_when_the_format_changes():
+    session = ConversationSession()
+    service = AnonymizerService([NameDetector()])
+    messages = [ChatMessage(role="user", content="Jan Kowalski")]
+
+    first, _ = await anonymize_messages(service, messages, session)
+    session.record_response("Jan Kowalski", "<PERSON1>")
+    second, mapping = await anonymize_messages(service.with_format(SQUARE_SHORT), messages, session)
+
+    assert first[0]["content"] == "<PERSON1>"
+    assert second[0]["content"] == "[PER1]"
+    assert list(mapping) == ["[PER1]"]
+    assert session.produced_anonymized("Jan Kowalski") is None
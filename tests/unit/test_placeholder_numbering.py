@@ -0,0 +1,144 @@
+import pytest
+from typing import List
+from api.config.config import settings
+from application.services.model_resolver import resolve_numbering_scope
+from application.dtos.chat_request import ChatMessage, ChatRequest
+from application.dtos.chat_response import ChatUsage
+from application.use_cases.chat_use_case import ChatUseCase
+from domain.entities.llm_response import LLMResponse
+from domain.entities.pii_token import PIIToken
+from domain.entities.usage import Usage
+from domain.enums.pii_type import PIIType
+from domain.services.anonymizer_service import AnonymizerService
+from domain.services.placeholder_numbering import StableNumbering
+
+
+class NameDetector:
+    def __init__(self, names):
+        self.names = names
+
+    def detect(self, text: str) -> List[PIIToken]:
+        tokens = []
+        for name in self.names:
+            start = text.find(name)
+            if start != -1:
+                tokens.append(PIIToken(PIIType.PERSON, name, "", start, start + len(name)))
+        return tokens
+
+
+NAMES = ("Jan Kowalski", "Anna Nowak", "Piotr Wiśniewski")
+
+
+def _stable_service(key=b"secret", digits=4):
+    return AnonymizerService([NameDetector(NAMES)], numbering=StableNumbering(key, digits))
+
+
+@pytest.mark.asyncio
+async def test_inserting_an_earlier_value_does_not_renumber_later_ones():
+    service = _stable_service()
+    before, _ = await service.anonymize_texts_async(["Jan Kowalski", "Anna Nowak"])
+    after, _ = await service.anonymize_texts_async(["Piotr Wiśniewski", "Jan Kowalski", "Anna Nowak"])
+
+    assert after[1:] == before
+
+
+@pytest.mark.asyncio
+async def test_sequential_numbering_is_the_default():
+    service = AnonymizerService([NameDetector(NAMES)])
+
+    texts, _ = await service.anonymize_texts_async(["Jan Kowalski", "Anna Nowak"])
+
+    assert texts == ["<PERSON1>", "<PERSON2>"]
+
+
+@pytest.mark.asyncio
+async def test_stable_numbers_roundtrip_through_deanonymize():
+    service = _stable_service()
+
+    texts, mapping = await service.anonymize_texts_async(["Jan Kowalski i Anna Nowak"])
+
+    assert service.deanonymize(texts[0], mapping) == "Jan Kowalski i Anna Nowak"
+
+
+def test_numbers_depend_on_key():
+    first, _ = _stable_service(b"one").anonymize("Jan Kowalski")
+    second, _ = _stable_service(b"two").anonymize("Jan Kowalski")
+
+    assert first != second
+
+
+def test_numbers_depend_on_scope():
+    service = _stable_service(digits=8)
+    numbers = {
+        scope: service.with_numbering_scope(*scope).anonymize("Jan Kowalski")[0]
+        for scope in [("client-a", "conv-1"), ("client-a", "conv-2"), ("client-b", "conv-1")]
+    }
+    again, _ = service.with_numbering_scope("client-a", "conv-1").anonymize("Jan Kowalski")
+
+    assert len(set(numbers.values())) == 3
+    assert again == numbers[("client-a", "conv-1")]
+
+
+def test_numbering_scope_follows_setting(monkeypatch):
+    monkeypatch.setattr(settings, "placeholder_numbering_scope", "conversation")
+    assert resolve_numbering_scope("client-a", "conv-1") == ("client-a", "conv-1")
+    assert resolve_numbering_scope("client-a", None) == ("client-a",)
+
+    monkeypatch.setattr(settings, "placeholder_numbering_scope", "client")
+    assert resolve_numbering_scope("client-a", "conv-1") == ("client-a",)
+
+    monkeypatch.setattr(settings, "placeholder_numbering_scope", "global")
+    assert resolve_numbering_scope("client-a", "conv-1") == ()
+    service = _stable_service()
+    assert service.with_numbering_scope() is service
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.received = []
+
+    async def chat(self, messages, model, **kwargs):
+        self.received.append(messages)
+        return LLMResponse(content="OK")
+
+
+@pytest.mark.asyncio
+async def test_stateless_turns_of_a_client_anonymize_identically(monkeypatch):
+    monkeypatch.setattr(settings, "placeholder_numbering_scope", "conversation")
+    llm = RecordingLLM()
+    use_case = ChatUseCase(_stable_service(digits=8), llm)
+    request = ChatRequest(messages=[ChatMessage(role="user", content="Jan Kowalski")])
+
+    await use_case.execute(request, "client-a")
+    await use_case.execute(request, "client-a")
+    await use_case.execute(request, "client-b")
+
+    assert llm.received[0] == llm.received[1]
+    assert llm.received[0] != llm.received[2]
+
+
+def test_collision_probes_to_the_next_free_number():
+    # With one digit there are 9 numbers, so collisions are easy to provoke.
+    service = _stable_service(digits=1)
+    value_to_token_str = {}
+    first, _ = service.anonymize("Jan Kowalski", {}, value_to_token_str)
+    collisions = {f"<PERSON{n}>" for n in range(1, 10)} - {first}
+    for n, token_str in enumerate(sorted(collisions)):
+        value_to_token_str[f"placeholder {n}"] = token_str
+    value_to_token_str.pop("Jan Kowalski")
+
+    second, _ = service.anonymize("Anna Nowak", {}, value_to_token_str)
+
+    assert second == first
+    assert len(set(value_to_token_str.values())) == len(value_to_token_str)
+
+
+def test_exhausted_range_falls_back_past_it():
+    numbering = StableNumbering(b"k", digits=1)
+
+    assert numbering.number("PERSON", "Jan", {"PERSON": 9}, lambda token_str: True) == 9 + 10
+
+
+def test_chat_usage_reports_cached_tokens_only_when_present():
+    assert ChatUsage.from_usage(Usage(100, 5, 105)).prompt_tokens_details is None
+    assert ChatUsage.from_usage(Usage(100, 5, 105, cached_tokens=64)).prompt_tokens_details.cached_tokens == 64
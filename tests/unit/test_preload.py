@@ -0,0 +1,45 @@
+import gc
+
+import pytest
+
+from api import preload
+from api.config.config import settings
+from api.di import detector_container
+
+
+class _WarmupRecorder:
+    def __init__(self):
+        self.texts = []
+
+    def detect(self, text):
+        self.texts.append(text)
+        return []
+
+
+@pytest.fixture
+def fake_detectors(monkeypatch):
+    detectors = {"get_pii_pl_detector": _WarmupRecorder(), "get_email_detector": _WarmupRecorder()}
+    for name in dir(detector_container):
+        if name.startswith("get_") and name.endswith("_detector"):
+            monkeypatch.setattr(detector_container, name, lambda: _WarmupRecorder())
+    for name, detector in detectors.items():
+        monkeypatch.setattr(detector_container, name, lambda d=detector: d)
+    yield detectors
+    gc.unfreeze()
+
+
+def test_preload_warms_up_every_detector_and_freezes_heap(monkeypatch, fake_detectors):
+    monkeypatch.setattr(settings, "pl_ner_server_socket", None)
+    gc.unfreeze()
+
+    preload.preload_detectors()
+
+    assert all(len(d.texts) == 1 for d in fake_detectors.values())
+    assert gc.get_freeze_count() > 0
+
+
+def test_preload_rejects_remote_ner(monkeypatch, fake_detectors):
+    monkeypatch.setattr(settings, "pl_ner_server_socket", "/tmp/ner.sock")
+
+    with pytest.raises(ValueError, match="PL_NER_SERVER_SOCKET"):
+        preload.preload_detectors()
@@ -0,0 +1,89 @@
+import random
+import struct
+
+from domain.entities.pii_token import PIIToken
+from domain.entities.span_set import SpanSet
+from domain.enums.pii_type import PIIType
+from domain.services.anonymizer_service import AnonymizerService
+from domain.services.token_overlap import remove_overlapping_tokens
+
+TEXT = "x" * 1000
+
+
+def _random_tokens(rng: random.Random, count: int):
+    types = list(PIIType)
+    tokens = []
+    for _ in range(count):
+        start = rng.randrange(0, 950)
+        end = start + rng.randrange(1, 40)
+        tokens.append(PIIToken(rng.choice(types), TEXT[start:end], "", start, end))
+    return tokens
+
+
+def _key(tokens):
+    return [(t.start, t.end, t.type) for t in tokens]
+
+
+class TestSpanSet:
+    def test_resolve_overlaps_matches_token_resolution(self):
+        rng = random.Random(0)
+        for trial in range(300):
+            tokens = _random_tokens(rng, rng.randrange(0, 80 if trial % 2 else 5))
+            expected = remove_overlapping_tokens(tokens)
+
+            resolved = SpanSet.from_tokens(tokens).resolve_overlaps()
+
+            assert resolved.spans() == _key(expected)
+
+    def test_ties_go_to_the_earlier_span(self):
+        spans = SpanSet.from_spans([(0, 5, PIIType.PHONE), (0, 5, PIIType.PESEL), (6, 8, PIIType.DATE)])
+
+        assert spans.resolve_overlaps().spans() == [(0, 5, PIIType.PHONE), (6, 8, PIIType.DATE)]
+
+    def test_outside_drops_spans_touching_a_protected_span(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            spans = SpanSet.from_tokens(_random_tokens(rng, 40))
+            protected, position = [], 0
+            while position < 950:
+                position += rng.randrange(1, 80)
+                length = rng.randrange(1, 15)
+                protected.append((position, position + length))
+                position += length
+            expected = [
+                span for span in spans.spans()
+                if not any(span[0] < end and span[1] > start for start, end in protected)
+            ]
+
+            assert spans.outside(protected).spans() == expected
+
+    def test_concat_keeps_order_and_to_tokens_copies_the_text(self):
+        text = "Jan Kowalski, Kraków"
+        spans = SpanSet.concat([
+            SpanSet.from_spans([(0, 12, PIIType.PERSON)]),
+            SpanSet.from_spans([(14, 20, PIIType.LOCATION)]),
+        ])
+
+        assert spans.to_tokens(text) == [
+            PIIToken(PIIType.PERSON, "Jan Kowalski", "", 0, 12),
+            PIIToken(PIIType.LOCATION, "Kraków", "", 14, 20),
+        ]
+
+    def test_bytes_are_the_detection_cache_records(self):
+        tokens = _random_tokens(random.Random(2), 30)
+        spans = SpanSet.from_tokens(tokens)
+
+        assert spans.to_bytes() == b"".join(struct.pack("!IIB", t.start, t.end, t.type.value) for t in tokens)
+        assert SpanSet.from_bytes(spans.to_bytes()).spans() == spans.spans()
+
+    def test_service_uses_a_detectors_own_spans(self):
+        class ColumnarDetector:
+            def detect(self, text):
+                raise AssertionError("detect_spans_batch should be used")
+
+            def detect_spans_batch(self, texts):
+                return [SpanSet.from_spans([(0, 3, PIIType.PERSON), (0, 7, PIIType.PERSON)]) for _ in texts]
+
+        service = AnonymizerService([ColumnarDetector()])
+
+        assert service.anonymize("Jan Nowak pisze")[0] == "<PERSON1>ak pisze"
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.middleware.error_handler import GlobalErrorHandlerMiddleware
+from domain.exceptions.workload_overloaded_error import WorkloadOverloadedError
+from domain.services.anonymizer_service import AnonymizerService
+from domain.services.workload_pool import WorkloadPool, set_workload
+
+
+async def _as(priority_class, client, pool, fn, *args, cost=1.0):
+    """Submits from a task of its own, so the workload tag stays there."""
+    set_workload(priority_class, client)
+    return await pool.run(fn, *args, cost=cost)
+
+
+async def _blocked(pool):
+    """Occupies the pool's only worker until the returned event is set."""
+    release = threading.Event()
+    running = asyncio.ensure_future(pool.run(release.wait))
+    await asyncio.sleep(0.05)
+    return release, running
+
+
+class TestWorkloadPool:
+    @pytest.mark.asyncio
+    async def test_runs_tasks_on_its_own_threads_and_records_waits(self):
+        pool = WorkloadPool("ner", 2, 8, 5.0)
+
+        names = await asyncio.gather(*(pool.run(lambda: threading.current_thread().name) for _ in range(4)))
+
+        assert all(name.startswith("ner-pool") for name in names)
+        stats = pool.stats()
+        assert stats["completed"] == 4 and stats["rejected"] == 0
+        assert stats["queued"] == 0 and stats["running"] == 0
+        assert stats["wait"]["count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_the_queue_is_full(self):
+        pool = WorkloadPool("document", 1, 1, 60.0)
+        release = threading.Event()
+        running = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(pool.run(lambda: "queued"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(WorkloadOverloadedError) as rejected:
+            await pool.run(lambda: "rejected")
+
+        assert rejected.value.status_code == 503
+        assert rejected.value.retry_after_seconds >= 1
+        release.set()
+        assert await queued == "queued"
+        await running
+        assert pool.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_the_expected_wait_exceeds_the_budget(self):
+        pool = WorkloadPool("ner", 1, 100, 0.15)
+        await pool.run(time.sleep, 0.1)
+        release = threading.Event()
+        running = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        # One task ahead: 0.1 s expected wait, within budget.
+        first = asyncio.ensure_future(pool.run(lambda: "first"))
+        await asyncio.sleep(0)
+        # Two ahead: 0.2 s.
+        with pytest.raises(WorkloadOverloadedError):
+            await pool.run(lambda: "second")
+
+        release.set()
+        assert await first == "first"
+        await running
+
+    @pytest.mark.asyncio
+    async def test_anonymizer_offloads_to_its_pool(self):
+        pool = WorkloadPool("ner", 1, 8, 5.0)
+        service = AnonymizerService([], pool=pool)
+
+        await service.anonymize_texts_async(["Ala ma kota."])
+        await service.deanonymize_async("Ala ma kota.", {})
+
+        assert pool.stats()["completed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_detectors_fan_out_to_a_pool(self):
+        fast = WorkloadPool("fast", 2, 8, 5.0)
+        threads = []
+
+        class RecordingDetector:
+            def detect(self, text):
+                threads.append(threading.current_thread().name)
+                return []
+
+        service = AnonymizerService([RecordingDetector(), RecordingDetector()], executor=fast)
+
+        await service.anonymize_texts_async(["Ala ma kota."])
+
+        assert sum(name.startswith("fast-pool") for name in threads) == 1
+        assert fast.stats()["completed"] == 1
+
+
+class TestWorkloadScheduling:
+    @pytest.mark.asyncio
+    async def test_higher_priority_classes_run_first(self):
+        pool = WorkloadPool("ner", 1, 100, 60.0)
+        release, running = await _blocked(pool)
+        order = []
+        queued = []
+        for priority_class in ("document", "text", "stream", "chat"):
+            queued.append(asyncio.ensure_future(_as(priority_class, "a", pool, order.append, priority_class)))
+            await asyncio.sleep(0.01)
+
+        release.set()
+        await asyncio.gather(running, *queued)
+
+        assert order == ["stream", "chat", "text", "document"]
+
+    @pytest.mark.asyncio
+    async def test_clients_share_a_class_fairly_by_weight(self):
+        pool = WorkloadPool("ner", 1, 100, 60.0, client_weights={"heavy": 2.0})
+        release, running = await _blocked(pool)
+        order = []
+        queued = []
+        # "bulk" queues a backlog before the others arrive.
+        for client in ["bulk"] * 6 + ["heavy"] * 4 + ["light"] * 2:
+            queued.append(asyncio.ensure_future(_as("text", client, pool, order.append, client)))
+            await asyncio.sleep(0.005)
+
+        release.set()
+        await asyncio.gather(running, *queued)
+
+        # Finish tags: bulk 1, 2, 3...; heavy 0.5, 1, 1.5, 2; light 1, 2.
+        assert order[:8] == ["heavy", "bulk", "heavy", "light", "heavy", "bulk", "heavy", "light"]
+        assert order[8:] == ["bulk"] * 4
+        stats = pool.stats()
+        assert set(stats["clients"]) == {"anonymous", "bulk", "heavy", "light"}
+        assert stats["classes"]["text"]["wait"]["count"] == 12
+
+    @pytest.mark.asyncio
+    async def test_synchronous_calls_from_other_threads_queue_under_their_request(self):
+        detection = WorkloadPool("ner", 1, 100, 60.0)
+        documents = WorkloadPool("document", 1, 4, 60.0)
+        service = AnonymizerService([], pool=detection)
+
+        await _as("document", "bulk", documents, service.anonymize_batch, ["Strona 1.", "Strona 2."])
+
+        stats = detection.stats()
+        assert stats["completed"] == 1
+        assert stats["classes"]["document"]["wait"]["count"] == 1
+        assert stats["clients"]["bulk"]["count"] == 1
+
+
+def test_overloaded_requests_get_503_with_retry_after():
+    app = FastAPI()
+    app.add_middleware(GlobalErrorHandlerMiddleware)
+
+    @app.get("/busy")
+    async def busy():
+        raise WorkloadOverloadedError("The ner workload is over capacity, retry later", retry_after_seconds=7)
+
+    response = TestClient(app).get("/busy")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+    assert response.json()["error"]["message"] == "The ner workload is over capacity, retry later"